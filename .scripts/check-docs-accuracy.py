@@ -5,31 +5,58 @@ Documentation Accuracy Validator
 
 Checks documentation files for common accuracy issues:
 - Broken internal markdown links (file references that don't resolve)
+- Broken heading anchors in links to markdown files (including same-file #anchors)
 - References to non-existent Taskfile tasks
 - References to non-existent workflow files
 - Stale project descriptions (single-file vs multi-file, wrong tool names)
 
-Generates a JSON report at .docs-reports/docs-accuracy-report.json.
+Generates a JSON report at .docs-reports/docs-accuracy-report.json, or
+with --format jsonl streams issues to .docs-reports/docs-accuracy-report.jsonl
+as they are found.
+
+Per-file results are cached in .docs-reports/docs-accuracy-cache.json,
+keyed by each file's content hash and a fingerprint of the project-wide
+inputs (Taskfile tasks, workflow files, existing paths and this script).
+Task names come from the shared TaskfileIndex, which follows includes and
+aliases and is itself cached in .docs-reports/taskfile-index.json.
+Entries also record the anchor sets of every page they link to with a
+#fragment, and are rescanned when one of those pages' headings change.
+Existing paths come from a single in-memory PathIndex, so link and file
+reference checks never stat the filesystem per match.
+Pass --no-cache to rescan every file, and --jobs N to analyze files
+across N processes.
+
+With --changed-since REF only docs changed since REF are checked, plus
+any doc that links to a file renamed or deleted since then. Those are
+found through the link graph persisted in .docs-reports/docs-link-graph.json.
+
+With --watch the indexes stay in memory and each save re-validates the
+changed docs and the docs linking to them; see docs_watch.py.
 """
 
+import argparse
+import hashlib
 import json
 import os
 import re
-import subprocess
 import sys
 from pathlib import Path
+from urllib.parse import unquote
+
+from docs_anchors import AnchorIndex, is_markdown
+from docs_corpus import DocsCorpus
+from docs_lines import LineIndex
+from docs_watch import DEFAULT_INTERVAL, PollingWatcher, watch
+from jsonl_report import JsonlReportWriter
+from path_index import PathIndex
+from taskfile_index import load_task_index
 
 
 # ── Helpers ──────────────────────────────────────────────────────────
 
-def get_taskfile_tasks():
-    """Extract declared task names from Taskfile.yml."""
-    taskfile = Path("Taskfile.yml")
-    if not taskfile.exists():
-        return set()
-    content = taskfile.read_text()
-    # Match top-level task keys (2-space indent, name ending with colon)
-    return {m.group(1) for m in re.finditer(r"^  ([a-z][a-z0-9:_-]+):", content, re.MULTILINE)}
+def get_taskfile_tasks(index=None):
+    """Return every task name Taskfile.yml accepts, including included and aliased tasks."""
+    return (index or load_task_index()).names()
 
 
 def get_workflow_files():
@@ -40,26 +67,381 @@ def get_workflow_files():
     return {f.name for f in wf_dir.iterdir() if f.is_file()}
 
 
-def get_project_files():
-    """List all files in the repo root (non-hidden, depth 1) plus key paths."""
-    root = Path(".")
-    files = set()
-    for entry in root.iterdir():
-        if entry.name.startswith("."):
+# ── Check registry ───────────────────────────────────────────────────
+
+CHECKS = []
+
+
+def register_check(func):
+    """Register a per-file check with the analysis engine.
+
+    A check is called as ``func(md_path, content, lines, context)`` where
+    *content* is the already-read file text, *lines* is its ``LineIndex``
+    and *context* is the dict built by ``build_context()``. It must return
+    a list of issue dicts.
+    """
+    CHECKS.append(func)
+    return func
+
+
+def build_context(paths_from_git=False):
+    """Collect the project-wide inputs shared by every check."""
+    taskfiles = load_task_index()
+    docs = DocsCorpus.shared()
+    return {
+        "tasks": get_taskfile_tasks(taskfiles),
+        "taskfiles": sorted(taskfiles.sources),
+        "workflows": get_workflow_files(),
+        "paths": PathIndex.from_git() if paths_from_git else PathIndex.scan(corpus=docs),
+        "docs": docs,
+        "anchors": AnchorIndex(read=docs.read_text),
+        "links": LinkGraph(),
+    }
+
+
+def analyze_content(md_path, content, context, checks=None):
+    """Run every registered check over the already-read *content*."""
+    lines = LineIndex(content)
+    issues = []
+    for check in CHECKS if checks is None else checks:
+        issues.extend(check(md_path, content, lines, context))
+    return issues
+
+
+def analyze_file(md_path, context, checks=None):
+    """Read *md_path* once and run every registered check over its content."""
+    return analyze_content(md_path, md_path.read_text(), context, checks)
+
+
+def analyze_with_deps(md_path, content, context):
+    """Run every check and report what the file depends on.
+
+    Returns ``(issues, deps, links)``. *deps* maps each linked markdown
+    file to the digest of its anchor set, so cached results can be
+    invalidated when a linked page's headings change. *links* lists every
+    repo path the file links to, for the link graph.
+    """
+    anchors = context["anchors"]
+    anchors.track()
+    context["links"].track()
+    issues = analyze_content(md_path, content, context)
+    own_key = context["paths"].resolve(str(md_path))
+    deps = {key: anchors.digest(key) for key in sorted(anchors.accessed()) if key != own_key}
+    return issues, deps, sorted(context["links"].accessed())
+
+
+def deps_unchanged(deps, context):
+    """Return True if every linked file still has the recorded anchor set."""
+    anchors = context["anchors"]
+    return all(anchors.digest(key) == digest for key, digest in deps.items())
+
+
+# ── Link graph ───────────────────────────────────────────────────────
+
+LINK_GRAPH_PATH = Path(".docs-reports/docs-link-graph.json")
+
+
+class LinkGraph:
+    """Which repo paths each doc links to, and the reverse.
+
+    Persisted to .docs-reports/docs-link-graph.json and updated with every
+    file a run analyzes, so ``--changed-since`` can find the documents
+    that link to a renamed or deleted file without rescanning the tree.
+    """
+
+    def __init__(self, links=None):
+        self.links = dict(links or {})
+        self._reverse = None
+        self._recording = None
+
+    @classmethod
+    def load(cls, path=LINK_GRAPH_PATH):
+        """Load the persisted graph, or return None if there is none."""
+        try:
+            data = json.loads(Path(path).read_text())
+        except (OSError, ValueError):
+            return None
+        links = data.get("links") if isinstance(data, dict) else None
+        return cls(links) if isinstance(links, dict) else None
+
+    def save(self, path=LINK_GRAPH_PATH):
+        path = Path(path)
+        path.parent.mkdir(exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"links": dict(sorted(self.links.items()))}))
+        os.replace(tmp_path, path)
+
+    def track(self):
+        """Start recording link targets for one document."""
+        self._recording = set()
+
+    def record(self, target):
+        if self._recording is not None:
+            self._recording.add(target)
+
+    def accessed(self):
+        """Stop recording and return the targets recorded since ``track()``."""
+        recorded, self._recording = self._recording or set(), None
+        return recorded
+
+    def update(self, source, targets):
+        """Replace the outgoing links of *source*."""
+        self.links[source] = list(targets)
+        self._reverse = None
+
+    def remove(self, source):
+        if self.links.pop(source, None) is not None:
+            self._reverse = None
+
+    def linkers(self, targets):
+        """Return every document linking to one of *targets*."""
+        if self._reverse is None:
+            self._reverse = {}
+            for source, outgoing in self.links.items():
+                for target in outgoing:
+                    self._reverse.setdefault(target, set()).add(source)
+        found = set()
+        for target in targets:
+            found |= self._reverse.get(target, set())
+        return found
+
+
+# ── Cache ────────────────────────────────────────────────────────────
+
+CACHE_PATH = Path(".docs-reports/docs-accuracy-cache.json")
+CACHE_VERSION = 1
+# Imported modules whose code decides a file's issues, hashed with this script.
+CHECK_MODULES = ("docs_anchors", "docs_corpus", "docs_lines", "path_index")
+
+
+def content_hash(content):
+    """Return the hex digest used to key a file's cached issues."""
+    return hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def context_fingerprint(context):
+    """Hash every project-wide input that can change a file's issues."""
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_VERSION}\0".encode())
+    digest.update(Path(__file__).read_bytes())
+    for name in CHECK_MODULES:
+        digest.update(Path(sys.modules[name].__file__).read_bytes())
+    inputs = {
+        "tasks": context["tasks"],
+        "workflows": context["workflows"],
+        "paths": context["paths"].paths(),
+    }
+    for key, values in inputs.items():
+        digest.update(f"\0{key}\0".encode())
+        digest.update("\n".join(sorted(values)).encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+def load_cache(fingerprint):
+    """Return cached ``{path: {"hash", "issues"}}`` entries valid for *fingerprint*."""
+    try:
+        data = json.loads(CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def save_cache(fingerprint, files):
+    """Atomically replace the cache with *files*, evicting everything else."""
+    CACHE_PATH.parent.mkdir(exist_ok=True)
+    tmp_path = CACHE_PATH.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps({"fingerprint": fingerprint, "files": files}))
+    os.replace(tmp_path, CACHE_PATH)
+
+
+def analyze_parallel(items, context, jobs):
+    """Analyze ``(md_path, content)`` pairs across *jobs* processes.
+
+    Yields one ``(issues, deps, links)`` tuple per item as results arrive,
+    in the order of *items*, so reports stay identical to a serial run.
+    The workers run the entry points in docs_accuracy_worker.py, which they
+    can import whichever start method the platform uses.
+    """
+    if not items:
+        return
+    from concurrent.futures import ProcessPoolExecutor  # slow to import; only needed with --jobs
+
+    import docs_accuracy_worker
+
+    chunksize = max(1, len(items) // (jobs * 4))
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=docs_accuracy_worker.init_worker,
+        initargs=(docs_accuracy_worker.worker_context(context),),
+    ) as pool:
+        yield from pool.map(docs_accuracy_worker.analyze, items, chunksize=chunksize)
+
+
+def _cached_entry(cached, md_file, digest, context):
+    entry = cached.get(str(md_file))
+    if (
+        entry is not None
+        and entry.get("hash") == digest
+        and deps_unchanged(entry.get("deps", {}), context)
+    ):
+        return entry
+    return None
+
+
+def _read_doc(md_file, context):
+    docs = context.get("docs")
+    return docs.read_text(md_file) if docs is not None else md_file.read_text()
+
+
+def _iter_entries(md_files, context, cached, jobs, stats):
+    """Yield ``(md_file, entry)`` in *md_files* order, analyzing cache misses."""
+    if jobs <= 1:
+        for md_file in md_files:
+            content = _read_doc(md_file, context)
+            digest = content_hash(content)
+            entry = _cached_entry(cached, md_file, digest, context)
+            if entry is not None:
+                stats["cache_hits"] += 1
+            else:
+                issues, deps, links = analyze_with_deps(md_file, content, context)
+                entry = {"hash": digest, "issues": issues, "deps": deps, "links": links}
+            yield md_file, entry
+        return
+
+    plan = []
+    pending = []
+    for md_file in md_files:
+        content = _read_doc(md_file, context)
+        digest = content_hash(content)
+        entry = _cached_entry(cached, md_file, digest, context)
+        if entry is not None:
+            stats["cache_hits"] += 1
+        else:
+            pending.append((md_file, content))
+        plan.append((md_file, digest, entry))
+
+    results = analyze_parallel(pending, context, jobs)
+    for md_file, digest, entry in plan:
+        if entry is None:
+            issues, deps, links = next(results)
+            entry = {"hash": digest, "issues": issues, "deps": deps, "links": links}
+        yield md_file, entry
+
+
+def iter_scan(md_files, context, use_cache=True, jobs=1, partial=False, stats=None):
+    """Yield every issue for *md_files*, file by file, as soon as it is known.
+
+    Cached results are reused when valid. Files that miss the cache are
+    analyzed inline, or across a process pool when *jobs* > 1; either way
+    issues come out in *md_files* order. Each file's outgoing links are
+    written to ``context["links"]``. When *partial* is set, *md_files* is
+    a subset of the docs tree and cache entries for other files are kept.
+
+    Without the cache, nothing is retained per file, so memory stays flat
+    however many issues are found. The number of cache hits is stored in
+    ``stats["cache_hits"]``.
+    """
+    stats = {} if stats is None else stats
+    stats["cache_hits"] = 0
+    fingerprint = context_fingerprint(context) if use_cache else None
+    cached = load_cache(fingerprint) if use_cache else {}
+    fresh = {}
+
+    for md_file, entry in _iter_entries(md_files, context, cached, jobs, stats):
+        context["links"].update(str(md_file), entry["links"])
+        if use_cache:
+            fresh[str(md_file)] = entry
+        yield from entry["issues"]
+
+    if use_cache:
+        if partial:
+            kept = {k: v for k, v in cached.items() if k not in fresh and Path(k).is_file()}
+            fresh = {**kept, **fresh}
+        save_cache(fingerprint, fresh)
+
+
+def scan_docs(md_files, context, use_cache=True, jobs=1, partial=False):
+    """Return ``(issues, cache_hits)`` for *md_files*; see ``iter_scan()``."""
+    stats = {}
+    issues = list(iter_scan(md_files, context, use_cache, jobs, partial, stats))
+    return issues, stats["cache_hits"]
+
+
+# ── Reference scanner ────────────────────────────────────────────────
+
+REFERENCES = {}
+_scanner_cache = {}
+
+
+def register_reference(name, pattern, triggers):
+    """Register a validator for one kind of in-document reference.
+
+    *pattern* matches a single reference; *triggers* lists every character
+    a match can start with. All registered patterns are combined into one
+    scanner (see ``reference_scanner()``), so adding a reference type does
+    not add another pass over the document.
+
+    The validator is called as ``func(md_path, m, content, lines, context)``
+    with *m* matched by *pattern* alone, and returns an issue dict or None.
+    """
+    def decorator(func):
+        REFERENCES[name] = (re.compile(pattern), triggers, func)
+        _scanner_cache.clear()
+        return func
+    return decorator
+
+
+def reference_scanner():
+    """Compile the registered patterns into one left-to-right scanner.
+
+    Each pattern sits in a lookahead under a named group, so the scanner
+    consumes nothing and references that overlap (a workflow path inside
+    backticks, a filename inside link text) are all found. A character
+    class of trigger characters in front lets the regex engine skip
+    quickly to candidate positions.
+    """
+    if "scanner" not in _scanner_cache:
+        triggers = "".join(sorted({c for _, t, _ in REFERENCES.values() for c in t}))
+        branches = "|".join(
+            f"(?=(?P<{name}>{pattern.pattern}))"
+            for name, (pattern, _, _) in REFERENCES.items()
+        )
+        _scanner_cache["scanner"] = re.compile(f"(?=[{re.escape(triggers)}])(?:{branches})")
+    return _scanner_cache["scanner"]
+
+
+def scan_references(content):
+    """Yield ``(name, match)`` for every registered reference in *content*.
+
+    Matches of one type never overlap each other, exactly as a separate
+    ``finditer`` pass per pattern would report them.
+    """
+    last_end = {}
+    for hit in reference_scanner().finditer(content):
+        name = hit.lastgroup
+        start = hit.start()
+        if start < last_end.get(name, 0):
             continue
-        if entry.is_file():
-            files.add(entry.name)
-        elif entry.is_dir():
-            files.add(entry.name + "/")
-    # Also index docs tree
-    for p in Path("docs").rglob("*"):
-        files.add(str(p))
-    # And .github tree
-    gh = Path(".github")
-    if gh.exists():
-        for p in gh.rglob("*"):
-            files.add(str(p))
-    return files
+        m = REFERENCES[name][0].match(content, start)
+        last_end[name] = m.end()
+        yield name, m
+
+
+@register_check
+def check_references(md_path, content, lines, context):
+    """Validate every registered reference type in a single scan.
+
+    Issues are grouped by reference type in registration order.
+    """
+    found = {name: [] for name in REFERENCES}
+    for name, m in scan_references(content):
+        issue = REFERENCES[name][2](md_path, m, content, lines, context)
+        if issue:
+            found[name].append(issue)
+    return [issue for issues in found.values() for issue in issues]
 
 
 # ── Checks ───────────────────────────────────────────────────────────
@@ -71,175 +453,474 @@ _GITHUB_WEB_PATH_SEGMENTS = frozenset({
 })
 
 
-def check_broken_links(md_path, project_files):
-    """Find markdown links whose target file does not exist on disk."""
-    issues = []
-    content = md_path.read_text()
-    base = md_path.parent
-
-    # Match [text](target) — skip http(s), mailto, and anchors-only
-    for m in re.finditer(r'\[([^\]]*)\]\(([^)]+)\)', content):
-        display, target = m.group(1), m.group(2)
-        # skip external / anchor-only / mermaid
-        if target.startswith(("http://", "https://", "mailto:", "#")):
-            continue
-        # strip query string and anchor fragment (query strings are never file paths)
-        target_path = target.split("?")[0].split("#")[0]
-        if not target_path:
-            continue
-        # skip relative links targeting GitHub web interface paths
-        # (e.g. ../../issues/new, ../../discussions/new)
-        if any(part in _GITHUB_WEB_PATH_SEGMENTS for part in Path(target_path).parts):
-            continue
-        resolved = (base / target_path).resolve()
-        if not resolved.exists():
-            line_no = content[:m.start()].count("\n") + 1
-            issues.append({
-                "type": "broken_link",
-                "file": str(md_path),
-                "line": line_no,
-                "message": f"Broken link: [{display}]({target}) — target does not exist",
-            })
-    return issues
+_LINE_ANCHOR = re.compile(r"L\d+(?:-L\d+)?")
+
+
+def _check_anchor(md_path, m, content, lines, context, target_key):
+    """Flag a link whose #fragment matches no heading in the target file.
 
+    *target_key* is the repo-relative path of the linked markdown file, or
+    None for a same-file ``#anchor`` link. Heading slugs are matched
+    case-insensitively and HTML ``id``/``name`` anchors exactly, as GitHub
+    does.
+    """
+    display, target = m.group(1), m.group(2)
+    fragment = unquote(target.partition("#")[2])
+    if not fragment or _LINE_ANCHOR.fullmatch(fragment.upper()):
+        return None
+    if target_key is None:
+        target_key = context["paths"].resolve(str(md_path))
+        anchors = context["anchors"].slugs(target_key, content)
+        where = "this file"
+    else:
+        anchors = context["anchors"].slugs(target_key)
+        where = target_key
+    if anchors is None:
+        return None
+    slugs, ids = anchors
+    if fragment.lower() in slugs or fragment in ids:
+        return None
+    return {
+        "type": "broken_anchor",
+        "file": str(md_path),
+        "line": lines.line_of(m.start()),
+        "message": f"Broken anchor: [{display}]({target}) — no heading `#{fragment}` in {where}",
+    }
 
-def check_task_references(md_path, valid_tasks):
-    """Find `task <name>` references that don't match a real Taskfile task.
+
+# Match [text](target)
+@register_reference("link", r'\[([^\]]*)\]\(([^)]+)\)', "[")
+def check_broken_link(md_path, m, content, lines, context):
+    """Flag a markdown link whose target file or heading anchor does not exist."""
+    display, target = m.group(1), m.group(2)
+    # skip external / mermaid
+    if target.startswith(("http://", "https://", "mailto:")):
+        return None
+    if target.startswith("#"):
+        return _check_anchor(md_path, m, content, lines, context, None)
+    # strip query string and anchor fragment (query strings are never file paths)
+    target_path = target.split("?")[0].split("#")[0]
+    if not target_path:
+        return None
+    # skip relative links targeting GitHub web interface paths
+    # (e.g. ../../issues/new, ../../discussions/new)
+    if any(part in _GITHUB_WEB_PATH_SEGMENTS for part in Path(target_path).parts):
+        return None
+    paths = context["paths"]
+    target_file = str(md_path.parent / target_path)
+    target_key = paths.resolve(target_file)
+    # Only a full run builds the link graph; a context without one skips recording.
+    links = context.get("links")
+    if target_key is not None and links is not None:
+        links.record(target_key)
+    if paths.exists(target_file):
+        if "#" in target and target_key in paths.files and is_markdown(target_key):
+            return _check_anchor(md_path, m, content, lines, context, target_key)
+        return None
+    return {
+        "type": "broken_link",
+        "file": str(md_path),
+        "line": lines.line_of(m.start()),
+        "message": f"Broken link: [{display}]({target}) — target does not exist",
+    }
+
+
+# Match `task <namespaced-name>` — require a colon to distinguish real
+# task invocations from English prose containing the word "task".
+@register_reference("task", r'(?<!\S)task\s+([a-z][a-z0-9_-]*:[a-z0-9:_-]+)', "t")
+def check_task_reference(md_path, m, content, lines, context):
+    """Flag a `task <name>` reference that doesn't match a real Taskfile task.
 
     Only checks namespaced tasks (containing ':') to avoid false positives
     from prose like 'task runner' or 'task to'.
     """
-    issues = []
-    content = md_path.read_text()
-    # Match `task <namespaced-name>` — require a colon to distinguish real
-    # task invocations from English prose containing the word "task".
-    for m in re.finditer(r'(?:^|\s)task\s+([a-z][a-z0-9_-]*:[a-z0-9:_-]+)', content):
-        task_name = m.group(1)
-        if task_name not in valid_tasks:
-            line_no = content[:m.start()].count("\n") + 1
-            issues.append({
-                "type": "stale_task_ref",
-                "file": str(md_path),
-                "line": line_no,
-                "message": f"Task reference `task {task_name}` not found in Taskfile.yml",
-            })
-    return issues
+    task_name = m.group(1)
+    if task_name in context["tasks"]:
+        return None
+    return {
+        "type": "stale_task_ref",
+        "file": str(md_path),
+        "line": lines.line_of(m.start()),
+        "message": f"Task reference `task {task_name}` not found in Taskfile.yml",
+    }
 
 
-def check_workflow_references(md_path, valid_workflows):
-    """Find .yml workflow file references that don't exist."""
-    issues = []
-    content = md_path.read_text()
-    # Match .github/workflows/<name>.yml references
-    for m in re.finditer(r'\.github/workflows/([a-z0-9_-]+\.yml)', content):
-        wf_name = m.group(1)
-        if wf_name not in valid_workflows:
-            line_no = content[:m.start()].count("\n") + 1
-            issues.append({
-                "type": "stale_workflow_ref",
-                "file": str(md_path),
-                "line": line_no,
-                "message": f"Workflow reference `.github/workflows/{wf_name}` does not exist",
-            })
-    return issues
+# Match .github/workflows/<name>.yml references
+@register_reference("workflow", r'\.github/workflows/([a-z0-9_-]+\.yml)', ".")
+def check_workflow_reference(md_path, m, content, lines, context):
+    """Flag a .yml workflow file reference that doesn't exist."""
+    wf_name = m.group(1)
+    if wf_name in context["workflows"]:
+        return None
+    return {
+        "type": "stale_workflow_ref",
+        "file": str(md_path),
+        "line": lines.line_of(m.start()),
+        "message": f"Workflow reference `.github/workflows/{wf_name}` does not exist",
+    }
 
 
 _TRACKED_EXTENSIONS = frozenset(
     (".html", ".js", ".css", ".json", ".yml", ".yaml", ".toml", ".py", ".sh", ".md")
 )
 
+# Phrases that indicate the file is an example / suggestion, or a generated
+# runtime artifact rather than a real tracked reference
+_SUGGESTION_CTX = re.compile(
+    r'(split into|could create|create a|for example|e\.g\.|such as|'
+    r'examples?:|add\b.*\bhere|when.*needed|naming|format|add a\b|generat\w*)',
+    re.IGNORECASE,
+)
+
 
-def _should_skip_ref(ref, ext, base, content, m, suggestion_ctx):
+def _should_skip_ref(ref, ext, base, content, m, paths):
     """Return True if this file reference should be skipped."""
     if ref.startswith(("http", "mailto")):
         return True
     if ext not in _TRACKED_EXTENSIONS:
         return True
-    if Path(ref).exists() or (base / ref).exists():
+    if paths.exists(ref) or paths.exists(str(base / ref)):
         return True
     if any(sub in ref for sub in ("example", "your-", "<", "YYYY")):
         return True
     start = max(0, m.start() - 250)
     end = min(len(content), m.end() + 250)
-    if suggestion_ctx.search(content[start:end]):
+    if _SUGGESTION_CTX.search(content[start:end]):
         return True
     if ext in (".yml", ".yaml") and "/" not in ref:
         return True
     return False
 
 
-def check_source_file_references(md_path, project_files):
-    """Find references to source files in prose that no longer exist.
+# Match backtick-quoted filenames that look like project paths
+@register_reference("file", r'`([a-zA-Z0-9_./-]+\.[a-z]{1,4})`', "`")
+def check_source_file_reference(md_path, m, content, lines, context):
+    """Flag a reference to a source file in prose that no longer exists.
 
-    Looks for backtick-quoted filenames that look like project paths.
     Skips references that appear to be examples, suggestions, or patterns.
     """
-    issues = []
-    content = md_path.read_text()
-    base = md_path.parent
-
-    # Phrases that indicate the file is an example / suggestion, or a generated
-    # runtime artifact rather than a real tracked reference
-    suggestion_ctx = re.compile(
-        r'(split into|could create|create a|for example|e\.g\.|such as|'
-        r'examples?:|add\b.*\bhere|when.*needed|naming|format|add a\b|generat\w*)',
-        re.IGNORECASE,
-    )
-
-    for m in re.finditer(r'`([a-zA-Z0-9_./-]+\.[a-z]{1,4})`', content):
-        ref = m.group(1)
-        ext = Path(ref).suffix
-        if _should_skip_ref(ref, ext, base, content, m, suggestion_ctx):
-            continue
-        line_no = content[:m.start()].count("\n") + 1
-        issues.append({
-            "type": "stale_file_ref",
-            "file": str(md_path),
-            "line": line_no,
-            "message": f"Possible stale file reference: `{ref}` not found on disk",
-        })
-    return issues
+    ref = m.group(1)
+    ext = Path(ref).suffix
+    if _should_skip_ref(ref, ext, md_path.parent, content, m, context["paths"]):
+        return None
+    return {
+        "type": "stale_file_ref",
+        "file": str(md_path),
+        "line": lines.line_of(m.start()),
+        "message": f"Possible stale file reference: `{ref}` not found on disk",
+    }
 
 
-# ── Main ─────────────────────────────────────────────────────────────
+# ── Changed-since scope ──────────────────────────────────────────────
 
-def main():
-    print("🔍 Checking documentation accuracy…")
-
-    valid_tasks = get_taskfile_tasks()
-    valid_workflows = get_workflow_files()
-    project_files = get_project_files()
+# Changes to these invalidate every document, so force a full scan.
+_GLOBAL_INPUTS = (".github/workflows/",)
 
-    docs_path = Path("docs")
-    if not docs_path.is_dir():
-        print("❌ docs/ directory not found")
-        sys.exit(1)
 
-    all_issues = []
+def git_changes(ref):
+    """Return ``(changed, removed)`` repo paths between *ref* and the working tree.
 
-    for md_file in sorted(docs_path.rglob("*.md")):
-        all_issues.extend(check_broken_links(md_file, project_files))
-        all_issues.extend(check_task_references(md_file, valid_tasks))
-        all_issues.extend(check_workflow_references(md_file, valid_workflows))
-        all_issues.extend(check_source_file_references(md_file, project_files))
+    Diffs from the merge base of *ref* and HEAD, so a PR branch is compared
+    with the point it forked from. Renames count as a removal of the old
+    path plus a change to the new one. Untracked files count as changed.
+    """
+    import subprocess  # only --changed-since runs git
+
+    base = subprocess.run(
+        ["git", "merge-base", ref, "HEAD"], capture_output=True, text=True, check=True,
+    ).stdout.strip()
+    diff = subprocess.run(
+        ["git", "diff", "--name-status", "-z", "-M", base],
+        capture_output=True, text=True, check=True,
+    ).stdout.split("\0")
+    untracked = subprocess.run(
+        ["git", "ls-files", "-z", "--others", "--exclude-standard"],
+        capture_output=True, text=True, check=True,
+    ).stdout.split("\0")
+
+    changed, removed = set(), set()
+    fields = iter(diff)
+    for status in fields:
+        if not status:
+            continue
+        if status[0] in "RC":
+            old, new = next(fields), next(fields)
+            changed.add(new)
+            if status[0] == "R":
+                removed.add(old)
+        elif status[0] == "D":
+            removed.add(next(fields))
+        else:
+            changed.add(next(fields))
+    changed.update(p for p in untracked if p)
+    return changed, removed
+
+
+def select_changed_docs(md_files, ref, context, graph):
+    """Pick the docs to check for a ``--changed-since`` run.
+
+    Returns the changed markdown files under docs/ plus every document
+    that the link graph says links to a renamed or deleted path (or to a
+    directory that disappeared with it), in *md_files* order. Returns None
+    when a full scan is needed instead.
+    """
+    changed, removed = git_changes(ref)
+    global_inputs = _GLOBAL_INPUTS + tuple(context.get("taskfiles", ("Taskfile.yml",)))
+    if any(p.startswith(global_inputs) for p in changed | removed):
+        print("ℹ️  Taskfile or workflows changed — checking every document")
+        return None
+
+    gone = set(removed)
+    for path in removed:
+        parent = os.path.dirname(path)
+        while parent and not context["paths"].exists(parent):
+            gone.add(parent)
+            parent = os.path.dirname(parent)
+
+    selected = {p for p in changed if p.startswith("docs/") and p.endswith(".md")}
+    selected |= graph.linkers(gone)
+    for path in removed:
+        graph.remove(path)
+    return [f for f in md_files if str(f) in selected]
+
+
+# ── Watch mode ───────────────────────────────────────────────────────
+
+class AccuracyWatch:
+    """Per-file issues kept current across edits, for ``--watch``.
+
+    The context (task names, workflows, path index, corpus, anchors and
+    link graph) is built once. A changed doc is re-validated together with
+    every doc the link graph says links to it or to a path that appeared
+    or disappeared; only a Taskfile or workflow change re-validates all.
+    """
 
-    # Write JSON report
-    Path(".docs-reports").mkdir(exist_ok=True)
+    def __init__(self, context):
+        self.context = context
+        self.issues = {}
+
+    def watched(self):
+        """Return the files and directories whose changes affect the results."""
+        return [self.context["docs"].root, ".github/workflows", *self.context["taskfiles"]]
+
+    def check(self, md_files, use_cache=False, jobs=1):
+        """Re-validate *md_files*, replacing their issues."""
+        for md_file in md_files:
+            self.issues[str(md_file)] = []
+        for issue in iter_scan(md_files, self.context, use_cache=use_cache, jobs=jobs):
+            self.issues[issue["file"]].append(issue)
+
+    def all_issues(self):
+        return [issue for issues in self.issues.values() for issue in issues]
+
+    def _reload_globals(self):
+        index = load_task_index()
+        self.context["tasks"] = get_taskfile_tasks(index)
+        self.context["taskfiles"] = sorted(index.sources)
+        self.context["workflows"] = get_workflow_files()
+
+    def update(self, changed, removed):
+        """Apply one batch of changed and removed paths; return the docs re-validated."""
+        context = self.context
+        docs, graph = context["docs"], context["links"]
+        touched = changed | removed
+        global_inputs = _GLOBAL_INPUTS + tuple(context["taskfiles"])
+        rescan_all = any(p.startswith(global_inputs) for p in touched)
+        if rescan_all:
+            self._reload_globals()
+
+        docs.refresh(changed)
+        context["paths"].regraft(docs)
+        context["anchors"].forget(touched)
+        for path in removed:
+            self.issues.pop(path, None)
+            graph.remove(path)
+
+        md_files = [Path(doc.path) for doc in docs.markdown()]
+        if rescan_all:
+            selected = md_files
+        else:
+            targets = set(touched)
+            for path in touched:
+                parent = os.path.dirname(path)
+                while parent:
+                    targets.add(parent)
+                    parent = os.path.dirname(parent)
+            affected = {p for p in changed if is_markdown(p)} | graph.linkers(targets)
+            selected = [f for f in md_files if str(f) in affected]
+        self.check(selected)
+        return selected
+
+
+def watch_accuracy(context, md_files, use_cache=True, jobs=1, interval=DEFAULT_INTERVAL):
+    """Check every doc, then keep re-validating what each save affects."""
+    session = AccuracyWatch(context)
+    session.check(md_files, use_cache=use_cache, jobs=jobs)
+    issues = session.all_issues()
+    for issue in issues:
+        _print_issue(issue)
+    print(f"⚠️  Found {len(issues)} accuracy issue(s)" if issues else "✅ Documentation accuracy checks passed")
+
+    watcher = PollingWatcher(session.watched())
+
+    def on_change(changed, removed):
+        selected = session.update(changed, removed)
+        watcher.roots = session.watched()
+        print(f"\n🔄 Rechecked {len(selected)} doc(s) after changes to {', '.join(sorted(changed | removed))}")
+        for md_file in selected:
+            for issue in session.issues[str(md_file)]:
+                _print_issue(issue)
+        total = len(session.all_issues())
+        print(f"⚠️  {total} accuracy issue(s) in total" if total else "✅ No accuracy issues")
+
+    watch(watcher, on_change, interval)
+
+
+# ── Reports ──────────────────────────────────────────────────────────
+
+JSON_REPORT_PATH = Path(".docs-reports/docs-accuracy-report.json")
+JSONL_REPORT_PATH = Path(".docs-reports/docs-accuracy-report.jsonl")
+
+
+def _print_issue(issue):
+    print(f"  {issue['file']}:{issue['line']} — {issue['message']}")
+
+
+def write_json_report(issues):
+    """Collect *issues* into the JSON report and print them; return the count."""
+    all_issues = list(issues)
     report = {
         "issues": all_issues,
         "issue_count": len(all_issues),
         "clean": len(all_issues) == 0,
     }
-    with open(".docs-reports/docs-accuracy-report.json", "w") as f:
+    with open(JSON_REPORT_PATH, "w") as f:
         json.dump(report, f, indent=2)
+    JSONL_REPORT_PATH.unlink(missing_ok=True)
 
     if all_issues:
         print(f"⚠️  Found {len(all_issues)} accuracy issue(s)")
         for issue in all_issues:
-            print(f"  {issue['file']}:{issue['line']} — {issue['message']}")
+            _print_issue(issue)
+    return len(all_issues)
+
+
+def write_jsonl_report(issues):
+    """Stream *issues* to the JSON Lines report as they are found; return the count."""
+    JSON_REPORT_PATH.unlink(missing_ok=True)
+    with JsonlReportWriter(JSONL_REPORT_PATH) as writer:
+        for issue in issues:
+            writer.write(issue)
+            _print_issue(issue)
+        writer.close({"issue_count": writer.count, "clean": writer.count == 0})
+
+    if writer.count:
+        print(f"⚠️  Found {writer.count} accuracy issue(s)")
+    return writer.count
+
+
+# ── Main ─────────────────────────────────────────────────────────────
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Check documentation accuracy")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="ignore and do not update .docs-reports/docs-accuracy-cache.json",
+    )
+    parser.add_argument(
+        "--paths-from-git",
+        action="store_true",
+        help="index repo paths with 'git ls-files' instead of walking the tree",
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help="only check docs changed since the merge base with REF, plus docs "
+             "linking to files renamed or deleted since then",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("json", "jsonl"),
+        default="json",
+        help="json: one report written at the end (default); jsonl: stream each "
+             "issue to docs-accuracy-report.jsonl as it is found",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="analyze files across N processes (0 = one per CPU; default: 1)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="keep the indexes in memory and re-check docs affected by each save "
+             "(no report is written)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_INTERVAL,
+        metavar="SECONDS",
+        help=f"how often --watch polls for changes (default: {DEFAULT_INTERVAL})",
+    )
+    args = parser.parse_args(argv)
+    if args.watch and args.changed_since:
+        parser.error("--watch cannot be combined with --changed-since")
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or a positive integer")
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    print("🔍 Checking documentation accuracy…")
+
+    if not os.path.isdir("docs"):
+        print("❌ docs/ directory not found")
         sys.exit(1)
+
+    context = build_context(paths_from_git=args.paths_from_git)
+    md_files = [Path(doc.path) for doc in context["docs"].markdown()]
+    if args.watch:
+        watch_accuracy(context, md_files, use_cache=not args.no_cache, jobs=args.jobs, interval=args.interval)
+        return
+    partial = False
+    if args.changed_since:
+        graph = LinkGraph.load()
+        if graph is None:
+            print("ℹ️  No link graph yet — checking every document to build it")
+        else:
+            context["links"] = graph
+            selected = select_changed_docs(md_files, args.changed_since, context, graph)
+            if selected is not None:
+                print(f"📝 Checking {len(selected)} of {len(md_files)} doc(s) affected since {args.changed_since}")
+                md_files, partial = selected, True
+
+    stats = {}
+    issues = iter_scan(
+        md_files, context, use_cache=not args.no_cache, jobs=args.jobs,
+        partial=partial, stats=stats,
+    )
+    Path(".docs-reports").mkdir(exist_ok=True)
+    if args.format == "jsonl":
+        issue_count = write_jsonl_report(issues)
     else:
-        print("✅ Documentation accuracy checks passed")
+        issue_count = write_json_report(issues)
+
+    if not partial:
+        context["links"].links = {k: v for k, v in context["links"].links.items() if Path(k).is_file()}
+    context["links"].save()
+    if stats["cache_hits"]:
+        print(f"♻️  Reused cached results for {stats['cache_hits']} of {len(md_files)} file(s)")
+
+    if issue_count:
+        sys.exit(1)
+    print("✅ Documentation accuracy checks passed")
 
 
 if __name__ == "__main__":
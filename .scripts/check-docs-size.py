@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+
+"""
+Documentation Size Monitor
+
+Analyzes documentation size against the configured thresholds:
+- Total documentation size
+- Individual file sizes
+- Individual file word counts
+- Number of documentation files
+
+Everything comes from one walk of docs/ (excluding docs/archive/) via
+the shared DocsCorpus: file sizes are read from the directory entries.
+Token counts come from the offline estimator in token_estimate.py,
+cached per file by content hash, and are totalled per file and per
+category (top-level docs/ directory). Word counts are streamed in chunks
+and checked in the same pass. --words-only runs just that check, for the
+hygiene:size gate: it covers docs/archive/ too, skips token estimation,
+the history store and the report, and fails when a file is over the limit.
+Each full run is appended to the size history store (docs_size_history.py),
+and the report carries the growth rate and fastest-growing files over
+the last HISTORY_WINDOW_DAYS computed from it; --no-history skips both.
+Writes a JSON report to
+.docs-reports/docs-size-report.json; generate-docs-size-report.py turns
+it into the markdown report.
+"""
+
+import argparse
+import heapq
+import json
+import sys
+from pathlib import Path
+
+from docs_corpus import DocsCorpus
+from token_estimate import TokenCache, estimate_tokens
+
+# Thresholds (same as in workflow)
+MAX_TOTAL_SIZE_KB = 150
+MAX_FILE_SIZE_KB = 20
+MAX_FILES = 15
+MAX_WORDS = 2500
+
+EXCLUDED_DIRS = ("archive",)
+LARGEST_FILES_SHOWN = 5
+HISTORY_WINDOW_DAYS = 30
+FASTEST_GROWING_SHOWN = 5
+REPORT_PATH = Path(".docs-reports/docs-size-report.json")
+
+RED = "\033[0;31m"
+GREEN = "\033[0;32m"
+BLUE = "\033[0;34m"
+NC = "\033[0m"
+RULE = "━" * 56
+
+
+ROOT_CATEGORY = "(root)"
+
+
+def _file_entry(size, path):
+    return {"path": path, "size_bytes": size, "size_kb": size // 1024}
+
+
+def category_of(path):
+    """Return the docs category of *path*: its top-level directory under docs/."""
+    parts = path.split("/")
+    return parts[1] if len(parts) > 2 else ROOT_CATEGORY
+
+
+def _count_tokens(doc):
+    return estimate_tokens(doc.bytes.decode("utf-8", errors="replace"))
+
+
+def analyze(docs, top=LARGEST_FILES_SHOWN, count_tokens=_count_tokens):
+    """Return the size report for the ``DocsFile`` objects in *docs*.
+
+    Count, total, token estimates, the *top* largest files (kept in a
+    bounded min-heap) and oversized files are all gathered in a single
+    pass. *count_tokens* maps a ``DocsFile`` to its token estimate.
+    """
+    file_count = 0
+    total_size = 0
+    total_tokens = 0
+    files = []
+    categories = {}
+    largest = []
+    oversized = []
+    wordy = []
+    for index, doc in enumerate(docs):
+        file_count += 1
+        total_size += doc.size
+        tokens = count_tokens(doc)
+        total_tokens += tokens
+        category = category_of(doc.path)
+        words = doc.word_count
+        if words > MAX_WORDS:
+            wordy.append({"path": doc.path, "words": words})
+        files.append({**_file_entry(doc.size, doc.path), "category": category, "words": words, "tokens": tokens})
+        totals = categories.setdefault(category, {"category": category, "files": 0, "tokens": 0})
+        totals["files"] += 1
+        totals["tokens"] += tokens
+        # Ties keep the file seen first.
+        item = (doc.size, -index, doc.path)
+        if len(largest) < top:
+            heapq.heappush(largest, item)
+        elif item > largest[0]:
+            heapq.heapreplace(largest, item)
+        if doc.size > MAX_FILE_SIZE_KB * 1024:
+            oversized.append(_file_entry(doc.size, doc.path))
+
+    total_size_kb = total_size // 1024
+    alerts = []
+    if total_size_kb > MAX_TOTAL_SIZE_KB:
+        alerts.append(
+            f"Total documentation size ({total_size_kb} KB) exceeds threshold ({MAX_TOTAL_SIZE_KB} KB)"
+        )
+    if file_count > MAX_FILES:
+        alerts.append(f"Number of documentation files ({file_count}) exceeds threshold ({MAX_FILES})")
+    if oversized:
+        alerts.append(f"Files exceeding {MAX_FILE_SIZE_KB} KB: {len(oversized)}")
+    if wordy:
+        alerts.append(f"Files exceeding {MAX_WORDS} words: {len(wordy)}")
+
+    return {
+        "file_count": file_count,
+        "total_size_bytes": total_size,
+        "total_size_kb": total_size_kb,
+        "average_size_kb": (total_size // file_count) // 1024 if file_count else 0,
+        "estimated_tokens": total_tokens,
+        "largest_files": [_file_entry(size, path) for size, _, path in sorted(largest, reverse=True)],
+        "oversized_files": oversized,
+        "wordy_files": wordy,
+        "files": sorted(files, key=lambda f: (-f["tokens"], f["path"])),
+        "tokens_by_category": sorted(categories.values(), key=lambda c: (-c["tokens"], c["category"])),
+        "thresholds": {
+            "max_total_size_kb": MAX_TOTAL_SIZE_KB,
+            "max_file_size_kb": MAX_FILE_SIZE_KB,
+            "max_files": MAX_FILES,
+            "max_words": MAX_WORDS,
+        },
+        "alerts": alerts,
+        "within_limits": not alerts,
+    }
+
+
+def record_history(report, history, commit, recorded_at=None):
+    """Append *report* to *history* and return its trend section."""
+    history.record(
+        commit,
+        {f["path"]: f["size_bytes"] for f in report["files"]},
+        report["estimated_tokens"],
+        recorded_at=recorded_at,
+    )
+    return {
+        "growth": history.growth(HISTORY_WINDOW_DAYS, max_total_bytes=MAX_TOTAL_SIZE_KB * 1024),
+        "fastest_growing": history.fastest_growing(HISTORY_WINDOW_DAYS, limit=FASTEST_GROWING_SHOWN),
+    }
+
+
+def print_trend(trend):
+    growth = trend["growth"]
+    print(f"📉 Growth Trend (last {HISTORY_WINDOW_DAYS} days):")
+    print(RULE)
+    if growth is None:
+        print("  Not enough history yet — the trend starts with the next recorded run")
+        print()
+        return
+    print(f"  Size Growth:        {BLUE}{growth['bytes_per_day'] / 1024:+.2f} KB/day{NC}")
+    print(f"  Token Growth:       {BLUE}{growth['tokens_per_day']:+.0f} tokens/day{NC}")
+    if growth["days_until_limit"] is not None:
+        print(f"  Size Limit Reached: {BLUE}in ~{growth['days_until_limit']:.0f} days at this rate{NC}")
+    if trend["fastest_growing"]:
+        print("  Fastest-Growing Files:")
+    for f in trend["fastest_growing"]:
+        print(f"    {f['path']} (+{f['delta_bytes'] / 1024:.1f} KB{', new' if f['new'] else ''})")
+    print()
+
+
+def print_summary(report):
+    print()
+    print("📚 Documentation Size Monitor")
+    print(RULE)
+    print()
+    print("📊 Documentation Statistics:")
+    print(RULE)
+    print(f"  Total Files:        {BLUE}{report['file_count']}{NC}")
+    print(f"  Total Size:         {BLUE}{report['total_size_kb']} KB{NC}")
+    print(f"  Estimated Tokens:   {BLUE}~{report['estimated_tokens']}{NC}")
+    print(f"  Average File Size:  {BLUE}{report['average_size_kb']} KB{NC}")
+    print()
+    print("📈 Largest Files:")
+    print(RULE)
+    for f in report["largest_files"]:
+        print(f"{f['path']} ({f['size_kb']} KB)")
+    print()
+    thresholds = report["thresholds"]
+    print("🔤 Estimated Tokens by Category:")
+    print(RULE)
+    for c in report["tokens_by_category"]:
+        print(f"  {c['category'] + '/' if c['category'] != ROOT_CATEGORY else c['category']:<20}"
+              f"{BLUE}~{c['tokens']}{NC} ({c['files']} file(s))")
+    print()
+    if "trend" in report:
+        print_trend(report["trend"])
+    print("📋 Threshold Limits:")
+    print(RULE)
+    print(f"  Max Total Size:     {BLUE}{thresholds['max_total_size_kb']} KB{NC}")
+    print(f"  Max File Size:      {BLUE}{thresholds['max_file_size_kb']} KB{NC}")
+    print(f"  Max File Count:     {BLUE}{thresholds['max_files']}{NC}")
+    print(f"  Max Words per File: {BLUE}{thresholds['max_words']}{NC}")
+    print()
+    if report["within_limits"]:
+        print(f"{GREEN}✅ Status: Within acceptable limits{NC}")
+    else:
+        print(f"{RED}❌ Status: THRESHOLDS EXCEEDED{NC}")
+        print()
+        print("⚠️  Alerts:")
+        print(RULE)
+        for alert in report["alerts"]:
+            print(f"⚠️  {alert}")
+        for f in report["oversized_files"]:
+            print(f"     - {f['path']} ({f['size_kb']} KB)")
+        for f in report["wordy_files"]:
+            print(f"     - {f['path']} ({f['words']} words)")
+    print()
+
+
+def wordy_files(docs):
+    """Return the ``DocsFile`` objects in *docs* over MAX_WORDS, as report entries."""
+    return [{"path": doc.path, "words": doc.word_count} for doc in docs if doc.word_count > MAX_WORDS]
+
+
+def print_word_check(wordy):
+    if wordy:
+        print(f"❌ Found {len(wordy)} oversized doc file(s) (>{MAX_WORDS} words):")
+        for f in wordy:
+            print(f"  - {f['path']}: {f['words']} words")
+    else:
+        print("✅ No oversized markdown files found in docs")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Monitor documentation size")
+    parser.add_argument(
+        "--words-only",
+        action="store_true",
+        help=f"print only the per-file word check and exit 1 if a doc exceeds {MAX_WORDS} words",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="do not record this run in the size history or report the trend",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    corpus = DocsCorpus.shared()
+    if args.words_only:
+        wordy = wordy_files(corpus.markdown())
+        print_word_check(wordy)
+        sys.exit(1 if wordy else 0)
+
+    token_cache = TokenCache()
+    report = analyze(
+        corpus.markdown(exclude=EXCLUDED_DIRS),
+        count_tokens=lambda doc: token_cache.count(doc.path, doc.bytes),
+    )
+    token_cache.save()
+    if not args.no_history:
+        from docs_size_history import SizeHistory, current_commit  # sqlite3 is slow to import
+
+        with SizeHistory() as history:
+            report["trend"] = record_history(report, history, current_commit())
+
+    REPORT_PATH.parent.mkdir(exist_ok=True)
+    with open(REPORT_PATH, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print_summary(report)
+    if token_cache.hits:
+        print(f"♻️  Reused cached token counts for {token_cache.hits} of "
+              f"{token_cache.hits + token_cache.misses} file(s)")
+        print()
+
+    # Exit with 0 even if alerts (we don't fail the build, just report)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,60 +4,89 @@
 Documentation Structure Validator
 
 Validates that the docs directory structure matches the governance
-defined in docs/index.md. Generates a JSON report of violations.
+defined in docs/index.md. Generates a JSON report of violations, or a
+JSON Lines report with --format jsonl.
+
+With --watch the docs corpus stays in memory and the structure is
+re-validated whenever docs/index.md changes or a file or directory is
+added or removed; edits to other files cannot change the result.
 """
 
+import argparse
 import json
 import re
 import sys
 from pathlib import Path
 
+from docs_corpus import DocsCorpus
+from docs_lines import LineIndex
+from docs_watch import DEFAULT_INTERVAL, PollingWatcher, watch
+from jsonl_report import JsonlReportWriter
+
+JSON_REPORT_PATH = Path(".docs-reports/docs-structure-report.json")
+JSONL_REPORT_PATH = Path(".docs-reports/docs-structure-report.jsonl")
+
+
+def extract_categories_from_index(corpus=None):
+    """Parse docs/index.md to extract expected categories.
 
-def extract_categories_from_index():
-    """Parse docs/index.md to extract expected categories."""
-    index_path = Path("docs/index.md")
-    if not index_path.exists():
+    Returns a dict mapping each category name to the line of docs/index.md
+    that declares it, ordered by category name.
+    """
+    corpus = corpus or DocsCorpus.shared()
+    index_doc = corpus.get("docs/index.md")
+    if index_doc is None:
         print("❌ docs/index.md not found")
         sys.exit(1)
 
-    content = index_path.read_text()
+    content = index_doc.text
     
     # Find the table with categories
     # Pattern: | [category/](category/) | ... |
     pattern = r'\|\s*\[([a-z_]+)/\]\(([a-z_]+)/\)\s*\|'
-    matches = re.findall(pattern, content)
+    lines = LineIndex(content)
+    categories = {}
+    for m in re.finditer(pattern, content):
+        categories.setdefault(m.group(1), lines.line_of(m.start()))
     
-    categories = [match[0] for match in matches]
-    
-    return sorted(set(categories))
-
-
-def _check_expected_categories(docs_path, expected_categories):
+    return dict(sorted(categories.items()))
+
+
+def _check_category(corpus, category, index_line):
+    """Check that one expected category exists with a README.md file."""
+    category_path = f"{corpus.root}/{category}"
+    if not corpus.exists(category_path):
+        return [{
+            "type": "missing_directory",
+            "path": f"docs/{category}/",
+            "index_line": index_line,
+            "message": f"Missing directory: docs/{category}/"
+        }]
+    if not corpus.exists(f"{category_path}/README.md"):
+        return [{
+            "type": "missing_readme",
+            "path": f"docs/{category}/README.md",
+            "index_line": index_line,
+            "message": f"Missing README.md: docs/{category}/README.md"
+        }]
+    return []
+
+
+def _check_expected_categories(corpus, expected_categories):
     """Check that all expected categories exist with README.md files."""
     violations = []
-    for category in expected_categories:
-        category_path = docs_path / category
-        if not category_path.exists():
-            violations.append({
-                "type": "missing_directory",
-                "path": f"docs/{category}/",
-                "message": f"Missing directory: docs/{category}/"
-            })
-        elif not (category_path / "README.md").exists():
-            violations.append({
-                "type": "missing_readme",
-                "path": f"docs/{category}/README.md",
-                "message": f"Missing README.md: docs/{category}/README.md"
-            })
+    for category, index_line in expected_categories.items():
+        violations.extend(_check_category(corpus, category, index_line))
     return violations
 
 
-def _check_unexpected_items(docs_path, expected_categories):
+def _check_unexpected_items(corpus, expected_categories):
     """Check for unexpected files and directories in docs/."""
     violations = []
+    file_names, dir_names = corpus.children(corpus.root)
 
     expected_files = {"index.md", "README.md", "AGENTS.md", "CONTRIBUTING.md"}
-    actual_files = {f.name for f in docs_path.iterdir() if f.is_file()}
+    actual_files = set(file_names)
     for filename in sorted(actual_files - expected_files):
         violations.append({
             "type": "unexpected_file",
@@ -66,7 +95,7 @@ def _check_unexpected_items(docs_path, expected_categories):
         })
 
     expected_dirs = set(expected_categories)
-    actual_dirs = sorted([d.name for d in docs_path.iterdir() if d.is_dir()])
+    actual_dirs = sorted(dir_names)
     for dirname in sorted(set(actual_dirs) - expected_dirs):
         violations.append({
             "type": "unexpected_directory",
@@ -79,36 +108,109 @@ def _check_unexpected_items(docs_path, expected_categories):
 
 def check_docs_structure():
     """Validate docs structure against index.md governance."""
-    docs_path = Path("docs")
+    corpus = DocsCorpus.shared()
 
-    if not docs_path.exists():
+    if not corpus.is_dir(corpus.root):
         print("❌ docs/ directory not found")
         sys.exit(1)
 
-    expected_categories = extract_categories_from_index()
-    violations = _check_expected_categories(docs_path, expected_categories)
-    violations += _check_unexpected_items(docs_path, expected_categories)
+    expected_categories = extract_categories_from_index(corpus)
+    violations = _check_expected_categories(corpus, expected_categories)
+    violations += _check_unexpected_items(corpus, expected_categories)
     return violations
 
 
-def main():
+def _print_violations(violations):
+    for violation in violations:
+        print(f"  {violation['message']}")
+    if violations:
+        print(f"❌ Found {len(violations)} structure violation(s)")
+    else:
+        print("✅ Documentation structure is valid")
+
+
+def structure_affected(corpus, changed, removed):
+    """Return True if *changed* or *removed* paths can change the structure result."""
+    index_path = f"{corpus.root}/index.md"
+    added = {p for p in changed if not corpus.exists(p)}
+    return index_path in changed or bool(added or removed)
+
+
+def watch_structure(interval=DEFAULT_INTERVAL):
+    """Validate the structure, then re-validate after each save that can affect it."""
+    corpus = DocsCorpus.shared()
+    _print_violations(check_docs_structure())
+
+    def on_change(changed, removed):
+        affected = structure_affected(corpus, changed, removed)
+        corpus.refresh(changed)
+        if not affected:
+            print("\n🔄 Content-only change — structure unchanged")
+            return
+        print(f"\n🔄 Revalidating after changes to {', '.join(sorted(changed | removed))}")
+        _print_violations(check_docs_structure())
+
+    watch(PollingWatcher([corpus.root]), on_change, interval)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Validate documentation structure")
+    parser.add_argument(
+        "--format",
+        choices=("json", "jsonl"),
+        default="json",
+        help="report format: json (default) or jsonl, one violation per line "
+             "followed by a summary line",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="keep the docs corpus in memory and revalidate on each structural "
+             "change (no report is written)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_INTERVAL,
+        metavar="SECONDS",
+        help=f"how often --watch polls for changes (default: {DEFAULT_INTERVAL})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
     print("🔍 Validating documentation structure...")
-    
+    if args.watch:
+        watch_structure(args.interval)
+        return
+
     violations = check_docs_structure()
     
     # Create report directory
     Path(".docs-reports").mkdir(exist_ok=True)
-    
-    # Write JSON report
-    report = {
-        "violations": violations,
-        "valid": len(violations) == 0,
-        "violation_count": len(violations)
-    }
-    
-    with open(".docs-reports/docs-structure-report.json", "w") as f:
-        json.dump(report, f, indent=2)
-    
+
+    if args.format == "jsonl":
+        JSON_REPORT_PATH.unlink(missing_ok=True)
+        with JsonlReportWriter(JSONL_REPORT_PATH) as writer:
+            for violation in violations:
+                writer.write(violation)
+            writer.close({
+                "valid": len(violations) == 0,
+                "violation_count": len(violations),
+            })
+    else:
+        # Write JSON report
+        report = {
+            "violations": violations,
+            "valid": len(violations) == 0,
+            "violation_count": len(violations)
+        }
+
+        with open(JSON_REPORT_PATH, "w") as f:
+            json.dump(report, f, indent=2)
+        JSONL_REPORT_PATH.unlink(missing_ok=True)
+
     if violations:
         print(f"❌ Found {len(violations)} structure violation(s)")
         sys.exit(1)
@@ -0,0 +1,45 @@
+"""Process-pool entry points for ``check-docs-accuracy.py --jobs``.
+
+Worker processes find the functions they run by module name. The checker
+is a hyphen-named script, loaded as ``__main__`` or, through hygiene.py,
+as ``check_docs_accuracy``, and neither name can be imported by a worker
+started with the spawn or forkserver method. These entry points live in
+an importable module instead, and each worker loads the checker from its
+path once, when it starts.
+
+The context sent to the workers leaves out the link graph, whose class is
+defined in the checker; each worker records links in a graph of its own.
+"""
+
+import importlib.util
+import os
+
+CHECKER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "check-docs-accuracy.py")
+
+_checker = None
+_context = None
+
+
+def load_checker():
+    """Load check-docs-accuracy.py as a module of this process."""
+    spec = importlib.util.spec_from_file_location("docs_accuracy_checker", CHECKER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def worker_context(context):
+    """Return the part of *context* that is sent to the workers."""
+    return {key: value for key, value in context.items() if key != "links"}
+
+
+def init_worker(context):
+    global _checker, _context
+    _checker = load_checker()
+    _context = dict(context, links=_checker.LinkGraph())
+
+
+def analyze(item):
+    """Analyze one ``(md_path, content)`` pair; see ``analyze_with_deps()``."""
+    md_path, content = item
+    return _checker.analyze_with_deps(md_path, content, _context)
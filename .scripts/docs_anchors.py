@@ -0,0 +1,151 @@
+"""GitHub-compatible heading anchors for the documentation checks.
+
+``heading_slugs()`` turns a markdown document into the set of ``#fragment``
+anchors GitHub renders for its headings: one lowercase slug per heading
+(with ``-1``, ``-2`` suffixes for duplicates, as github-slugger does).
+``html_anchors()`` returns its explicit HTML ``id``/``name`` anchors, which
+keep their case: GitHub matches those exactly.
+
+``AnchorIndex`` builds that set lazily, the first time a file is linked,
+and keeps it for the rest of the run, so a page with many inbound links
+is parsed once.
+"""
+
+import os
+import re
+
+_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_ATX = re.compile(r"^ {0,3}#{1,6}(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+_SETEXT = re.compile(r"^ {0,3}(?:=+|-+)[ \t]*$")
+_HTML_ANCHOR = re.compile(r"""<[a-zA-Z][^>]*?\s(?:id|name)\s*=\s*["']([^"']+)["']""")
+
+_IMAGE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_HTML_TAG = re.compile(r"<[^>]+>")
+_EMPHASIS = re.compile(r"(?<!\w)[*_]+|[*_]+(?!\w)")
+_NON_SLUG = re.compile(r"[^\w\- ]")
+
+
+def parse_headings(content):
+    """Return the text of every ATX and setext heading outside code fences."""
+    headings = []
+    fence = None
+    previous = ""
+    for line in content.splitlines():
+        fence_match = _FENCE.match(line)
+        if fence is not None:
+            if fence_match and fence_match.group(1)[0] == fence[0] and len(fence_match.group(1)) >= len(fence):
+                fence = None
+            previous = ""
+            continue
+        if fence_match:
+            fence = fence_match.group(1)
+            previous = ""
+            continue
+        atx = _ATX.match(line)
+        if atx:
+            headings.append(atx.group(1) or "")
+            previous = ""
+            continue
+        if previous.strip() and _SETEXT.match(line):
+            headings.append(previous.strip())
+            previous = ""
+            continue
+        previous = line
+    return headings
+
+
+def _heading_text(heading):
+    """Approximate the rendered text of a heading's inline markdown."""
+    text = _IMAGE.sub(r"\1", heading)
+    text = _LINK.sub(r"\1", text)
+    text = _HTML_TAG.sub("", text)
+    text = text.replace("`", "")
+    return _EMPHASIS.sub("", text).strip()
+
+
+def github_slug(text):
+    """Slugify heading *text* the way GitHub does, before de-duplication."""
+    return _NON_SLUG.sub("", _heading_text(text).lower()).replace(" ", "-")
+
+
+def heading_slugs(content):
+    """Return every heading anchor GitHub would generate for *content*."""
+    occurrences = {}
+    for heading in parse_headings(content):
+        original = github_slug(heading)
+        slug = original
+        while slug in occurrences:
+            occurrences[original] += 1
+            slug = f"{original}-{occurrences[original]}"
+        occurrences[slug] = 0
+    return frozenset(occurrences)
+
+
+def html_anchors(content):
+    """Return the explicit HTML ``id``/``name`` anchors of *content*, as written."""
+    return frozenset(m.group(1) for m in _HTML_ANCHOR.finditer(content))
+
+
+class AnchorIndex:
+    """Lazily built, per-run map of markdown file to its anchor set."""
+
+    def __init__(self, read=None):
+        self._read = read
+        self._slugs = {}
+        self._accessed = None
+
+    def track(self):
+        """Start recording which files are looked up; see ``accessed()``."""
+        self._accessed = set()
+
+    def accessed(self):
+        """Stop recording and return the files looked up since ``track()``."""
+        accessed, self._accessed = self._accessed or set(), None
+        return accessed
+
+    def slugs(self, path, content=None):
+        """Return the ``(heading_slugs, html_anchors)`` of the markdown file at *path*.
+
+        *path* is any key that identifies the file for this run, such as a
+        resolved repo-relative path. Pass *content* when the text is
+        already in memory to avoid reading it again. Returns None when the
+        file cannot be read. Files are read with the *read* callable given
+        to the constructor, if any, so a shared ``DocsCorpus`` can serve
+        them without another trip to disk.
+        """
+        if self._accessed is not None:
+            self._accessed.add(path)
+        if path not in self._slugs:
+            if content is None:
+                try:
+                    if self._read is not None:
+                        content = self._read(path)
+                    else:
+                        with open(path, encoding="utf-8") as f:
+                            content = f.read()
+                except (OSError, UnicodeDecodeError):
+                    content = None
+            self._slugs[path] = None if content is None else (heading_slugs(content), html_anchors(content))
+        return self._slugs[path]
+
+    def forget(self, paths):
+        """Drop the anchors of *paths* so they are read again on next use."""
+        for path in paths:
+            self._slugs.pop(path, None)
+
+    def digest(self, path):
+        """Return a short hash of *path*'s anchor set, for cache validation."""
+        import hashlib  # only cache validation needs digests
+
+        anchors = self.slugs(path)
+        if anchors is None:
+            return None
+        slugs, ids = anchors
+        text = "\n".join(sorted(slugs)) + "\0" + "\n".join(sorted(ids))
+        return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def is_markdown(path):
+    """Return True for files whose headings GitHub renders as anchors."""
+    return os.path.splitext(path)[1].lower() in (".md", ".markdown")
@@ -0,0 +1,222 @@
+"""Single walk of the docs tree shared by every docs hygiene check.
+
+The structure, accuracy and size checks each used to walk ``docs/`` on
+their own (``iterdir``, ``rglob``, ``glob`` and several ``find`` runs in
+the size monitor) and read every file again. ``DocsCorpus`` walks the
+tree once with ``os.scandir`` and exposes each file as a ``DocsFile``
+whose bytes, text, word count and headings are loaded on first use and
+kept. ``DocsCorpus.shared()`` hands every check in the same process the
+same instance, so running them together lists each directory and reads
+each file once.
+
+Paths are relative to the working directory in POSIX form, e.g.
+``docs/guide/README.md``. Symlinked directories are listed but not
+followed, as ``Path.rglob()`` does.
+"""
+
+import os
+import re
+
+from docs_anchors import parse_headings
+
+WORD = re.compile(r"\w+")
+_WORD_CHAR = re.compile(r"\w")
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_text_chunks(path, chunk_size=CHUNK_SIZE):
+    """Yield the UTF-8 text of *path* in chunks of at most *chunk_size* characters."""
+    with open(path, encoding="utf-8") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def count_words(chunks):
+    """Count ``\\b\\w+\\b`` words across text *chunks* without building lists.
+
+    A word split across a chunk boundary is counted once: when the
+    previous chunk ended inside a word, the run the next chunk starts
+    with continues it.
+    """
+    count = 0
+    in_word = False
+    for chunk in chunks:
+        if not chunk:
+            continue
+        count += sum(1 for _ in WORD.finditer(chunk))
+        if in_word and _WORD_CHAR.match(chunk):
+            count -= 1
+        in_word = _WORD_CHAR.match(chunk[-1]) is not None
+    return count
+
+
+class DocsFile:
+    """One file of the docs tree, read lazily and at most once."""
+
+    __slots__ = ("path", "size", "_bytes", "_text", "_word_count", "_headings")
+
+    def __init__(self, path, size):
+        self.path = path
+        self.size = size
+        self._bytes = None
+        self._text = None
+        self._word_count = None
+        self._headings = None
+
+    @property
+    def name(self):
+        return os.path.basename(self.path)
+
+    @property
+    def bytes(self):
+        if self._bytes is None:
+            with open(self.path, "rb") as f:
+                self._bytes = f.read()
+        return self._bytes
+
+    @property
+    def text(self):
+        """UTF-8 text with universal newlines, as ``Path.read_text()`` returns it."""
+        if self._text is None:
+            self._text = self.bytes.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        return self._text
+
+    @property
+    def word_count(self):
+        """Number of words; streamed from disk unless the contents are already loaded."""
+        if self._word_count is None:
+            if self._text is not None or self._bytes is not None:
+                chunks = [self.text]
+            else:
+                chunks = iter_text_chunks(self.path)
+            self._word_count = count_words(chunks)
+        return self._word_count
+
+    @property
+    def headings(self):
+        if self._headings is None:
+            self._headings = parse_headings(self.text)
+        return self._headings
+
+    def __getstate__(self):
+        # Ship metadata only to worker processes; contents reload on demand.
+        return (self.path, self.size)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+
+class DocsCorpus:
+    """Files and directories under a docs root, listed by one ``os.scandir`` walk."""
+
+    _shared = {}
+
+    def __init__(self, root="docs"):
+        self.root = root.rstrip("/")
+        self.files = {}
+        self.dirs = set()
+        self.symlinks = set()
+        self._children = {}
+
+    @classmethod
+    def scan(cls, root="docs"):
+        """Walk *root* once. A missing root yields an empty corpus."""
+        corpus = cls(root)
+        stack = [corpus.root]
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                entries = os.scandir(rel_dir)
+            except OSError:
+                continue
+            corpus.dirs.add(rel_dir)
+            files, dirs = [], []
+            with entries:
+                for entry in entries:
+                    rel = f"{rel_dir}/{entry.name}"
+                    try:
+                        if entry.is_dir():
+                            dirs.append(entry.name)
+                            corpus.dirs.add(rel)
+                            if entry.is_symlink():
+                                corpus.symlinks.add(rel)
+                            else:
+                                stack.append(rel)
+                        elif entry.is_file():
+                            files.append(entry.name)
+                            corpus.files[rel] = DocsFile(rel, entry.stat().st_size)
+                    except OSError:
+                        continue
+            corpus._children[rel_dir] = (sorted(files), sorted(dirs))
+        return corpus
+
+    @classmethod
+    def shared(cls, root="docs"):
+        """Return the process-wide corpus for *root*, walking it on first use."""
+        key = os.path.abspath(root)
+        if key not in cls._shared:
+            cls._shared[key] = cls.scan(root)
+        return cls._shared[key]
+
+    @classmethod
+    def reset_shared(cls):
+        """Forget every shared corpus, e.g. after the tree changed on disk."""
+        cls._shared.clear()
+
+    def refresh(self, changed=()):
+        """Walk the root again in place, e.g. after files were saved in ``--watch`` mode.
+
+        Files not named in *changed* whose size is unchanged keep their
+        ``DocsFile``, so contents already loaded are not read again.
+        """
+        changed = {self._key(p) for p in changed}
+        fresh = type(self).scan(self.root)
+        for path, doc in fresh.files.items():
+            old = self.files.get(path)
+            if old is not None and path not in changed and old.size == doc.size:
+                fresh.files[path] = old
+        self.files, self.dirs = fresh.files, fresh.dirs
+        self.symlinks, self._children = fresh.symlinks, fresh._children
+
+    @staticmethod
+    def _key(path):
+        return os.path.normpath(os.fspath(path)).replace(os.sep, "/")
+
+    def get(self, path):
+        """Return the ``DocsFile`` at *path*, or None if the walk did not find one."""
+        return self.files.get(self._key(path))
+
+    def is_file(self, path):
+        return self._key(path) in self.files
+
+    def is_dir(self, path):
+        return self._key(path) in self.dirs
+
+    def exists(self, path):
+        key = self._key(path)
+        return key in self.files or key in self.dirs
+
+    def children(self, path):
+        """Return ``(file_names, dir_names)`` directly inside directory *path*."""
+        return self._children.get(self._key(path), ([], []))
+
+    def markdown(self, exclude=()):
+        """Return every ``.md`` file, skipping subdirectories of the root named in *exclude*.
+
+        Files are ordered as ``sorted(Path(root).rglob("*.md"))`` would.
+        """
+        skip = tuple(f"{self.root}/{d}/" for d in exclude)
+        found = [f for p, f in self.files.items() if p.endswith(".md") and not p.startswith(skip)]
+        return sorted(found, key=lambda f: f.path.split("/"))
+
+    def read_text(self, path):
+        """Return the text of *path*, from the corpus when it holds the file."""
+        doc = self.get(path)
+        if doc is not None:
+            return doc.text
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
@@ -0,0 +1,30 @@
+"""Line-number lookup shared by the documentation hygiene checks.
+
+Checks report issues against 1-based line numbers. Counting newlines in
+``content[:offset]`` for every match copies and rescans the prefix of the
+file each time, which turns a document with many matches into quadratic
+work. ``LineIndex`` records every newline offset once and answers each
+lookup with a binary search instead.
+"""
+
+import bisect
+import re
+
+_NEWLINE = re.compile("\n")
+
+
+class LineIndex:
+    """Map character offsets in a document to 1-based line numbers."""
+
+    __slots__ = ("_newlines",)
+
+    def __init__(self, content):
+        self._newlines = [m.start() for m in _NEWLINE.finditer(content)]
+
+    def line_of(self, offset):
+        """Return the line containing *offset* (same as ``content[:offset].count("\\n") + 1``)."""
+        return bisect.bisect_left(self._newlines, offset) + 1
+
+    def __len__(self):
+        """Return the number of lines in the document."""
+        return len(self._newlines) + 1
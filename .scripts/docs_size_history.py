@@ -0,0 +1,213 @@
+"""Append-only history of documentation size snapshots.
+
+Every size-monitor run records a snapshot (file count, total bytes,
+token estimate and each file's size) keyed by commit and timestamp in
+a small SQLite database, .docs-reports/docs-size-history.sqlite. File
+paths are interned once, so a snapshot costs one row plus one
+``(snapshot, path, bytes)`` row per file.
+
+Trend queries only ever touch two snapshots, found through indexes on
+time and commit, so they stay in the millisecond range however many
+years of history the store holds:
+
+- ``growth()``: bytes and tokens gained per day over a window, and the
+  days left before the total size threshold is reached at that rate
+- ``fastest_growing()``: the files whose size grew most over the window
+"""
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+HISTORY_PATH = Path(".docs-reports/docs-size-history.sqlite")
+DEFAULT_WINDOW_DAYS = 30
+SECONDS_PER_DAY = 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    commit_sha TEXT NOT NULL,
+    recorded_at INTEGER NOT NULL,
+    file_count INTEGER NOT NULL,
+    total_bytes INTEGER NOT NULL,
+    estimated_tokens INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_by_time ON snapshots (recorded_at);
+CREATE INDEX IF NOT EXISTS snapshots_by_commit ON snapshots (commit_sha);
+CREATE TABLE IF NOT EXISTS paths (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS file_sizes (
+    snapshot_id INTEGER NOT NULL,
+    path_id INTEGER NOT NULL,
+    bytes INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, path_id)
+) WITHOUT ROWID;
+"""
+
+
+def current_commit(repo="."):
+    """Return the checked-out commit SHA without spawning git, or ``"unknown"``."""
+    if os.environ.get("GITHUB_SHA"):
+        return os.environ["GITHUB_SHA"]
+    git_dir = Path(repo) / ".git"
+    try:
+        if git_dir.is_file():  # worktree or submodule: "gitdir: <path>"
+            git_dir = (Path(repo) / git_dir.read_text().split(":", 1)[1].strip()).resolve()
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head
+        ref = head[5:]
+        ref_path = git_dir / ref
+        if ref_path.is_file():
+            return ref_path.read_text().strip()
+        common = git_dir / "commondir"
+        base = (git_dir / common.read_text().strip()).resolve() if common.is_file() else git_dir
+        if (base / ref).is_file():
+            return (base / ref).read_text().strip()
+        for line in (base / "packed-refs").read_text().splitlines():
+            if line.endswith(f" {ref}"):
+                return line.split(" ", 1)[0]
+    except (OSError, IndexError):
+        pass
+    return "unknown"
+
+
+class SizeHistory:
+    """SQLite-backed store of documentation size snapshots."""
+
+    def __init__(self, path=HISTORY_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.executescript(_SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def record(self, commit, files, estimated_tokens, recorded_at=None):
+        """Append a snapshot of *files* (``{path: bytes}``); return its id.
+
+        A run that repeats the latest snapshot exactly (same commit, same
+        sizes) is not stored again, so re-running the monitor does not
+        bloat the history.
+        """
+        recorded_at = int(time.time() if recorded_at is None else recorded_at)
+        total = sum(files.values())
+        latest = self._latest()
+        if (
+            latest is not None
+            and latest[1] == commit
+            and latest[3:] == (len(files), total, estimated_tokens)
+            and self._sizes(latest[0]) == files
+        ):
+            return latest[0]
+        with self.db:
+            snapshot_id = self.db.execute(
+                "INSERT INTO snapshots (commit_sha, recorded_at, file_count, total_bytes, estimated_tokens) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (commit, recorded_at, len(files), total, estimated_tokens),
+            ).lastrowid
+            self.db.executemany("INSERT OR IGNORE INTO paths (path) VALUES (?)", ((p,) for p in files))
+            self.db.executemany(
+                "INSERT INTO file_sizes (snapshot_id, path_id, bytes) "
+                "SELECT ?, id, ? FROM paths WHERE path = ?",
+                ((snapshot_id, size, path) for path, size in files.items()),
+            )
+        return snapshot_id
+
+    def _latest(self):
+        return self.db.execute(
+            "SELECT id, commit_sha, recorded_at, file_count, total_bytes, estimated_tokens "
+            "FROM snapshots ORDER BY recorded_at DESC, id DESC LIMIT 1"
+        ).fetchone()
+
+    def _baseline(self, latest, window_days):
+        """Return the newest snapshot at least *window_days* older than *latest*.
+
+        Falls back to the oldest snapshot while the history is shorter
+        than the window.
+        """
+        cutoff = latest[2] - window_days * SECONDS_PER_DAY
+        row = self.db.execute(
+            "SELECT id, commit_sha, recorded_at, file_count, total_bytes, estimated_tokens "
+            "FROM snapshots WHERE recorded_at <= ? ORDER BY recorded_at DESC, id DESC LIMIT 1",
+            (cutoff,),
+        ).fetchone()
+        if row is None:
+            row = self.db.execute(
+                "SELECT id, commit_sha, recorded_at, file_count, total_bytes, estimated_tokens "
+                "FROM snapshots ORDER BY recorded_at, id LIMIT 1"
+            ).fetchone()
+        return row
+
+    def _sizes(self, snapshot_id):
+        return dict(self.db.execute(
+            "SELECT paths.path, file_sizes.bytes FROM file_sizes "
+            "JOIN paths ON paths.id = file_sizes.path_id WHERE file_sizes.snapshot_id = ?",
+            (snapshot_id,),
+        ))
+
+    def commits(self, commit):
+        """Return ``(id, recorded_at)`` of every snapshot taken at *commit*."""
+        return self.db.execute(
+            "SELECT id, recorded_at FROM snapshots WHERE commit_sha = ? ORDER BY recorded_at", (commit,)
+        ).fetchall()
+
+    def growth(self, window_days=DEFAULT_WINDOW_DAYS, max_total_bytes=None):
+        """Return growth since the window's baseline, or None without two snapshots in time."""
+        latest = self._latest()
+        if latest is None:
+            return None
+        baseline = self._baseline(latest, window_days)
+        elapsed = latest[2] - baseline[2]
+        if baseline[0] == latest[0] or elapsed <= 0:
+            return None
+        days = elapsed / SECONDS_PER_DAY
+        bytes_per_day = (latest[4] - baseline[4]) / days
+        days_until_limit = None
+        if max_total_bytes is not None and bytes_per_day > 0 and latest[4] < max_total_bytes:
+            days_until_limit = (max_total_bytes - latest[4]) / bytes_per_day
+        return {
+            "window_days": window_days,
+            "baseline_commit": baseline[1],
+            "baseline_at": baseline[2],
+            "latest_commit": latest[1],
+            "latest_at": latest[2],
+            "elapsed_days": round(days, 2),
+            "total_bytes_change": latest[4] - baseline[4],
+            "file_count_change": latest[3] - baseline[3],
+            "bytes_per_day": round(bytes_per_day, 1),
+            "tokens_per_day": round((latest[5] - baseline[5]) / days, 1),
+            "days_until_limit": None if days_until_limit is None else round(days_until_limit, 1),
+        }
+
+    def fastest_growing(self, window_days=DEFAULT_WINDOW_DAYS, limit=5):
+        """Return the *limit* files that grew most since the window's baseline."""
+        latest = self._latest()
+        if latest is None:
+            return []
+        baseline = self._baseline(latest, window_days)
+        if baseline[0] == latest[0]:
+            return []
+        rows = self.db.execute(
+            "SELECT paths.path, cur.bytes, cur.bytes - COALESCE(base.bytes, 0) AS delta, base.bytes IS NULL "
+            "FROM file_sizes AS cur "
+            "JOIN paths ON paths.id = cur.path_id "
+            "LEFT JOIN file_sizes AS base ON base.snapshot_id = ? AND base.path_id = cur.path_id "
+            "WHERE cur.snapshot_id = ? AND delta > 0 "
+            "ORDER BY delta DESC, paths.path LIMIT ?",
+            (baseline[0], latest[0], limit),
+        ).fetchall()
+        return [
+            {"path": path, "bytes": size, "delta_bytes": delta, "new": bool(new)}
+            for path, size, delta, new in rows
+        ]
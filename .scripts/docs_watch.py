@@ -0,0 +1,102 @@
+"""Polling watch loop shared by the docs checkers' ``--watch`` mode.
+
+A cold checker run spends most of its time rebuilding the Taskfile
+index, the workflow list and the repository path set. In watch mode a
+checker builds them once, then ``PollingWatcher`` stats the watched
+files every few tens of milliseconds and ``watch()`` hands each batch of
+changed and removed paths to the checker, which re-validates only what
+they affect.
+
+Polling is used instead of inotify/FSEvents so it works the same on
+every platform with the standard library alone. A file counts as changed
+when its modification time, size or inode differ, which also catches
+editors that save by writing a new file and renaming it over the old one.
+"""
+
+import os
+import time
+
+# Seconds between polls. Small trees stat in well under a millisecond,
+# so polling this often keeps results within ~100 ms of a save.
+DEFAULT_INTERVAL = 0.05
+
+
+def _signature(stat):
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class PollingWatcher:
+    """Detect file changes under *roots* (files or directories) by polling."""
+
+    def __init__(self, roots):
+        self.roots = list(roots)
+        self._seen = self.snapshot()
+
+    def snapshot(self):
+        """Return ``{path: signature}`` for every file and directory under the roots.
+
+        Directories only matter for appearing and disappearing, so their
+        signature is constant.
+        """
+        seen = {}
+        stack = []
+        for root in self.roots:
+            root = os.fspath(root)
+            try:
+                stat = os.stat(root)
+            except OSError:
+                continue
+            if os.path.isdir(root):
+                seen[root] = None
+                stack.append(root)
+            else:
+                seen[root] = _signature(stat)
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                entries = os.scandir(rel_dir)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    rel = f"{rel_dir}/{entry.name}"
+                    try:
+                        if entry.is_dir():
+                            seen[rel] = None
+                            if not entry.is_symlink():
+                                stack.append(rel)
+                        elif entry.is_file():
+                            seen[rel] = _signature(entry.stat())
+                    except OSError:
+                        continue
+        return seen
+
+    def poll(self):
+        """Return ``(changed, removed)`` path sets since the previous poll."""
+        current = self.snapshot()
+        changed = {p for p, sig in current.items() if p not in self._seen or self._seen[p] != sig}
+        removed = set(self._seen) - set(current)
+        self._seen = current
+        return changed, removed
+
+
+def watch(watcher, on_change, interval=DEFAULT_INTERVAL, sleep=time.sleep, cycles=None):
+    """Call ``on_change(changed, removed)`` whenever *watcher* sees a change.
+
+    Prints how long each update took. Runs until interrupted, or for
+    *cycles* polls when given.
+    """
+    print(f"👀 Watching for changes every {interval * 1000:.0f} ms (Ctrl+C to stop)")
+    try:
+        while cycles is None or cycles > 0:
+            if cycles is not None:
+                cycles -= 1
+            sleep(interval)
+            changed, removed = watcher.poll()
+            if not changed and not removed:
+                continue
+            start = time.perf_counter()
+            on_change(changed, removed)
+            print(f"⏱️  Updated in {(time.perf_counter() - start) * 1000:.0f} ms")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
@@ -0,0 +1,300 @@
+"""Local SQLite store of the findings of every scanner.
+
+Semgrep, Trivy, ZAP, Gitleaks and Lizard each write their own JSON or
+CSV report. ``FindingsStore.ingest()`` reads one of them once and files
+every finding as a row of one table in .findings-reports/findings.sqlite:
+
+- tool, severity, rule, path and line, normalized across scanners
+  (severities are critical, high, medium, low and info; paths lose a
+  leading ``./``), each indexed
+- the run that ingested it, one per tool and report
+- the scanner's own record as JSON, which the report generators render
+
+Ingestion streams the report (see json_stream.py), so memory stays flat
+however large it is. Ingesting a report that has not changed since the
+last run of its tool (same path, size and modification time) returns
+that run instead of reading it again, and only the latest KEEP_RUNS runs
+of each tool are kept.
+
+Queries run against the latest run of every tool unless given a run, so
+a question such as "everything flagged in server.js by any scanner" is
+one indexed lookup rather than five report parses.
+"""
+
+import csv
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+from json_stream import JsonStream, iter_arrays
+
+STORE_PATH = Path(".findings-reports/findings.sqlite")
+KEEP_RUNS = 5
+
+SEVERITIES = ("critical", "high", "medium", "low", "info")
+
+# Each tool's report, and how errors about it are worded.
+SOURCES = {
+    "sast": ".sast-reports/sast-report.json",
+    "dependencies": ".dependencies-reports/dependencies-report.json",
+    "dast": ".dast-reports/dast-report.json",
+    "secrets": ".secrets-reports/secrets-report.json",
+    "complexity": ".complexity-reports/complexity-report.csv",
+}
+LABELS = {
+    "sast": "SAST JSON report",
+    "dependencies": "Dependencies JSON report",
+    "dast": "DAST JSON report",
+    "secrets": "Secrets JSON report",
+    "complexity": "CSV report",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    tool TEXT NOT NULL,
+    source TEXT NOT NULL,
+    source_size INTEGER NOT NULL,
+    source_mtime_ns INTEGER NOT NULL,
+    recorded_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_tool ON runs (tool, id);
+CREATE TABLE IF NOT EXISTS findings (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL,
+    tool TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    rule TEXT NOT NULL,
+    path TEXT NOT NULL,
+    line INTEGER,
+    title TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS findings_by_run ON findings (run_id, kind);
+CREATE INDEX IF NOT EXISTS findings_by_tool ON findings (tool, severity);
+CREATE INDEX IF NOT EXISTS findings_by_severity ON findings (severity);
+CREATE INDEX IF NOT EXISTS findings_by_path ON findings (path);
+CREATE INDEX IF NOT EXISTS findings_by_rule ON findings (rule);
+"""
+
+_SEVERITY_ORDER = "CASE severity " + " ".join(
+    f"WHEN '{severity}' THEN {rank}" for rank, severity in enumerate(SEVERITIES)
+) + " END"
+
+_SAST_SEVERITIES = {"ERROR": "high", "WARNING": "medium"}
+_TRIVY_SEVERITIES = {"CRITICAL": "critical", "HIGH": "high", "MEDIUM": "medium"}
+_ZAP_SEVERITIES = {"3": "high", "2": "medium", "1": "low"}
+
+
+def _row(kind, severity, rule, path, line, title, data):
+    """Normalize one record into the store's columns."""
+    path = str(path)
+    if path.startswith("./"):
+        path = path[2:]
+    title = " ".join(str(title).split())[:200]
+    return kind, severity, str(rule), path, line if isinstance(line, int) else None, title, data
+
+
+def _sast_rows(f):
+    for key, item in iter_arrays(f, ("results", "errors")):
+        if key == "errors":
+            message = (item.get("message", "Unknown error").splitlines() or [""])[0]
+            yield _row("error", "info", "scan-error", item.get("path", ""), None, message, item)
+            continue
+        extra = item.get("extra", {})
+        yield _row(
+            "finding", _SAST_SEVERITIES.get(extra.get("severity", "").upper(), "low"),
+            item.get("check_id", "unknown"), item.get("path", "unknown"),
+            item.get("start", {}).get("line"), extra.get("message", ""), item,
+        )
+
+
+def _dependencies_rows(f):
+    for _, result in iter_arrays(f, ("Results",)):
+        target = result.get("Target", "unknown")
+        for vuln in result.get("Vulnerabilities") or []:
+            yield _row(
+                "finding", _TRIVY_SEVERITIES.get(vuln.get("Severity", "").upper(), "low"),
+                vuln.get("VulnerabilityID", "unknown"), target, None,
+                vuln.get("Title", "") or vuln.get("PkgName", ""),
+                # The generator needs the result's target next to each vulnerability.
+                dict(vuln, Target=target),
+            )
+
+
+def _dast_rows(f):
+    for _, site in iter_arrays(f, ("site",)):
+        for alert in site.get("alerts", []):
+            yield _row(
+                "finding", _ZAP_SEVERITIES.get(str(alert.get("riskcode", "0")), "info"),
+                alert.get("pluginid", alert.get("name", "unknown")), site.get("@name", "unknown"), None,
+                alert.get("name", alert.get("alert", "")), alert,
+            )
+
+
+def _secrets_rows(f):
+    # Gitleaks writes a list of findings, or "null" (or nothing) when there are none.
+    stream = JsonStream(f)
+    if stream.peek() != "[":
+        if stream.peek():
+            stream.value()
+        return
+    for _ in stream.elements():
+        finding = stream.value()
+        yield _row(
+            "finding", "high", finding.get("RuleID", finding.get("ruleID", "unknown")),
+            finding.get("File", finding.get("file", "unknown")),
+            finding.get("StartLine", finding.get("startLine")),
+            finding.get("Description", finding.get("description", "")), finding,
+        )
+
+
+def _complexity_rows(f):
+    # Lizard's CSV: NLOC, CCN, tokens, params, length, location, file, function, ...
+    # Only functions over the CCN threshold of 10 are findings.
+    for row in csv.reader(f):
+        if len(row) < 2:
+            continue
+        try:
+            ccn = int(row[1])
+        except ValueError:
+            continue
+        if ccn <= 10:
+            continue
+        line = row[9] if len(row) > 9 else ""
+        yield _row(
+            "finding", "high" if ccn > 15 else "medium", "ccn",
+            row[6] if len(row) > 6 else "unknown", int(line) if line.isdigit() else None,
+            row[7] if len(row) > 7 else "", row,
+        )
+
+
+NORMALIZERS = {
+    "sast": _sast_rows,
+    "dependencies": _dependencies_rows,
+    "dast": _dast_rows,
+    "secrets": _secrets_rows,
+    "complexity": _complexity_rows,
+}
+
+
+class FindingsStore:
+    """SQLite-backed store of the findings of every scanner run."""
+
+    def __init__(self, path=STORE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.executescript(_SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def ingest(self, tool, source=None, recorded_at=None):
+        """Store the findings of *tool*'s report at *source*; return the run id.
+
+        A report unchanged since the tool's latest run is not read again.
+        """
+        source = str(source or SOURCES[tool])
+        label = LABELS[tool]
+        if not os.path.exists(source):
+            raise FileNotFoundError(f"{label} not found at {source}")
+        stat = os.stat(source)
+        latest = self.db.execute(
+            "SELECT id, source, source_size, source_mtime_ns FROM runs WHERE tool = ? ORDER BY id DESC LIMIT 1",
+            (tool,),
+        ).fetchone()
+        if latest is not None and latest[1:] == (source, stat.st_size, stat.st_mtime_ns):
+            return latest[0]
+
+        recorded_at = int(time.time() if recorded_at is None else recorded_at)
+        try:
+            with self.db, open(source, encoding="utf-8", newline="") as f:
+                run_id = self.db.execute(
+                    "INSERT INTO runs (tool, source, source_size, source_mtime_ns, recorded_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (tool, source, stat.st_size, stat.st_mtime_ns, recorded_at),
+                ).lastrowid
+                self.db.executemany(
+                    "INSERT INTO findings (run_id, tool, kind, severity, rule, path, line, title, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        (run_id, tool, *row[:6], json.dumps(row[6], separators=(",", ":")))
+                        for row in NORMALIZERS[tool](f)
+                    ),
+                )
+                self._prune(tool)
+        except Exception as e:
+            raise RuntimeError(f"Failed to read {label}: {e}") from e
+        return run_id
+
+    def _prune(self, tool):
+        """Drop all but the latest KEEP_RUNS runs of *tool*."""
+        old = "SELECT id FROM runs WHERE tool = ? ORDER BY id DESC LIMIT -1 OFFSET ?"
+        self.db.execute(f"DELETE FROM findings WHERE run_id IN ({old})", (tool, KEEP_RUNS))
+        self.db.execute(f"DELETE FROM runs WHERE id IN ({old})", (tool, KEEP_RUNS))
+
+    def latest_run(self, tool):
+        row = self.db.execute("SELECT MAX(id) FROM runs WHERE tool = ?", (tool,)).fetchone()
+        return row[0]
+
+    def documents(self, run_id):
+        """Yield ``(kind, record)`` for every row of the run, in report order.
+
+        *kind* is ``"finding"``, or ``"error"`` for a scan error; *record*
+        is the scanner's own record.
+        """
+        for kind, data in self.db.execute(
+            "SELECT kind, data FROM findings WHERE run_id = ? ORDER BY id", (run_id,)
+        ):
+            yield kind, json.loads(data)
+
+    def query(self, tool=None, severity=None, path=None, rule=None, run_id=None):
+        """Return the matching findings as dicts, most severe first.
+
+        Searches the latest run of every tool, or only *run_id*.
+        """
+        where = ["kind = 'finding'"]
+        params = []
+        if run_id is None:
+            where.append("run_id IN (SELECT MAX(id) FROM runs GROUP BY tool)")
+        else:
+            where.append("run_id = ?")
+            params.append(run_id)
+        for column, value in (("tool", tool), ("severity", severity), ("path", path), ("rule", rule)):
+            if value is not None:
+                where.append(f"{column} = ?")
+                params.append(value)
+        rows = self.db.execute(
+            "SELECT tool, severity, rule, path, line, title FROM findings "
+            f"WHERE {' AND '.join(where)} ORDER BY {_SEVERITY_ORDER}, tool, path, line, id",
+            params,
+        ).fetchall()
+        return [
+            {"tool": t, "severity": s, "rule": r, "path": p, "line": line, "title": title}
+            for t, s, r, p, line, title in rows
+        ]
+
+    def counts(self, run_id=None):
+        """Return ``{tool: {severity: count}}`` for the latest runs, or only *run_id*."""
+        if run_id is None:
+            condition, params = "run_id IN (SELECT MAX(id) FROM runs GROUP BY tool)", ()
+        else:
+            condition, params = "run_id = ?", (run_id,)
+        counts = {}
+        for tool, severity, count in self.db.execute(
+            f"SELECT tool, severity, COUNT(*) FROM findings WHERE kind = 'finding' AND {condition} "
+            "GROUP BY tool, severity",
+            params,
+        ):
+            counts.setdefault(tool, {})[severity] = count
+        return counts
@@ -3,37 +3,17 @@
 
 This script is used both locally (via 'task complexity') and in CI/CD.
 It must reliably generate reports without silently hiding errors.
+
+main() files the functions over the complexity threshold from the CSV
+into the findings store (see findings_store.py) and renders them from
+there.
 """
 
 import os
-import csv
-from datetime import datetime
+import io
 import sys
-import traceback
 
-
-def read_csv_report(csv_path):
-    """Read CSV report and extract high complexity items."""
-    high_complexity_items = []
-    
-    if not os.path.exists(csv_path):
-        raise FileNotFoundError(f"CSV report not found at {csv_path}")
-    
-    try:
-        with open(csv_path, "r") as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if len(row) > 1:
-                    try:
-                        ccn = int(row[1])
-                        if ccn > 10:
-                            high_complexity_items.append(row)
-                    except ValueError:
-                        pass
-    except Exception as e:
-        raise RuntimeError(f"Failed to read CSV report: {e}") from e
-    
-    return high_complexity_items
+from markdown_report import MarkdownReport, cell, table_row
 
 
 def read_raw_report(raw_path):
@@ -65,73 +45,71 @@ def read_raw_report(raw_path):
     return summary_lines
 
 
-def format_summary_section(summary_lines):
-    """Format summary section for markdown."""
+def write_summary_section(report, summary_lines):
+    """Write the Lizard summary as a code block."""
     if not summary_lines:
-        return ""
-    
-    result = "```\n"
-    result += "\n".join(summary_lines[:15])
-    result += "\n```\n\n"
-    return result
+        return
+    report.write("```\n")
+    report.write("\n".join(summary_lines[:15]))
+    report.write("\n```\n\n")
+
 
+def format_item_row(item):
+    """Format a single Lizard CSV row as a markdown table row."""
+    nloc, ccn, tokens, params, length = item[:5]
+    location = item[5].strip('"')
+    return table_row(cell(nloc), cell(ccn), cell(tokens), cell(params), cell(length), f"`{cell(location)}`")
 
-def format_high_complexity_section(high_complexity_items):
-    """Format high complexity items section."""
+
+def write_high_complexity_section(report, high_complexity_items):
+    """Write the high complexity items section."""
     if not high_complexity_items:
-        return "## ✅ Complexity Status\n\nNo high-complexity items found (all CCN ≤ 10)\n\n"
-    
-    result = "## ⚠️ High Complexity Items (CCN > 10)\n\n"
-    result += "| NLOC | CCN | Tokens | Params | Length | Location |\n"
-    result += "|------|-----|--------|--------|--------|----------|\n"
-    
-    for item in high_complexity_items:
-        if len(item) > 5:
-            nloc = item[0]
-            ccn = item[1]
-            tokens = item[2]
-            params = item[3]
-            length = item[4]
-            location = item[5].strip('"') if len(item) > 5 else "unknown"
-            result += f"| {nloc} | {ccn} | {tokens} | {params} | {length} | `{location}` |\n"
-    
-    return result
+        report.heading("✅ Complexity Status")
+        report.paragraph("No high-complexity items found (all CCN ≤ 10)")
+        return
+
+    report.heading("⚠️ High Complexity Items (CCN > 10)")
+    report.table(
+        ["NLOC", "CCN", "Tokens", "Params", "Length", "Location"],
+        (format_item_row(item) for item in high_complexity_items if len(item) > 5),
+    )
+
+
+def write_markdown_report(report, summary_lines, high_complexity_items):
+    """Write the complete markdown report."""
+    report.title("Code Complexity Analysis Report")
+    report.heading("Summary")
+
+    write_summary_section(report, summary_lines)
+    write_high_complexity_section(report, high_complexity_items)
+
+    report.heading("Guidelines")
+    report.lines([
+        "- **Cyclomatic Complexity (CCN)**: Measure of code complexity based on decision points",
+        "  - **Good**: CCN ≤ 10",
+        "  - **Warning**: 10 < CCN ≤ 15",
+        "  - **Critical**: CCN > 15",
+    ])
+    report.lines([
+        "- **Function Length (NLOC)**: Number of lines of code",
+        "  - Target: Keep functions under 50 lines",
+        "  - For this static template, code should be minimal",
+    ])
+    report.paragraph("- **Threshold**: Any function with CCN > 10 should be reviewed and simplified")
+    report.heading("More Information")
+    report.write(
+        "- Generated by [Lizard](http://www.lizard.ws/)\n"
+        "- Reports location: `.complexity-reports/`\n"
+        "  - `complexity-report.md` (this file)\n"
+        "  - `complexity-report.csv` (machine-readable)\n"
+    )
 
 
 def build_markdown_report(summary_lines, high_complexity_items):
     """Build the complete markdown report."""
-    md_content = "# Code Complexity Analysis Report\n\n"
-    md_content += f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    md_content += "## Summary\n\n"
-    
-    md_content += format_summary_section(summary_lines)
-    md_content += format_high_complexity_section(high_complexity_items)
-    
-    md_content += "## Guidelines\n\n"
-    md_content += "- **Cyclomatic Complexity (CCN)**: Measure of code complexity based on decision points\n"
-    md_content += "  - **Good**: CCN ≤ 10\n"
-    md_content += "  - **Warning**: 10 < CCN ≤ 15\n"
-    md_content += "  - **Critical**: CCN > 15\n\n"
-    md_content += "- **Function Length (NLOC)**: Number of lines of code\n"
-    md_content += "  - Target: Keep functions under 50 lines\n"
-    md_content += "  - For this static template, code should be minimal\n\n"
-    md_content += "- **Threshold**: Any function with CCN > 10 should be reviewed and simplified\n\n"
-    md_content += "## More Information\n\n"
-    md_content += "- Generated by [Lizard](http://www.lizard.ws/)\n"
-    md_content += "- Reports location: `.complexity-reports/`\n"
-    md_content += "  - `complexity-report.md` (this file)\n"
-    md_content += "  - `complexity-report.csv` (machine-readable)\n"
-    
-    return md_content
-
-
-def write_report(report_path, content):
-    """Write markdown report to file."""
-    try:
-        with open(report_path, "w") as f:
-            f.write(content)
-    except Exception as e:
-        raise RuntimeError(f"Failed to write markdown report: {e}") from e
+    out = io.StringIO()
+    write_markdown_report(MarkdownReport(out), summary_lines, high_complexity_items)
+    return out.getvalue()
 
 
 def main():
@@ -143,12 +121,16 @@ def main():
     report_path = ".complexity-reports/complexity-report.md"
     
     # Read input files
-    high_complexity_items = read_csv_report(csv_path)
+    from findings_store import FindingsStore  # sqlite3 is slow to import
+
+    with FindingsStore() as store:
+        run_id = store.ingest("complexity", csv_path)
+        high_complexity_items = [item for _, item in store.documents(run_id)]
     summary_lines = read_raw_report(raw_path)
     
     # Generate report
-    report_content = build_markdown_report(summary_lines, high_complexity_items)
-    write_report(report_path, report_content)
+    with MarkdownReport.create(report_path) as report:
+        write_markdown_report(report, summary_lines, high_complexity_items)
     
     print("✅ Markdown report generated successfully")
     return 0
@@ -158,6 +140,8 @@ if __name__ == "__main__":
     try:
         sys.exit(main())
     except Exception as e:
+        import traceback  # only needed on failure; keeps startup fast
+
         print(f"❌ Error generating markdown report: {e}", file=sys.stderr)
         traceback.print_exc(file=sys.stderr)
         sys.exit(1)
@@ -3,13 +3,17 @@
 
 This script is used both locally (via 'task dast') and in CI/CD.
 It must reliably generate reports without silently hiding errors.
+
+main() files the ZAP report into the findings store (see
+findings_store.py) and renders the alerts from there.
 """
 
-import json
+import io
 import os
 import sys
-import traceback
-from datetime import datetime
+
+from markdown_report import MarkdownReport, cell, table_row
+from report_summary import clear_summary, write_summary
 
 
 # ZAP risk code mapping
@@ -27,116 +31,98 @@ RISK_ICONS = {
 }
 
 
-def read_json_report(json_path):
-    """Read OWASP ZAP JSON report and return data."""
-    if not os.path.exists(json_path):
-        raise FileNotFoundError(f"DAST JSON report not found at {json_path}")
-
-    try:
-        with open(json_path, "r") as f:
-            data = json.load(f)
-    except Exception as e:
-        raise RuntimeError(f"Failed to read DAST JSON report: {e}") from e
-
-    return data
-
-
 def collect_alerts(data):
     """Extract all alerts grouped by risk code."""
+    return group_alerts(alert for site in data.get("site", []) for alert in site.get("alerts", []))
+
+
+def group_alerts(alerts):
+    """Group ZAP alerts by risk code."""
     alerts_by_risk = {"3": [], "2": [], "1": [], "0": []}
 
-    for site in data.get("site", []):
-        for alert in site.get("alerts", []):
-            riskcode = str(alert.get("riskcode", "0"))
-            entry = {
-                "name": alert.get("name", alert.get("alert", "unknown")),
-                "riskcode": riskcode,
-                "confidence": alert.get("confidence", "?"),
-                "desc": alert.get("desc", "").replace("\n", " ").strip(),
-                "instances": len(alert.get("instances", [])),
-                "solution": alert.get("solution", "").replace("\n", " ").strip(),
-            }
-            bucket = alerts_by_risk.get(riskcode, alerts_by_risk["0"])
-            bucket.append(entry)
+    for alert in alerts:
+        riskcode = str(alert.get("riskcode", "0"))
+        entry = {
+            "name": alert.get("name", alert.get("alert", "unknown")),
+            "riskcode": riskcode,
+            "confidence": alert.get("confidence", "?"),
+            "desc": alert.get("desc", "").replace("\n", " ").strip(),
+            "instances": len(alert.get("instances", [])),
+            "solution": alert.get("solution", "").replace("\n", " ").strip(),
+        }
+        bucket = alerts_by_risk.get(riskcode, alerts_by_risk["0"])
+        bucket.append(entry)
 
     return alerts_by_risk
 
 
 def format_alert_row(alert):
     """Format a single alert as a markdown table row."""
-    name = alert["name"]
     risk = RISK_LABELS.get(alert["riskcode"], "Unknown")
-    instances = alert["instances"]
-    desc = (alert["desc"][:77] + "...") if len(alert["desc"]) > 80 else alert["desc"]
-    return f"| {name} | {risk} | {instances} | {desc} |"
+    return table_row(cell(alert["name"]), risk, alert["instances"], cell(alert["desc"], 80))
 
 
-def format_alert_section(alerts, section_title, icon):
-    """Format a list of alerts as a markdown section."""
+def write_alert_section(report, alerts, section_title, icon):
+    """Write a list of alerts as a markdown section."""
     if not alerts:
-        return ""
+        return
+    report.heading(f"{icon} {section_title}")
+    report.table(["Alert", "Risk", "Instances", "Description"], (format_alert_row(a) for a in alerts))
 
-    result = f"## {icon} {section_title}\n\n"
-    result += "| Alert | Risk | Instances | Description |\n"
-    result += "|-------|------|-----------|-------------|\n"
-    for alert in alerts:
-        result += format_alert_row(alert) + "\n"
-    result += "\n"
-    return result
 
+def write_markdown_report(report, alerts_by_risk):
+    """Write the complete markdown report for alerts grouped by risk code (see group_alerts()).
 
-def build_markdown_report(data):
-    """Build the complete markdown report from ZAP JSON output."""
-    alerts_by_risk = collect_alerts(data)
-
+    Returns the blocking count (high and medium) and the counts per risk level.
+    """
     high = alerts_by_risk["3"]
     medium = alerts_by_risk["2"]
     low = alerts_by_risk["1"]
     info = alerts_by_risk["0"]
     total = sum(len(v) for v in alerts_by_risk.values())
-    blocking = len(high) + len(medium)
 
-    md_content = "# DAST Analysis Report\n\n"
-    md_content += f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    md_content += "## Summary\n\n"
+    report.title("DAST Analysis Report")
+    report.heading("Summary")
 
     if total == 0:
-        md_content += "## ✅ DAST Status\n\nNo alerts detected.\n\n"
+        report.heading("✅ DAST Status")
+        report.paragraph("No alerts detected.")
     else:
-        md_content += "| Risk Level | Count |\n"
-        md_content += "|------------|-------|\n"
-        md_content += f"| 🔴 High | {len(high)} |\n"
-        md_content += f"| 🟡 Medium | {len(medium)} |\n"
-        md_content += f"| 🔵 Low | {len(low)} |\n"
-        md_content += f"| ℹ️ Informational | {len(info)} |\n"
-        md_content += f"| **Total** | **{total}** |\n\n"
-
-        md_content += format_alert_section(high, "High Risk Alerts", "🔴")
-        md_content += format_alert_section(medium, "Medium Risk Alerts", "🟡")
-        md_content += format_alert_section(low, "Low Risk Alerts", "🔵")
-        md_content += format_alert_section(info, "Informational Alerts", "ℹ️")
-
-    md_content += "## Guidelines\n\n"
-    md_content += "- **High**: Must be addressed before merging\n"
-    md_content += "- **Medium**: Should be reviewed and addressed\n"
-    md_content += "- **Low**: Informational — review when time allows\n"
-    md_content += "- Run `task dast -- <url>` locally to reproduce\n\n"
-    md_content += "## More Information\n\n"
-    md_content += "- Generated by [OWASP ZAP](https://www.zaproxy.org/)\n"
-    md_content += "- Reports location: `.dast-reports/`\n"
-    md_content += "  - `dast-report.md` (this file)\n"
-    md_content += "  - `dast-report.json` (machine-readable)\n"
-
-    return md_content, blocking
-
-
-def write_report(report_path, content):
-    """Write markdown report to file."""
-    try:
-        with open(report_path, "w") as f:
-            f.write(content)
-    except Exception as e:
-        raise RuntimeError(f"Failed to write markdown report: {e}") from e
+        report.table(["Risk Level", "Count"], [
+            table_row("🔴 High", len(high)),
+            table_row("🟡 Medium", len(medium)),
+            table_row("🔵 Low", len(low)),
+            table_row("ℹ️ Informational", len(info)),
+            table_row("**Total**", f"**{total}**"),
+        ])
+        write_alert_section(report, high, "High Risk Alerts", "🔴")
+        write_alert_section(report, medium, "Medium Risk Alerts", "🟡")
+        write_alert_section(report, low, "Low Risk Alerts", "🔵")
+        write_alert_section(report, info, "Informational Alerts", "ℹ️")
+
+    report.heading("Guidelines")
+    report.lines([
+        "- **High**: Must be addressed before merging",
+        "- **Medium**: Should be reviewed and addressed",
+        "- **Low**: Informational — review when time allows",
+        "- Run `task dast -- <url>` locally to reproduce",
+    ])
+    report.heading("More Information")
+    report.write(
+        "- Generated by [OWASP ZAP](https://www.zaproxy.org/)\n"
+        "- Reports location: `.dast-reports/`\n"
+        "  - `dast-report.md` (this file)\n"
+        "  - `dast-report.json` (machine-readable)\n"
+    )
+    counts = {"high": len(high), "medium": len(medium), "low": len(low), "informational": len(info), "total": total}
+    return len(high) + len(medium), counts
+
+
+def build_markdown_report(data):
+    """Build the complete markdown report from ZAP JSON output."""
+    out = io.StringIO()
+    blocking, _ = write_markdown_report(MarkdownReport(out), collect_alerts(data))
+    return out.getvalue(), blocking
 
 
 def main():
@@ -145,10 +131,16 @@ def main():
 
     json_path = ".dast-reports/dast-report.json"
     report_path = ".dast-reports/dast-report.md"
+    clear_summary(report_path)
 
-    data = read_json_report(json_path)
-    report_content, blocking_count = build_markdown_report(data)
-    write_report(report_path, report_content)
+    from findings_store import FindingsStore  # sqlite3 is slow to import
+
+    with FindingsStore() as store:
+        run_id = store.ingest("dast", json_path)
+        alerts_by_risk = group_alerts(alert for _, alert in store.documents(run_id))
+    with MarkdownReport.create(report_path) as report:
+        blocking, counts = write_markdown_report(report, alerts_by_risk)
+    write_summary(report_path, "dast", blocking, counts)
 
     print("✅ Markdown report generated successfully")
     return 0
@@ -158,6 +150,8 @@ if __name__ == "__main__":
     try:
         sys.exit(main())
     except Exception as e:
+        import traceback  # only needed on failure; keeps startup fast
+
         print(f"❌ Error generating markdown report: {e}", file=sys.stderr)
         traceback.print_exc(file=sys.stderr)
         sys.exit(1)
@@ -3,131 +3,127 @@
 
 This script is used both locally (via 'task dependencies') and in CI/CD.
 It must reliably generate reports without silently hiding errors.
+
+main() files the Trivy report into the findings store (see
+findings_store.py) and renders the vulnerabilities from there.
 """
 
-import json
+import io
 import os
 import sys
-import traceback
-from datetime import datetime
-
-
-def read_json_report(json_path):
-    """Read Trivy JSON report and return data."""
-    if not os.path.exists(json_path):
-        raise FileNotFoundError(f"Dependencies JSON report not found at {json_path}")
-
-    try:
-        with open(json_path, "r") as f:
-            data = json.load(f)
-    except Exception as e:
-        raise RuntimeError(f"Failed to read dependencies JSON report: {e}") from e
 
-    return data
+from markdown_report import MarkdownReport, cell, table_row
+from report_summary import clear_summary, write_summary
 
 
 def collect_vulnerabilities(data):
     """Extract all vulnerabilities from Trivy results, grouped by severity."""
+    return group_vulnerabilities(
+        dict(vuln, Target=result.get("Target", "unknown"))
+        for result in data.get("Results", [])
+        for vuln in result.get("Vulnerabilities", [])
+    )
+
+
+def group_vulnerabilities(vulns):
+    """Group Trivy vulnerabilities, each carrying its result's ``Target``, by severity."""
     critical = []
     high = []
     medium = []
     low = []
 
-    for result in data.get("Results", []):
-        target = result.get("Target", "unknown")
-        for vuln in result.get("Vulnerabilities", []):
-            entry = {
-                "id": vuln.get("VulnerabilityID", "unknown"),
-                "pkg": vuln.get("PkgName", "unknown"),
-                "installed": vuln.get("InstalledVersion", "?"),
-                "fixed": vuln.get("FixedVersion", "none"),
-                "severity": vuln.get("Severity", "UNKNOWN"),
-                "title": vuln.get("Title", ""),
-                "target": target,
-            }
-            sev = entry["severity"].upper()
-            if sev == "CRITICAL":
-                critical.append(entry)
-            elif sev == "HIGH":
-                high.append(entry)
-            elif sev == "MEDIUM":
-                medium.append(entry)
-            else:
-                low.append(entry)
+    for vuln in vulns:
+        entry = {
+            "id": vuln.get("VulnerabilityID", "unknown"),
+            "pkg": vuln.get("PkgName", "unknown"),
+            "installed": vuln.get("InstalledVersion", "?"),
+            "fixed": vuln.get("FixedVersion", "none"),
+            "severity": vuln.get("Severity", "UNKNOWN"),
+            "title": vuln.get("Title", ""),
+            "target": vuln.get("Target", "unknown"),
+        }
+        sev = entry["severity"].upper()
+        if sev == "CRITICAL":
+            critical.append(entry)
+        elif sev == "HIGH":
+            high.append(entry)
+        elif sev == "MEDIUM":
+            medium.append(entry)
+        else:
+            low.append(entry)
 
     return critical, high, medium, low
 
 
 def format_vuln_row(v):
     """Format a single vulnerability as a markdown table row."""
-    title = (v["title"][:57] + "...") if len(v["title"]) > 60 else v["title"]
-    return (
-        f"| {v['id']} | `{v['pkg']}` | {v['installed']} | {v['fixed']} "
-        f"| {v['severity']} | {title} |"
+    return table_row(
+        cell(v["id"]), f"`{cell(v['pkg'])}`", cell(v["installed"]), cell(v["fixed"]),
+        cell(v["severity"]), cell(v["title"], 60),
     )
 
 
-def format_vuln_section(vulns, section_title, icon):
-    """Format a list of vulnerabilities as a markdown section."""
+def write_vuln_section(report, vulns, section_title, icon):
+    """Write a list of vulnerabilities as a markdown section."""
     if not vulns:
-        return ""
+        return
+    report.heading(f"{icon} {section_title}")
+    report.table(
+        ["CVE", "Package", "Installed", "Fixed In", "Severity", "Title"],
+        (format_vuln_row(v) for v in vulns),
+    )
 
-    result = f"## {icon} {section_title}\n\n"
-    result += "| CVE | Package | Installed | Fixed In | Severity | Title |\n"
-    result += "|-----|---------|-----------|----------|----------|-------|\n"
-    for v in vulns:
-        result += format_vuln_row(v) + "\n"
-    result += "\n"
-    return result
 
+def write_markdown_report(report, vulnerabilities):
+    """Write the complete markdown report for grouped vulnerabilities (see group_vulnerabilities()).
 
-def build_markdown_report(data):
-    """Build the complete markdown report from Trivy JSON output."""
-    critical, high, medium, low = collect_vulnerabilities(data)
+    Returns the blocking count (critical and high) and the counts per severity.
+    """
+    critical, high, medium, low = vulnerabilities
     total = len(critical) + len(high) + len(medium) + len(low)
-    blocking = len(critical) + len(high)
 
-    md_content = "# Dependency Vulnerability Report\n\n"
-    md_content += f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    md_content += "## Summary\n\n"
+    report.title("Dependency Vulnerability Report")
+    report.heading("Summary")
 
     if total == 0:
-        md_content += "## ✅ Dependencies Status\n\nNo vulnerabilities detected.\n\n"
+        report.heading("✅ Dependencies Status")
+        report.paragraph("No vulnerabilities detected.")
     else:
-        md_content += "| Severity | Count |\n"
-        md_content += "|----------|-------|\n"
-        md_content += f"| 🔴 Critical | {len(critical)} |\n"
-        md_content += f"| 🟠 High | {len(high)} |\n"
-        md_content += f"| 🟡 Medium | {len(medium)} |\n"
-        md_content += f"| 🔵 Low | {len(low)} |\n"
-        md_content += f"| **Total** | **{total}** |\n\n"
-
-        md_content += format_vuln_section(critical, "Critical Vulnerabilities", "🔴")
-        md_content += format_vuln_section(high, "High Vulnerabilities", "🟠")
-        md_content += format_vuln_section(medium, "Medium Vulnerabilities", "🟡")
-        md_content += format_vuln_section(low, "Low Vulnerabilities", "🔵")
-
-    md_content += "## Guidelines\n\n"
-    md_content += "- **Critical/High**: Update or replace the vulnerable package before merging\n"
-    md_content += "- **Medium**: Review and plan remediation\n"
-    md_content += "- **Low**: Informational — update when convenient\n"
-    md_content += "- Run `task dependencies` locally to reproduce\n\n"
-    md_content += "## More Information\n\n"
-    md_content += "- Generated by [Trivy](https://trivy.dev/)\n"
-    md_content += "- Reports location: `.dependencies-reports/`\n"
-    md_content += "  - `dependencies-report.md` (this file)\n"
-    md_content += "  - `dependencies-report.json` (machine-readable)\n"
-
-    return md_content, blocking
-
-
-def write_report(report_path, content):
-    """Write markdown report to file."""
-    try:
-        with open(report_path, "w") as f:
-            f.write(content)
-    except Exception as e:
-        raise RuntimeError(f"Failed to write markdown report: {e}") from e
+        report.table(["Severity", "Count"], [
+            table_row("🔴 Critical", len(critical)),
+            table_row("🟠 High", len(high)),
+            table_row("🟡 Medium", len(medium)),
+            table_row("🔵 Low", len(low)),
+            table_row("**Total**", f"**{total}**"),
+        ])
+        write_vuln_section(report, critical, "Critical Vulnerabilities", "🔴")
+        write_vuln_section(report, high, "High Vulnerabilities", "🟠")
+        write_vuln_section(report, medium, "Medium Vulnerabilities", "🟡")
+        write_vuln_section(report, low, "Low Vulnerabilities", "🔵")
+
+    report.heading("Guidelines")
+    report.lines([
+        "- **Critical/High**: Update or replace the vulnerable package before merging",
+        "- **Medium**: Review and plan remediation",
+        "- **Low**: Informational — update when convenient",
+        "- Run `task dependencies` locally to reproduce",
+    ])
+    report.heading("More Information")
+    report.write(
+        "- Generated by [Trivy](https://trivy.dev/)\n"
+        "- Reports location: `.dependencies-reports/`\n"
+        "  - `dependencies-report.md` (this file)\n"
+        "  - `dependencies-report.json` (machine-readable)\n"
+    )
+    counts = {"critical": len(critical), "high": len(high), "medium": len(medium), "low": len(low), "total": total}
+    return len(critical) + len(high), counts
+
+
+def build_markdown_report(data):
+    """Build the complete markdown report from Trivy JSON output."""
+    out = io.StringIO()
+    blocking, _ = write_markdown_report(MarkdownReport(out), collect_vulnerabilities(data))
+    return out.getvalue(), blocking
 
 
 def main():
@@ -136,10 +132,16 @@ def main():
 
     json_path = ".dependencies-reports/dependencies-report.json"
     report_path = ".dependencies-reports/dependencies-report.md"
+    clear_summary(report_path)
 
-    data = read_json_report(json_path)
-    report_content, blocking_count = build_markdown_report(data)
-    write_report(report_path, report_content)
+    from findings_store import FindingsStore  # sqlite3 is slow to import
+
+    with FindingsStore() as store:
+        run_id = store.ingest("dependencies", json_path)
+        vulnerabilities = group_vulnerabilities(vuln for _, vuln in store.documents(run_id))
+    with MarkdownReport.create(report_path) as report:
+        blocking, counts = write_markdown_report(report, vulnerabilities)
+    write_summary(report_path, "dependencies", blocking, counts)
 
     print("✅ Markdown report generated successfully")
     return 0
@@ -149,6 +151,8 @@ if __name__ == "__main__":
     try:
         sys.exit(main())
     except Exception as e:
+        import traceback  # only needed on failure; keeps startup fast
+
         print(f"❌ Error generating markdown report: {e}", file=sys.stderr)
         traceback.print_exc(file=sys.stderr)
         sys.exit(1)
@@ -2,79 +2,113 @@
 
 """Generate a Markdown documentation accuracy report from JSON output.
 
-Reads .docs-reports/docs-accuracy-report.json (produced by check-docs-accuracy.py)
+Reads .docs-reports/docs-accuracy-report.jsonl (from check-docs-accuracy.py
+--format jsonl) when present, otherwise .docs-reports/docs-accuracy-report.json,
 and writes .docs-reports/docs-accuracy-report.md — a human-readable summary.
+
+The JSON Lines report is consumed one issue at a time: each issue is
+formatted straight away and spooled to a temporary file per issue type,
+so memory stays flat however long the report is.
 """
 
 import json
 import sys
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 
+from jsonl_report import JsonlReportReader
 
-def main():
-    json_path = Path(".docs-reports/docs-accuracy-report.json")
-    if not json_path.exists():
-        print("❌ docs-accuracy-report.json not found — run check-docs-accuracy.py first")
-        sys.exit(1)
+JSON_PATH = Path(".docs-reports/docs-accuracy-report.json")
+JSONL_PATH = Path(".docs-reports/docs-accuracy-report.jsonl")
 
-    data = json.loads(json_path.read_text())
-    issues = data.get("issues", [])
-    is_clean = data.get("clean", True)
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+TYPE_LABELS = {
+    "broken_link": "Broken Internal Links",
+    "broken_anchor": "Broken Heading Anchors",
+    "stale_task_ref": "Stale Taskfile References",
+    "stale_workflow_ref": "Stale Workflow References",
+    "stale_file_ref": "Possible Stale File References",
+}
 
-    lines = [
-        "# 🔎 Documentation Accuracy Report",
-        "",
-        f"**Generated:** {now}",
-        "",
-        "## Status",
-        "",
-    ]
-
-    if is_clean:
-        lines.append("✅ All documentation accuracy checks passed — no stale references detected.")
-    else:
-        lines.append(f"⚠️ Found **{len(issues)}** accuracy issue(s) that may need attention.")
 
-    lines += ["", "## Issues", ""]
+def format_issue(issue):
+    return f"- **{issue['file']}** (line {issue['line']}): {issue['message']}\n"
+
+
+def read_issues():
+    """Return ``(issues, summary)``: an iterator of issues and a summary getter.
+
+    The summary is only known once the issues have been consumed, so it is
+    returned as a callable. It yields None for a JSON Lines report with no
+    summary line, i.e. one whose check did not finish.
+    """
+    if JSONL_PATH.exists():
+        reader = JsonlReportReader(JSONL_PATH)
+        return reader.records(), lambda: reader.summary
+    data = json.loads(JSON_PATH.read_text())
+    summary = {"issue_count": len(data.get("issues", [])), "clean": data.get("clean", True)}
+    return iter(data.get("issues", [])), lambda: summary
+
 
-    if not issues:
-        lines.append("No issues found.")
+def spool_by_type(issues):
+    """Format *issues* into one temporary file per type, in first-seen order."""
+    spools = {}
+    for issue in issues:
+        spool = spools.get(issue["type"])
+        if spool is None:
+            spool = spools[issue["type"]] = tempfile.TemporaryFile("w+", encoding="utf-8")
+        spool.write(format_issue(issue))
+    return spools
+
+
+def write_report(out, spools, summary, now):
+    out.write("# 🔎 Documentation Accuracy Report\n\n")
+    out.write(f"**Generated:** {now}\n\n")
+    out.write("## Status\n\n")
+
+    if summary is None:
+        out.write("⚠️ The accuracy check did not finish — the issues below are incomplete.\n")
+    elif summary.get("clean", True):
+        out.write("✅ All documentation accuracy checks passed — no stale references detected.\n")
     else:
-        # Group by type
-        by_type = {}
-        for issue in issues:
-            by_type.setdefault(issue["type"], []).append(issue)
-
-        type_labels = {
-            "broken_link": "Broken Internal Links",
-            "stale_task_ref": "Stale Taskfile References",
-            "stale_workflow_ref": "Stale Workflow References",
-            "stale_file_ref": "Possible Stale File References",
-        }
-
-        for itype, group in by_type.items():
-            label = type_labels.get(itype, itype)
-            lines.append(f"### {label}")
-            lines.append("")
-            for item in group:
-                lines.append(f"- **{item['file']}** (line {item['line']}): {item['message']}")
-            lines.append("")
-
-    lines += [
-        "## How to Fix",
-        "",
-        "1. Review each issue above.",
-        "2. Update the referenced docs to match the current project state.",
-        "3. Run `task hygiene:docs-accuracy` locally to verify fixes.",
-        "",
-    ]
-
-    report_text = "\n".join(lines) + "\n"
-    out = Path(".docs-reports/docs-accuracy-report.md")
-    out.write_text(report_text)
-    print(f"📄 Report written to {out}")
+        out.write(f"⚠️ Found **{summary['issue_count']}** accuracy issue(s) that may need attention.\n")
+
+    out.write("\n## Issues\n\n")
+    if not spools:
+        out.write("No issues found.\n")
+    for itype, spool in spools.items():
+        out.write(f"### {TYPE_LABELS.get(itype, itype)}\n\n")
+        spool.seek(0)
+        for line in spool:
+            out.write(line)
+        out.write("\n")
+
+    out.write(
+        "## How to Fix\n"
+        "\n"
+        "1. Review each issue above.\n"
+        "2. Update the referenced docs to match the current project state.\n"
+        "3. Run `task hygiene:docs-accuracy` locally to verify fixes.\n"
+        "\n"
+    )
+
+
+def main():
+    if not JSONL_PATH.exists() and not JSON_PATH.exists():
+        print("❌ docs-accuracy-report.json not found — run check-docs-accuracy.py first")
+        sys.exit(1)
+
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    issues, summary = read_issues()
+    spools = spool_by_type(issues)
+    out_path = Path(".docs-reports/docs-accuracy-report.md")
+    try:
+        with open(out_path, "w", encoding="utf-8") as out:
+            write_report(out, spools, summary(), now)
+    finally:
+        for spool in spools.values():
+            spool.close()
+    print(f"📄 Report written to {out_path}")
 
 
 if __name__ == "__main__":
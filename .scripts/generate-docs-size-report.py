@@ -3,69 +3,104 @@
 """
 Documentation Size Report Generator
 
-Generates a formatted markdown report from documentation size analysis.
+Generates a formatted markdown report from the JSON written by
+check-docs-size.py (.docs-reports/docs-size-report.json).
 Replicates the GitHub Actions workflow report generation locally.
 """
 
-import argparse
+import json
 import sys
 from pathlib import Path
 from datetime import datetime
 
-
-def main():
-    parser = argparse.ArgumentParser(
-        description="Generate documentation size report"
+JSON_PATH = Path(".docs-reports/docs-size-report.json")
+MARKDOWN_PATH = Path(".docs-reports/docs-size-report.md")
+
+
+def _format_token_tables(data):
+    """Format per-category and per-file token estimates as markdown tables."""
+    content = "## Estimated Tokens by Category\n\n"
+    content += "| Category | Files | Tokens |\n|----------|------:|-------:|\n"
+    for c in data.get("tokens_by_category", []):
+        name = c["category"] if c["category"].startswith("(") else f"{c['category']}/"
+        content += f"| {name} | {c['files']} | {c['tokens']:,} |\n"
+    content += "\n## Estimated Tokens by File\n\n"
+    content += "| File | Size (KB) | Words | Tokens |\n|------|----------:|------:|-------:|\n"
+    for f in data.get("files", []):
+        content += f"| `{f['path']}` | {f['size_kb']} | {f['words']:,} | {f['tokens']:,} |\n"
+    return content + "\n"
+
+
+def _format_trend(trend):
+    """Format the growth rate and fastest-growing files from the size history."""
+    growth = trend.get("growth")
+    content = "## Growth Trend\n\n"
+    if growth is None:
+        return content + "Not enough history yet — the trend starts with the next recorded run.\n\n"
+    content += (
+        f"Over the last {growth['elapsed_days']:g} days "
+        f"(since `{growth['baseline_commit'][:7]}`, window {growth['window_days']} days):\n\n"
     )
-    parser.add_argument("--file-count", type=int, required=True)
-    parser.add_argument("--total-size-kb", type=int, required=True)
-    parser.add_argument("--estimated-tokens", type=int, required=True)
-    parser.add_argument("--avg-size-kb", type=int, required=True)
-    parser.add_argument("--largest-files", type=str, required=True)
-    parser.add_argument("--has-alerts", type=str, required=True)
-    parser.add_argument("--alerts", type=str, default="")
-
-    args = parser.parse_args()
+    content += f"- **Size Growth:** {growth['bytes_per_day'] / 1024:+.2f} KB/day"
+    content += f" ({growth['total_bytes_change'] / 1024:+.1f} KB, {growth['file_count_change']:+d} files)\n"
+    content += f"- **Token Growth:** {growth['tokens_per_day']:+.0f} tokens/day\n"
+    if growth["days_until_limit"] is not None:
+        content += f"- **Max Total Size Reached:** in ~{growth['days_until_limit']:.0f} days at this rate\n"
+    content += "\n## Fastest-Growing Files\n\n"
+    if not trend.get("fastest_growing"):
+        return content + "No file grew over this window.\n\n"
+    content += "| File | Size (KB) | Growth (KB) |\n|------|----------:|------------:|\n"
+    for f in trend["fastest_growing"]:
+        note = " (new)" if f["new"] else ""
+        content += f"| `{f['path']}`{note} | {f['bytes'] // 1024} | +{f['delta_bytes'] / 1024:.1f} |\n"
+    return content + "\n"
+
+
+def generate_markdown_report(data):
+    """Convert the JSON size report to markdown."""
+    largest = "\n".join(f"{f['path']} ({f['size_kb']} KB)" for f in data["largest_files"])
+    thresholds = data["thresholds"]
+    has_alerts = not data["within_limits"]
 
-    # Parse has_alerts boolean
-    has_alerts = args.has_alerts.lower() in ("true", "1", "yes")
-
-    # Create report
     report = f"""# 📚 Documentation Size Report
 
 **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
 
 ## Summary
 
-- **Total Files:** {args.file_count}
-- **Total Size:** {args.total_size_kb} KB
-- **Estimated Tokens:** ~{args.estimated_tokens}
-- **Average File Size:** {args.avg_size_kb} KB
+- **Total Files:** {data['file_count']}
+- **Total Size:** {data['total_size_kb']} KB
+- **Estimated Tokens:** ~{data['estimated_tokens']}
+- **Average File Size:** {data['average_size_kb']} KB
 
 ## Largest Files
 
 ```
-{args.largest_files}
+{largest}
 ```
 
-## Status
+{_format_token_tables(data)}{_format_trend(data["trend"]) if "trend" in data else ""}## Status
 
 {("❌ Documentation size exceeds thresholds!" if has_alerts else "✅ Documentation size within acceptable limits")}
 
 """
 
-    if has_alerts and args.alerts:
-        report += f"""### Alerts
-
-{args.alerts}
-
-"""
+    if has_alerts:
+        report += "### Alerts\n\n"
+        for alert in data["alerts"]:
+            report += f"- ⚠️ {alert}\n"
+        for f in data["oversized_files"]:
+            report += f"  - `{f['path']}` ({f['size_kb']} KB)\n"
+        for f in data.get("wordy_files", []):
+            report += f"  - `{f['path']}` ({f['words']} words)\n"
+        report += "\n"
 
     report += f"""## Thresholds
 
-- **Max Total Size:** 150 KB
-- **Max File Size:** 20 KB
-- **Max File Count:** 15
+- **Max Total Size:** {thresholds['max_total_size_kb']} KB
+- **Max File Size:** {thresholds['max_file_size_kb']} KB
+- **Max File Count:** {thresholds['max_files']}
+- **Max Words per File:** {thresholds.get('max_words', 2500)}
 
 ## Recommendations
 
@@ -79,15 +114,22 @@ If thresholds are exceeded:
 
 *This report was generated by the Documentation Size Monitor.*
 """
+    return report
 
-    # Write report
-    report_dir = Path(".docs-reports")
-    report_dir.mkdir(exist_ok=True)
 
-    report_file = report_dir / "docs-size-report.md"
-    report_file.write_text(report)
-
-    print(f"✅ Report generated: {report_file}")
+def main():
+    if not JSON_PATH.exists():
+        print(f"❌ {JSON_PATH.name} not found — run check-docs-size.py first")
+        sys.exit(1)
+
+    data = json.loads(JSON_PATH.read_text())
+    MARKDOWN_PATH.write_text(generate_markdown_report(data))
+
+    print(f"✅ Report generated: {MARKDOWN_PATH}")
+    print("📁 Reports saved to: .docs-reports/")
+    print("   • docs-size-report.md (human-readable)")
+    print("   • docs-size-report.json (machine-readable)")
+    print()
 
 
 if __name__ == "__main__":
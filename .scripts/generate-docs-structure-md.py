@@ -3,8 +3,8 @@
 """Generate a Markdown documentation structure report from JSON output.
 
 This script is used both locally (via 'task hygiene:docs-structure') and in CI/CD.
-Reads the JSON report generated by check-docs-structure.py and creates a
-human-readable markdown report.
+Reads the JSON (or JSON Lines) report generated by check-docs-structure.py
+and creates a human-readable markdown report.
 """
 
 import json
@@ -13,6 +13,8 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+from jsonl_report import JsonlReportReader
+
 
 def read_json_report(json_path):
     """Read documentation structure JSON report."""
@@ -28,6 +30,15 @@ def read_json_report(json_path):
     return data
 
 
+def read_jsonl_report(jsonl_path):
+    """Read a JSON Lines structure report into the shape of the JSON report."""
+    reader = JsonlReportReader(jsonl_path)
+    violations = list(reader.records())
+    if reader.summary is None:
+        raise RuntimeError(f"{jsonl_path} has no summary line — the check did not finish")
+    return {"violations": violations, **reader.summary}
+
+
 def _format_violations_content(violations):
     """Format violations into markdown sections grouped by type."""
     content = f"Found **{len(violations)}** violation(s):\n\n"
@@ -49,7 +60,8 @@ def _format_violations_content(violations):
         if vtype in by_type:
             content += header
             for v in by_type[vtype]:
-                content += f"- {v['message']}\n"
+                declared = f" (declared in `docs/index.md` line {v['index_line']})" if "index_line" in v else ""
+                content += f"- {v['message']}{declared}\n"
                 if note:
                     content += note
             content += "\n"
@@ -130,13 +142,17 @@ The following categories are defined in `docs/index.md`:
 def main():
     try:
         json_path = ".docs-reports/docs-structure-report.json"
+        jsonl_path = ".docs-reports/docs-structure-report.jsonl"
         markdown_path = ".docs-reports/docs-structure-report.md"
         
         # Ensure directory exists
         Path(".docs-reports").mkdir(exist_ok=True)
         
-        # Read JSON report
-        data = read_json_report(json_path)
+        # Read JSON report (or the JSON Lines report from --format jsonl)
+        if os.path.exists(jsonl_path):
+            data = read_jsonl_report(jsonl_path)
+        else:
+            data = read_json_report(json_path)
         
         # Generate markdown
         markdown = generate_markdown_report(data)
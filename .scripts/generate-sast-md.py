@@ -3,27 +3,57 @@
 
 This script is used both locally (via 'task sast') and in CI/CD.
 It must reliably generate reports without silently hiding errors.
+
+Full-history scans can produce Semgrep reports of hundreds of megabytes,
+so main() files the report into the findings store (see
+findings_store.py), which streams it one finding at a time, and reads
+the findings back from there one by one. Table rows are rendered as
+findings arrive and spooled to temporary files until the summary counts
+are known, which keeps peak memory bounded regardless of report size
+while producing the same report as build_markdown_report().
+
+A report is also kept under a byte budget (--max-bytes) so it still fits
+a PR comment: above it, the report shows counts per rule and per path
+for the top offenders, and every finding moves to numbered overflow
+pages with an index in .sast-reports/sast-findings/.
 """
 
-import json
+import heapq
+import io
 import os
 import sys
-import traceback
-from datetime import datetime
-
-
-def read_json_report(json_path):
-    """Read Semgrep JSON report and return findings."""
-    if not os.path.exists(json_path):
-        raise FileNotFoundError(f"SAST JSON report not found at {json_path}")
-
-    try:
-        with open(json_path, "r") as f:
-            data = json.load(f)
-    except Exception as e:
-        raise RuntimeError(f"Failed to read SAST JSON report: {e}") from e
 
-    return data
+from markdown_report import MarkdownReport, PagedTables, cell, clear_pages, table_header, table_row
+from report_summary import clear_summary, write_summary
+from sast_baseline import BASELINE_PATH, SastBaseline, SourceLines, fingerprint
+
+# Rendered rows stay in memory up to this size, then spill to disk.
+SPOOL_MAX_BYTES = 1 << 20
+
+# GitHub rejects PR comments over 65,536 characters; the workflow adds its own text around the report.
+DEFAULT_MAX_BYTES = 60_000
+DEFAULT_TOP_N = 10
+OVERFLOW_DIR = ".sast-reports/sast-findings"
+
+FINDING_HEADERS = ["Rule", "Severity", "Location", "Message"]
+
+GUIDELINES = (
+    "## Guidelines\n\n"
+    "- **Errors**: Must be reviewed and addressed before merging\n"
+    "- **Warnings**: Should be reviewed; may indicate potential issues\n"
+    "- Run `task sast` locally to reproduce findings\n\n"
+    "## Limitations\n\n"
+    "This scan uses **Semgrep OSS** (open-source version). The following enterprise features are not available:\n\n"
+    "- ✘ **Semgrep Code (SAST)** - Paid feature with advanced security rules\n"
+    "- ✘ **Semgrep Supply Chain (SCA)** - Paid feature for dependency vulnerability detection\n\n"
+    "To enable these features, [register for a free Semgrep account](https://semgrep.dev/signup) and authenticate with `semgrep login`.\n\n"
+    "## More Information\n\n"
+    "- Generated by [Semgrep](https://semgrep.dev/) (OSS Edition)\n"
+    "- Reports location: `.sast-reports/`\n"
+    "  - `sast-report.md` (this file)\n"
+    "  - `sast-report.json` (machine-readable)\n"
+    "- Learn more: [Semgrep Tiers and Pricing](https://semgrep.dev/pricing)\n"
+)
 
 
 def categorize_findings(results):
@@ -46,25 +76,10 @@ def format_finding_row(finding):
     check_id = finding.get("check_id", "unknown")
     path = finding.get("path", "unknown")
     start_line = finding.get("start", {}).get("line", "?")
-    message = finding.get("extra", {}).get("message", "").replace("\n", " ").strip()
+    message = finding.get("extra", {}).get("message", "")
     severity = finding.get("extra", {}).get("severity", "unknown")
-    location = f"`{path}:{start_line}`"
-    truncated = (message[:77] + "...") if len(message) > 80 else message
-    return f"| {check_id} | {severity} | {location} | {truncated} |"
-
-
-def format_findings_section(findings, section_title, icon):
-    """Format a list of findings as a markdown section."""
-    if not findings:
-        return ""
-
-    result = f"## {icon} {section_title}\n\n"
-    result += "| Rule | Severity | Location | Message |\n"
-    result += "|------|----------|----------|---------|\n"
-    for finding in findings:
-        result += format_finding_row(finding) + "\n"
-    result += "\n"
-    return result
+    location = f"`{cell(path)}:{cell(start_line)}`"
+    return table_row(cell(check_id), cell(severity), location, cell(message, 80))
 
 
 def _collect_parsing_errors(errors):
@@ -88,98 +103,432 @@ def format_scan_errors_explanation(errors):
     """Format explanation of scan errors and parsing issues."""
     if not errors:
         return ""
+    out = io.StringIO()
+    messages = io.StringIO("".join(_format_error_message(i, error) for i, error in enumerate(errors, 1)))
+    write_scan_errors_explanation(MarkdownReport(out), len(errors), _collect_parsing_errors(errors), messages)
+    return out.getvalue()
+
+
+def _format_error_message(index, error):
+    msg = (error.get("message", "Unknown error").splitlines() or [""])[0]
+    return f"{index}. {msg}\n"
 
-    result = "### 📋 Scan Errors Explanation\n\n"
 
-    parsing_error_files = _collect_parsing_errors(errors)
+def write_scan_errors_explanation(report, error_count, parsing_error_files, messages, limit=None):
+    """Write the scan errors explanation; *messages* is a file of numbered error messages.
+
+    With *limit*, at most that many files, lines per file and messages are listed.
+    """
+    report.heading("📋 Scan Errors Explanation", level=3)
 
     if parsing_error_files:
-        result += "The " + str(len(errors)) + " warning(s) are **parsing errors in YAML workflow files**, not security issues:\n\n"
-        for path, lines in sorted(parsing_error_files.items()):
-            result += f"- `{path}` (line(s): {', '.join(map(str, lines))})\n"
-        result += "\n"
-        result += "**Why**: Semgrep's YAML analyzer attempts to parse embedded bash scripts in `run:` blocks. "
-        result += "The bash code contains special characters and operators (pipes, redirects) that don't parse as valid YAML syntax.\n\n"
-        result += "**Is this safe to ignore?** ✅ **Yes.** These are only debug/logging scripts—not production code. "
-        result += "The bash syntax is valid and the workflows execute correctly. The SAST scan itself completed successfully with valid results.\n\n"
+        report.paragraph(
+            f"The {error_count} warning(s) are **parsing errors in YAML workflow files**, not security issues:"
+        )
+        files = sorted(parsing_error_files.items())
+        if limit is None:
+            report.lines(f"- `{path}` (line(s): {', '.join(map(str, lines))})" for path, lines in files)
+        else:
+            report.lines(_limited((
+                f"- `{path}` (line(s): {', '.join(map(str, lines[:limit]))}{', …' if len(lines) > limit else ''})"
+                for path, lines in files[:limit]
+            ), len(files), limit, "file(s)"))
+        report.paragraph(
+            "**Why**: Semgrep's YAML analyzer attempts to parse embedded bash scripts in `run:` blocks. "
+            "The bash code contains special characters and operators (pipes, redirects) that don't parse as valid YAML syntax."
+        )
+        report.paragraph(
+            "**Is this safe to ignore?** ✅ **Yes.** These are only debug/logging scripts—not production code. "
+            "The bash syntax is valid and the workflows execute correctly. The SAST scan itself completed successfully with valid results."
+        )
     else:
-        result += f"Semgrep reported {len(errors)} error(s) during scanning:\n\n"
-        for i, error in enumerate(errors, 1):
-            msg = error.get("message", "Unknown error").split('\n')[0]
-            result += f"{i}. {msg}\n"
-        result += "\n"
+        report.paragraph(f"Semgrep reported {error_count} error(s) during scanning:")
+        messages.seek(0)
+        if limit is None:
+            import shutil
 
-    return result
+            shutil.copyfileobj(messages, report)
+        else:
+            for line in _limited((line.rstrip("\n") for line, _ in zip(messages, range(limit))),
+                                 error_count, limit, "error(s)"):
+                report.write(f"{line}\n")
+        report.write("\n")
+
+
+def _limited(lines, total, limit, noun):
+    """Yield *lines*, then a note on how many of *total* were left out by *limit*."""
+    yield from lines
+    if total > limit:
+        yield f"- … and {total - limit} more {noun}"
+
+
+def _spool():
+    import tempfile
+
+    return tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES, mode="w+", encoding="utf-8", newline="")
+
+
+class _Rows:
+    """Rendered table rows spooled to a temporary file, with their count and UTF-8 size."""
+
+    def __init__(self):
+        self._file = _spool()
+        self.count = 0
+        self.size = 0
+
+    def add(self, row):
+        row += "\n"
+        self._file.write(row)
+        self.count += 1
+        self.size += len(row.encode("utf-8"))
+
+    def __iter__(self):
+        self._file.seek(0)
+        for line in self._file:
+            yield line.rstrip("\n")
+
+    def close(self):
+        self._file.close()
+
+
+class SastReport:
+    """Accumulate Semgrep findings and errors one at a time, then write the report.
+
+    Only counts, per-rule and per-path totals and the parsing-error
+    locations are kept in memory; table rows and error messages are
+    rendered on arrival into spool files.
+
+    With a *baseline* (a sast_baseline.SastBaseline), findings it already
+    accepted are listed apart as existing, and accepted findings that no
+    longer occur as fixed. With *record*, every finding is also added to
+    that baseline so it can be saved as the new one.
+    """
+
+    def __init__(self, baseline=None, record=None):
+        self.baseline = baseline
+        self.record = record
+        self.finding_count = 0
+        self.error_finding_count = 0
+        self.error_count = 0
+        self.parsing_error_files = {}
+        # rule or path -> [findings, error findings, new findings]
+        self.rule_counts = {}
+        self.path_counts = {}
+        self._error_rows = _Rows()
+        self._warning_rows = _Rows()
+        self._existing_rows = _Rows()
+        self._fixed_rows = None
+        self._messages = _spool()
+        self._sources = None
+        if baseline is not None or record is not None:
+            self._sources = SourceLines()
+
+    @property
+    def new_error_count(self):
+        return self._error_rows.count
+
+    @property
+    def new_warning_count(self):
+        return self._warning_rows.count
+
+    @property
+    def existing_count(self):
+        return self._existing_rows.count
+
+    def add(self, kind, item):
+        """Add a findings store row: a ``"finding"`` or a scan ``"error"``."""
+        if kind == "finding":
+            self.add_finding(item)
+        else:
+            self.add_error(item)
+
+    def add_finding(self, finding):
+        errors, _ = categorize_findings([finding])
+        self.finding_count += 1
+        self.error_finding_count += len(errors)
+        row = format_finding_row(finding)
+
+        existing = False
+        if self._sources is not None:
+            fp = fingerprint(finding, self._sources)
+            if self.record is not None:
+                self.record.add(fp, finding)
+            existing = self.baseline is not None and self.baseline.match(fp)
+
+        for counts, key in ((self.rule_counts, finding.get("check_id", "unknown")),
+                            (self.path_counts, finding.get("path", "unknown"))):
+            totals = counts.get(key)
+            if totals is None:
+                totals = counts[key] = [0, 0, 0]
+            totals[0] += 1
+            totals[1] += len(errors)
+            totals[2] += not existing
+
+        if existing:
+            self._existing_rows.add(row)
+        elif errors:
+            self._error_rows.add(row)
+        else:
+            self._warning_rows.add(row)
+
+    def add_error(self, error):
+        self.error_count += 1
+        for path, lines in _collect_parsing_errors([error]).items():
+            self.parsing_error_files.setdefault(path, []).extend(lines)
+        self._messages.write(_format_error_message(self.error_count, error))
+
+    def close(self):
+        for rows in (self._error_rows, self._warning_rows, self._existing_rows, self._fixed_rows):
+            if rows is not None:
+                rows.close()
+        self._messages.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def counts(self):
+        """Return the counts recorded in the summary sidecar."""
+        counts = {
+            "total": self.finding_count,
+            "errors": self.error_finding_count,
+            "warnings": self.finding_count - self.error_finding_count,
+            "scan_errors": self.error_count,
+        }
+        if self.baseline is not None:
+            counts.update(
+                new=self.new_error_count + self.new_warning_count,
+                existing=self.existing_count,
+                fixed=self.baseline.fixed_count(),
+            )
+        return counts
+
+    def _sections(self):
+        """Return ``(heading, rows)`` for every detail table that has rows."""
+        if self.baseline is None:
+            sections = [
+                ("🔴 Error Findings", self._error_rows),
+                ("⚠️ Warning Findings", self._warning_rows),
+            ]
+        else:
+            if self._fixed_rows is None:
+                # Rendered once up front: both the size check and the report need the rows.
+                self._fixed_rows = _Rows()
+                for e in self.baseline.fixed():
+                    self._fixed_rows.add(table_row(
+                        cell(e["rule"]), cell(e["severity"]), f"`{cell(e['path'])}:{cell(e['line'])}`",
+                        cell(e["message"], 80),
+                    ))
+            sections = [
+                ("🔴 New Error Findings", self._error_rows),
+                ("⚠️ New Warning Findings", self._warning_rows),
+                ("📦 Existing Findings", self._existing_rows),
+                ("✅ Fixed Findings", self._fixed_rows),
+            ]
+        return [(heading, rows) for heading, rows in sections if rows.count]
+
+    def _write_head(self, report, limit=None):
+        """Write the title, scan errors, baseline note and summary metrics."""
+        report.title("SAST Analysis Report")
+        report.heading("Summary")
+
+        if self.error_count:
+            report.paragraph(f"> ⚠️ Semgrep encountered {self.error_count} scan error(s). Results may be incomplete.")
+            write_scan_errors_explanation(report, self.error_count, self.parsing_error_files, self._messages, limit)
+            report.write("\n")
+
+        if self.baseline is not None:
+            report.paragraph(
+                f"> Compared with a baseline of {len(self.baseline)} accepted finding(s): "
+                "only new findings need review."
+            )
+
+        if self.finding_count == 0:
+            report.heading("✅ SAST Status")
+            report.paragraph("No findings detected.")
+        else:
+            rows = [
+                table_row("Total findings", self.finding_count),
+                table_row("Errors", self.error_finding_count),
+                table_row("Warnings", self.finding_count - self.error_finding_count),
+            ]
+            if self.baseline is not None:
+                rows += [
+                    table_row("New", self.new_error_count + self.new_warning_count),
+                    table_row("Existing", self.existing_count),
+                    table_row("Fixed", self._fixed_rows.count),
+                ]
+            report.table(["Metric", "Count"], rows)
+
+    def _write_full(self, report, sections):
+        self._write_head(report)
+        for heading, rows in sections:
+            report.heading(heading)
+            report.table(FINDING_HEADERS, rows)
+        report.write(GUIDELINES)
+
+    def _full_size(self, sections):
+        """Return the size in bytes of the full report without writing it."""
+        with open(os.devnull, "w", encoding="utf-8") as null:
+            probe = MarkdownReport(null)
+            self._write_head(probe)
+        table_size = len(table_header(FINDING_HEADERS).encode("utf-8")) + len("\n")
+        return probe.size + len(GUIDELINES.encode("utf-8")) + sum(
+            len(f"## {heading}\n\n".encode("utf-8")) + table_size + rows.size for heading, rows in sections
+        )
+
+    def _write_top(self, report, heading, first_column, counts, top_n, format_key):
+        """Write the *top_n* keys with the most findings, picked with a heap in one pass."""
+        new = self.baseline is not None
+        report.heading(f"{heading} (top {min(top_n, len(counts))} of {len(counts)})", level=3)
+        report.table([first_column, "Findings", "Errors"] + (["New"] if new else []), (
+            table_row(format_key(key), *(totals if new else totals[:2]))
+            for key, totals in heapq.nlargest(top_n, counts.items(), key=lambda item: item[1])
+        ))
+
+    def _write_aggregated(self, report, sections, max_bytes, overflow_dir, top_n):
+        """Write the summary with top-N tables and move the detail tables to overflow pages."""
+        pages = PagedTables(overflow_dir, "SAST Findings", max_bytes)
+        for heading, rows in sections:
+            pages.table(heading, FINDING_HEADERS, rows)
+        index = os.path.basename(os.path.normpath(overflow_dir)) + "/" + os.path.basename(pages.close())
+
+        while True:
+            out = io.StringIO()
+            summary = MarkdownReport(out)
+            self._write_head(summary, limit=top_n)
+            summary.paragraph(
+                f"> 📚 The full report would exceed {max_bytes} bytes, so findings are aggregated below. "
+                f"Every finding is listed on {len(pages.pages)} [overflow page(s)]({index})."
+            )
+            summary.heading("📊 Hotspots")
+            self._write_top(summary, "Findings by Rule", "Rule", self.rule_counts, top_n,
+                            lambda rule: cell(rule, 100))
+            self._write_top(summary, "Findings by Path", "Path", self.path_counts, top_n,
+                            lambda path: f"`{cell(path, 100)}`")
+            summary.lines(f"- [{heading}]({index}): {rows.count} finding(s)" for heading, rows in sections)
+            summary.write(GUIDELINES)
+            if summary.size <= max_bytes:
+                break
+            if top_n == 0:
+                raise RuntimeError(f"A report budget of {max_bytes} bytes cannot fit even the summary")
+            top_n //= 2
+        report.write(out.getvalue())
+
+    def write(self, report, max_bytes=None, overflow_dir=None, top_n=DEFAULT_TOP_N):
+        """Write the markdown report to *report* (a MarkdownReport).
+
+        With *max_bytes*, a report that would be larger keeps only the
+        summary and the *top_n* rules and paths with the most findings;
+        the detail tables go to paginated files in *overflow_dir*, which
+        should sit next to the report so the relative links resolve.
+
+        Returns the number of error findings that are not in the baseline.
+        """
+        sections = self._sections()
+        if max_bytes is None or self._full_size(sections) <= max_bytes:
+            if overflow_dir is not None:
+                clear_pages(overflow_dir)
+            self._write_full(report, sections)
+        else:
+            self._write_aggregated(report, sections, max_bytes, overflow_dir, top_n)
+        return self.new_error_count
 
 
 def build_markdown_report(data):
     """Build the complete markdown report from Semgrep JSON output."""
-    results = data.get("results", [])
-    errors = data.get("errors", [])
-
-    error_findings, warning_findings = categorize_findings(results)
-    total_findings = len(results)
-
-    md_content = "# SAST Analysis Report\n\n"
-    md_content += f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    md_content += "## Summary\n\n"
-
-    if errors:
-        md_content += f"> ⚠️ Semgrep encountered {len(errors)} scan error(s). Results may be incomplete.\n\n"
-        md_content += format_scan_errors_explanation(errors) + "\n"
-
-    if total_findings == 0:
-        md_content += "## ✅ SAST Status\n\nNo findings detected.\n\n"
-    else:
-        md_content += "| Metric | Count |\n"
-        md_content += "|--------|-------|\n"
-        md_content += f"| Total findings | {total_findings} |\n"
-        md_content += f"| Errors | {len(error_findings)} |\n"
-        md_content += f"| Warnings | {len(warning_findings)} |\n\n"
-
-        md_content += format_findings_section(error_findings, "Error Findings", "🔴")
-        md_content += format_findings_section(warning_findings, "Warning Findings", "⚠️")
-
-    md_content += "## Guidelines\n\n"
-    md_content += "- **Errors**: Must be reviewed and addressed before merging\n"
-    md_content += "- **Warnings**: Should be reviewed; may indicate potential issues\n"
-    md_content += "- Run `task sast` locally to reproduce findings\n\n"
-    md_content += "## Limitations\n\n"
-    md_content += "This scan uses **Semgrep OSS** (open-source version). The following enterprise features are not available:\n\n"
-    md_content += "- ✘ **Semgrep Code (SAST)** - Paid feature with advanced security rules\n"
-    md_content += "- ✘ **Semgrep Supply Chain (SCA)** - Paid feature for dependency vulnerability detection\n\n"
-    md_content += "To enable these features, [register for a free Semgrep account](https://semgrep.dev/signup) and authenticate with `semgrep login`.\n\n"
-    md_content += "## More Information\n\n"
-    md_content += "- Generated by [Semgrep](https://semgrep.dev/) (OSS Edition)\n"
-    md_content += "- Reports location: `.sast-reports/`\n"
-    md_content += "  - `sast-report.md` (this file)\n"
-    md_content += "  - `sast-report.json` (machine-readable)\n"
-    md_content += "- Learn more: [Semgrep Tiers and Pricing](https://semgrep.dev/pricing)\n"
-
-    return md_content, len(error_findings)
-
-
-def write_report(report_path, content):
-    """Write markdown report to file."""
-    try:
-        with open(report_path, "w") as f:
-            f.write(content)
-    except Exception as e:
-        raise RuntimeError(f"Failed to write markdown report: {e}") from e
-
-
-def main():
+    with SastReport() as report:
+        for finding in data.get("results", []):
+            report.add_finding(finding)
+        for error in data.get("errors", []):
+            report.add_error(error)
+        out = io.StringIO()
+        error_count = report.write(MarkdownReport(out))
+    return out.getvalue(), error_count
+
+
+def stream_markdown_report(json_path, report_path, baseline=None, record=None,
+                           max_bytes=None, overflow_dir=OVERFLOW_DIR, top_n=DEFAULT_TOP_N):
+    """Render the report for *json_path* into *report_path* one finding at a time.
+
+    Also writes the summary sidecar next to the report, and returns the
+    number of new error findings (see SastReport). Nothing is written
+    until every finding has been read.
+    """
+    from findings_store import FindingsStore  # sqlite3 is slow to import
+
+    with SastReport(baseline, record) as sast:
+        with FindingsStore() as store:
+            run_id = store.ingest("sast", json_path)
+            for kind, item in store.documents(run_id):
+                sast.add(kind, item)
+        with MarkdownReport.create(report_path) as report:
+            blocking = sast.write(report, max_bytes, overflow_dir, top_n)
+        write_summary(report_path, "sast", blocking, sast.counts())
+    return blocking
+
+
+def parse_args(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate a Markdown SAST report from Semgrep JSON output")
+    parser.add_argument(
+        "--baseline",
+        nargs="?",
+        const=BASELINE_PATH,
+        metavar="PATH",
+        help=f"split findings into new, existing and fixed against a baseline (default: {BASELINE_PATH})",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        nargs="?",
+        const=BASELINE_PATH,
+        metavar="PATH",
+        help=f"accept every current finding as the new baseline (default: {BASELINE_PATH})",
+    )
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        default=DEFAULT_MAX_BYTES,
+        metavar="BYTES",
+        help="aggregate the report and move detail tables to overflow pages "
+        f"in {OVERFLOW_DIR} above this size; 0 disables (default: {DEFAULT_MAX_BYTES})",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_TOP_N,
+        metavar="N",
+        help=f"rules and paths listed in an aggregated report (default: {DEFAULT_TOP_N})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Generate markdown report from Semgrep JSON output."""
+    args = parse_args(argv)
     os.makedirs(".sast-reports", exist_ok=True)
 
     json_path = ".sast-reports/sast-report.json"
     report_path = ".sast-reports/sast-report.md"
+    clear_summary(report_path)
+
+    baseline = record = None
+    if args.baseline:
+        baseline = SastBaseline.load(args.baseline)
+    if args.update_baseline:
+        record = SastBaseline()
 
-    data = read_json_report(json_path)
-    report_content, error_count = build_markdown_report(data)
-    write_report(report_path, report_content)
+    blocking = stream_markdown_report(
+        json_path, report_path, baseline, record, args.max_bytes or None, top_n=args.top
+    )
 
     print("✅ Markdown report generated successfully")
+    if record is not None:
+        record.save(args.update_baseline)
+        print(f"📌 Baseline of {len(record)} finding(s) written to {args.update_baseline}")
     return 0
 
 
@@ -187,6 +536,8 @@ if __name__ == "__main__":
     try:
         sys.exit(main())
     except Exception as e:
+        import traceback  # only needed on failure; keeps startup fast
+
         print(f"❌ Error generating markdown report: {e}", file=sys.stderr)
         traceback.print_exc(file=sys.stderr)
         sys.exit(1)
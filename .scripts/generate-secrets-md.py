@@ -3,31 +3,17 @@
 
 This script is used both locally (via 'task secrets') and in CI/CD.
 It must reliably generate reports without silently hiding errors.
+
+main() files the Gitleaks report into the findings store (see
+findings_store.py) and renders the findings from there.
 """
 
-import json
+import io
 import os
 import sys
-import traceback
-from datetime import datetime
-
 
-def read_json_report(json_path):
-    """Read Gitleaks JSON report and return findings."""
-    if not os.path.exists(json_path):
-        raise FileNotFoundError(f"Secrets JSON report not found at {json_path}")
-
-    try:
-        with open(json_path, "r") as f:
-            content = f.read().strip()
-        # Gitleaks writes "null" when no secrets are found
-        if not content or content == "null":
-            return []
-        data = json.loads(content)
-        # Gitleaks outputs a list of findings
-        return data if isinstance(data, list) else []
-    except Exception as e:
-        raise RuntimeError(f"Failed to read secrets JSON report: {e}") from e
+from markdown_report import MarkdownReport, cell, table_row
+from report_summary import clear_summary, write_summary
 
 
 def format_finding_row(finding):
@@ -38,50 +24,52 @@ def format_finding_row(finding):
     line = finding.get("StartLine", finding.get("startLine", "?"))
     commit = finding.get("Commit", finding.get("commit", ""))
     short_commit = commit[:8] if commit else "working tree"
-    location = f"`{file_path}:{line}`"
-    desc_truncated = (description[:57] + "...") if len(description) > 60 else description
-    return f"| {rule_id} | {location} | {short_commit} | {desc_truncated} |"
+    location = f"`{cell(file_path)}:{cell(line)}`"
+    return table_row(cell(rule_id), location, cell(short_commit), cell(description, 60))
 
 
-def build_markdown_report(findings):
-    """Build the complete markdown report from Gitleaks JSON output."""
+def write_markdown_report(report, findings):
+    """Write the complete markdown report for Gitleaks findings.
+
+    Returns the blocking count (every secret blocks) and the counts.
+    """
     total = len(findings)
 
-    md_content = "# Secrets Detection Report\n\n"
-    md_content += f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    md_content += "## Summary\n\n"
+    report.title("Secrets Detection Report")
+    report.heading("Summary")
 
     if total == 0:
-        md_content += "## ✅ Secrets Status\n\nNo secrets detected.\n\n"
+        report.heading("✅ Secrets Status")
+        report.paragraph("No secrets detected.")
     else:
-        md_content += f"> ⚠️ **{total} secret(s) detected** — revoke and remove immediately.\n\n"
-        md_content += "| Rule | Location | Commit | Description |\n"
-        md_content += "|------|----------|--------|-------------|\n"
-        for finding in findings:
-            md_content += format_finding_row(finding) + "\n"
-        md_content += "\n"
-
-    md_content += "## Guidelines\n\n"
-    md_content += "- **If secrets are found**: Revoke the credential immediately, then remove it from the codebase and git history\n"
-    md_content += "- Use environment variables or a secrets manager instead of hardcoding credentials\n"
-    md_content += "- Consider adding a `.gitleaks.toml` to tune rules for your project\n"
-    md_content += "- Run `task secrets` locally before pushing to catch issues early\n\n"
-    md_content += "## More Information\n\n"
-    md_content += "- Generated by [Gitleaks](https://gitleaks.io/)\n"
-    md_content += "- Reports location: `.secrets-reports/`\n"
-    md_content += "  - `secrets-report.md` (this file)\n"
-    md_content += "  - `secrets-report.json` (machine-readable)\n"
-
-    return md_content, total
-
-
-def write_report(report_path, content):
-    """Write markdown report to file."""
-    try:
-        with open(report_path, "w") as f:
-            f.write(content)
-    except Exception as e:
-        raise RuntimeError(f"Failed to write markdown report: {e}") from e
+        report.paragraph(f"> ⚠️ **{total} secret(s) detected** — revoke and remove immediately.")
+        report.table(
+            ["Rule", "Location", "Commit", "Description"],
+            (format_finding_row(finding) for finding in findings),
+        )
+
+    report.heading("Guidelines")
+    report.lines([
+        "- **If secrets are found**: Revoke the credential immediately, then remove it from the codebase and git history",
+        "- Use environment variables or a secrets manager instead of hardcoding credentials",
+        "- Consider adding a `.gitleaks.toml` to tune rules for your project",
+        "- Run `task secrets` locally before pushing to catch issues early",
+    ])
+    report.heading("More Information")
+    report.write(
+        "- Generated by [Gitleaks](https://gitleaks.io/)\n"
+        "- Reports location: `.secrets-reports/`\n"
+        "  - `secrets-report.md` (this file)\n"
+        "  - `secrets-report.json` (machine-readable)\n"
+    )
+    return total, {"total": total}
+
+
+def build_markdown_report(findings):
+    """Build the complete markdown report from Gitleaks JSON output."""
+    out = io.StringIO()
+    total, _ = write_markdown_report(MarkdownReport(out), findings)
+    return out.getvalue(), total
 
 
 def main():
@@ -90,10 +78,16 @@ def main():
 
     json_path = ".secrets-reports/secrets-report.json"
     report_path = ".secrets-reports/secrets-report.md"
+    clear_summary(report_path)
 
-    findings = read_json_report(json_path)
-    report_content, finding_count = build_markdown_report(findings)
-    write_report(report_path, report_content)
+    from findings_store import FindingsStore  # sqlite3 is slow to import
+
+    with FindingsStore() as store:
+        run_id = store.ingest("secrets", json_path)
+        findings = [finding for _, finding in store.documents(run_id)]
+    with MarkdownReport.create(report_path) as report:
+        blocking, counts = write_markdown_report(report, findings)
+    write_summary(report_path, "secrets", blocking, counts)
 
     print("✅ Markdown report generated successfully")
     return 0
@@ -103,6 +97,8 @@ if __name__ == "__main__":
     try:
         sys.exit(main())
     except Exception as e:
+        import traceback  # only needed on failure; keeps startup fast
+
         print(f"❌ Error generating markdown report: {e}", file=sys.stderr)
         traceback.print_exc(file=sys.stderr)
         sys.exit(1)
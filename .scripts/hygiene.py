@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+
+"""
+Hygiene Runner
+
+Runs any subset of the hygiene checks and report generators in one
+Python process, instead of one interpreter per script:
+
+    python3 .scripts/hygiene.py docs                  # every docs check and report
+    python3 .scripts/hygiene.py docs-structure docs-structure-report
+    python3 .scripts/hygiene.py sast-report
+    python3 .scripts/hygiene.py --list
+
+Every check and generator is registered below as a plugin: the script
+that implements it, the arguments its ``main()`` is called with, and
+the reports it writes. Plugins run in the order given and each still
+writes its own reports. Running them together shares their parsed
+inputs: the docs checks use one ``DocsCorpus`` walk, and scripts already
+imported by an earlier plugin are not loaded again.
+
+Each plugin's script is imported only when that plugin runs, and the
+scripts defer slow imports (process pools, subprocess, sqlite3) to the
+code paths that need them, so `hygiene.py sast-report` never loads the
+docs modules and a docs check never loads the security generators.
+tests/hygiene_startup.bench.py guards the startup cost of every plugin.
+
+A failing check only fails the run when it is a gate (the word-count
+check, and every report generator); the structure and accuracy checks
+report their findings without failing, as their Taskfile tasks always
+have. Pass --with NAME="ARGS" to give a plugin extra arguments, and
+--show to print the markdown reports after the run.
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class Plugin:
+    """One hygiene check or report generator run through its script's ``main()``."""
+
+    def __init__(self, name, script, description, argv=None, gate=True, reports=()):
+        self.name = name
+        self.script = script
+        self.description = description
+        self.argv = argv
+        self.gate = gate
+        self.reports = tuple(reports)
+
+
+PLUGINS = {}
+GROUPS = {}
+
+
+def register(name, script, description, argv=None, gate=True, reports=()):
+    """Register a plugin; *argv* is None for scripts whose ``main()`` takes no arguments."""
+    PLUGINS[name] = Plugin(name, script, description, argv, gate, reports)
+
+
+register("docs-words", "check-docs-size.py", "fail when a doc exceeds the word limit",
+         argv=["--words-only"])
+register("docs-size", "check-docs-size.py", "measure docs size and tokens against thresholds",
+         argv=[], gate=False)
+register("docs-size-report", "generate-docs-size-report.py", "render the docs size report",
+         reports=[".docs-reports/docs-size-report.md"])
+register("docs-structure", "check-docs-structure.py", "validate docs/ against docs/index.md",
+         argv=[], gate=False)
+register("docs-structure-report", "generate-docs-structure-md.py", "render the docs structure report",
+         reports=[".docs-reports/docs-structure-report.md"])
+register("docs-accuracy", "check-docs-accuracy.py", "check links, anchors and task/workflow references",
+         argv=[], gate=False)
+register("docs-accuracy-report", "generate-docs-accuracy-md.py", "render the docs accuracy report",
+         reports=[".docs-reports/docs-accuracy-report.md"])
+register("complexity-report", "generate-complexity-md.py", "render the Lizard complexity report",
+         reports=[".complexity-reports/complexity-report.md"])
+register("sast-report", "generate-sast-md.py", "render the Semgrep SAST report",
+         argv=[], reports=[".sast-reports/sast-report.md"])
+register("secrets-report", "generate-secrets-md.py", "render the Gitleaks secrets report",
+         reports=[".secrets-reports/secrets-report.md"])
+register("dast-report", "generate-dast-md.py", "render the ZAP DAST report",
+         reports=[".dast-reports/dast-report.md"])
+register("dependencies-report", "generate-dependencies-md.py", "render the dependency vulnerability report",
+         reports=[".dependencies-reports/dependencies-report.md"])
+
+GROUPS["docs"] = [
+    "docs-words", "docs-size", "docs-size-report",
+    "docs-structure", "docs-structure-report",
+    "docs-accuracy", "docs-accuracy-report",
+]
+
+_modules = {}
+
+
+def load_plugin_module(plugin):
+    """Import the plugin's script once per process and return the module."""
+    if plugin.script not in _modules:
+        name = os.path.splitext(plugin.script)[0].replace("-", "_")
+        spec = importlib.util.spec_from_file_location(name, os.path.join(SCRIPTS_DIR, plugin.script))
+        module = importlib.util.module_from_spec(spec)
+        # Registered like an import, so the script's own objects resolve by __module__ in this
+        # process. Worker processes cannot import it by this name; pool entry points live in
+        # importable modules (see docs_accuracy_worker.py).
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        _modules[plugin.script] = module
+    return _modules[plugin.script]
+
+
+def run_plugin(plugin, extra_args=()):
+    """Run *plugin* and return its exit status; exceptions become status 1."""
+    try:
+        module = load_plugin_module(plugin)
+        if plugin.argv is None:
+            status = module.main()
+        else:
+            status = module.main([*plugin.argv, *extra_args])
+    except SystemExit as e:
+        status = e.code
+    except Exception as e:
+        import traceback
+
+        print(f"❌ Error in {plugin.name}: {e}", file=sys.stderr)
+        traceback.print_exc(file=sys.stderr)
+        return 1
+    if status is None:
+        return 0
+    if isinstance(status, int):
+        return status
+    print(status, file=sys.stderr)
+    return 1
+
+
+def expand(names):
+    """Resolve group names and drop repeats, keeping the first position."""
+    selected = []
+    for name in names:
+        for member in GROUPS.get(name, [name]):
+            if member not in PLUGINS:
+                raise KeyError(member)
+            if member not in selected:
+                selected.append(member)
+    return selected
+
+
+def run(names, extra_args=None, show=False):
+    """Run the plugins named in *names* in order; return the exit status for the run."""
+    extra_args = extra_args or {}
+    results = []
+    for name in expand(names):
+        plugin = PLUGINS[name]
+        print(f"\n▶️  {name}")
+        start = time.perf_counter()
+        status = run_plugin(plugin, extra_args.get(name, ()))
+        results.append((plugin, status, (time.perf_counter() - start) * 1000))
+
+    if show:
+        for plugin, _, _ in results:
+            for report in plugin.reports:
+                if os.path.isfile(report):
+                    with open(report, encoding="utf-8") as f:
+                        print()
+                        print(f.read())
+
+    print("\n🧩 Hygiene run")
+    failed = False
+    for plugin, status, elapsed_ms in results:
+        if status == 0:
+            mark = "✅"
+        elif plugin.gate:
+            mark = "❌"
+            failed = True
+        else:
+            mark = "⚠️ "
+        print(f"  {mark} {plugin.name:<24}{elapsed_ms:>8.0f} ms")
+    return 1 if failed else 0
+
+
+def list_plugins():
+    for plugin in PLUGINS.values():
+        kind = "gate" if plugin.gate else "advisory"
+        print(f"  {plugin.name:<24}{kind:<10}{plugin.description}")
+    for group, members in GROUPS.items():
+        print(f"  {group:<24}{'group':<10}{', '.join(members)}")
+
+
+def parse_with(values):
+    import shlex
+
+    extra_args = {}
+    for value in values:
+        name, sep, args = value.partition("=")
+        if not sep or name not in PLUGINS:
+            raise argparse.ArgumentTypeError(f"--with expects NAME=ARGS for a known plugin, got {value!r}")
+        extra_args[name] = shlex.split(args)
+    return extra_args
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run hygiene checks and report generators in one process")
+    parser.add_argument("plugins", nargs="*", metavar="PLUGIN", help="plugins or groups to run, in order")
+    parser.add_argument("--list", action="store_true", help="list the registered plugins and groups")
+    parser.add_argument(
+        "--with",
+        dest="with_args",
+        action="append",
+        default=[],
+        metavar="NAME=ARGS",
+        help='extra arguments for one plugin, e.g. --with docs-accuracy="--jobs 0"',
+    )
+    parser.add_argument("--show", action="store_true", help="print the markdown reports after the run")
+    parser.add_argument(
+        "--import-only",
+        action="store_true",
+        help="import the plugins' scripts without running them (for startup benchmarks)",
+    )
+    args = parser.parse_args(argv)
+    if not args.list and not args.plugins:
+        parser.error("name at least one plugin or group (see --list)")
+    try:
+        args.extra_args = parse_with(args.with_args)
+        if args.plugins:
+            expand(args.plugins)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    except KeyError as e:
+        parser.error(f"unknown plugin {e.args[0]!r} (see --list)")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.list:
+        list_plugins()
+        return 0
+    if args.import_only:
+        for name in expand(args.plugins):
+            load_plugin_module(PLUGINS[name])
+        return 0
+    return run(args.plugins, args.extra_args, args.show)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""Incremental reader for large JSON reports, standard library only.
+
+``json.load`` builds the whole document before a report generator can
+look at it, so memory grows with the report. ``iter_arrays`` reads the
+file in chunks and yields the elements of chosen top-level arrays one at
+a time, stepping over every other value without building it. Peak memory
+is bounded by the largest single element and the read chunk, not by the
+size of the document.
+"""
+
+import json
+import re
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = frozenset(",:]} \t\n\r")
+
+
+class JsonStream:
+    """Pull parser over a text file holding one JSON document."""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._offset = 0  # characters dropped from the front of the buffer
+        self._eof = False
+
+    def _fill(self, size):
+        """Append up to *size* more characters; return False at end of file."""
+        if self._eof:
+            return False
+        data = self._file.read(size)
+        if not data:
+            self._eof = True
+            return False
+        self._offset += self._pos
+        self._buf = self._buf[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def _error(self, message):
+        return ValueError(f"{message} at character {self._offset + self._pos}")
+
+    def peek(self):
+        """Skip whitespace and return the next character, or "" at end of file."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise self._error(f"Expected {char!r}")
+        self._pos += 1
+
+    def value(self):
+        """Decode and return the next complete value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                # A number cut by the chunk boundary ("12" of "12.5e3") still
+                # decodes, so only trust a value followed by a delimiter.
+                if self._eof or (end < len(self._buf) and self._buf[end] in _DELIMITERS):
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # Incomplete: at least double what is buffered so long values stay linear.
+            self._fill(max(self._chunk_size, len(self._buf) - self._pos))
+
+    def _members(self, open_char, close_char, keyed):
+        self.expect(open_char)
+        if self.peek() == close_char:
+            self._pos += 1
+            return
+        while True:
+            if keyed:
+                key = self.value()
+                if not isinstance(key, str):
+                    raise self._error("Expected an object key")
+                self.expect(":")
+                yield key
+            else:
+                yield None
+            char = self.peek()
+            self._pos += 1
+            if char == close_char:
+                return
+            if char != ",":
+                self._pos -= 1
+                raise self._error(f"Expected ',' or {close_char!r}")
+
+    def items(self):
+        """Iterate an object's keys; consume each value with value() or skip() before the next."""
+        return self._members("{", "}", keyed=True)
+
+    def elements(self):
+        """Iterate an array; consume each element with value() or skip() before the next."""
+        return self._members("[", "]", keyed=False)
+
+    def skip(self):
+        """Step over the next value without building containers."""
+        char = self.peek()
+        if char == "[":
+            for _ in self.elements():
+                self.skip()
+        elif char == "{":
+            for _ in self.items():
+                self.skip()
+        else:
+            self.value()
+
+
+def iter_arrays(f, keys, chunk_size=CHUNK_SIZE):
+    """Yield ``(key, element)`` for every element of the top-level arrays named in *keys*.
+
+    Elements come in document order; other top-level values are skipped.
+    Raises ValueError when the document is not a well-formed JSON object.
+    """
+    stream = JsonStream(f, chunk_size)
+    for key in stream.items():
+        if key in keys and stream.peek() == "[":
+            for _ in stream.elements():
+                yield key, stream.value()
+        else:
+            stream.skip()
+    if stream.peek():
+        raise stream._error("Extra data after the JSON document")
@@ -0,0 +1,66 @@
+"""Streaming JSON Lines reports for the documentation checkers.
+
+A report is one JSON object per line, one line per issue, written as soon
+as the issue is found, followed by a single trailing summary line::
+
+    {"type": "broken_link", "file": "docs/a.md", "line": 3, "message": "..."}
+    {"summary": {"issue_count": 1, "clean": false}}
+
+Lines are flushed as they are written, so the report can be tailed while
+a scan is still running, and neither the writer nor the reader ever holds
+more than one record in memory. A report without a summary line was cut
+short (the scan crashed or is still running).
+"""
+
+import json
+
+SUMMARY_KEY = "summary"
+
+
+class JsonlReportWriter:
+    """Write records to a JSON Lines report, then a summary line."""
+
+    def __init__(self, path):
+        self._file = open(path, "w", encoding="utf-8", buffering=1)
+        self.count = 0
+
+    def write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.count += 1
+
+    def close(self, summary):
+        """Write the trailing *summary* dict and close the report."""
+        self._file.write(json.dumps({SUMMARY_KEY: summary}, ensure_ascii=False) + "\n")
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # On error, leave the report without a summary so readers can
+        # tell it is incomplete.
+        if not self._file.closed:
+            self._file.close()
+
+
+class JsonlReportReader:
+    """Iterate the records of a JSON Lines report one line at a time.
+
+    ``summary`` is None until ``records()`` has reached the summary line,
+    and stays None if the report has none.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.summary = None
+
+    def records(self):
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if SUMMARY_KEY in record:
+                    self.summary = record[SUMMARY_KEY]
+                    return
+                yield record
@@ -0,0 +1,192 @@
+"""Streaming Markdown writer shared by the scanner report generators.
+
+The SAST, secrets, DAST, dependencies and complexity generators write
+their reports through ``MarkdownReport``: each heading, paragraph and
+table row goes straight to a buffered file instead of being appended to
+one growing string, so a report with many findings is never held in
+memory twice or rebuilt on every row.
+
+``MarkdownReport.create(path)`` writes to ``<path>.tmp`` and renames it
+over *path* only when the whole report was written, so a generator that
+fails half-way never leaves a truncated report behind.
+
+``cell()`` is the one escaping and truncation rule for table cells across
+scanners: line breaks become spaces, pipes are escaped so they cannot
+split a row, and long text is cut to the column's limit.
+
+Every report counts the UTF-8 bytes it has written in ``size``, so a
+generator can keep a report under a size limit (GitHub PR comments and
+step summaries have one). ``PagedTables`` spreads tables that do not fit
+over numbered overflow pages with an index.
+"""
+
+import os
+from datetime import datetime
+
+BUFFER_SIZE = 1 << 16
+
+
+def cell(value, limit=None):
+    """Return *value* as text safe for one Markdown table cell, cut to *limit* characters."""
+    text = " ".join(str(value).splitlines()).strip()
+    if limit is not None and len(text) > limit:
+        text = text[:limit - 3] + "..."
+    return text.replace("|", "\\|")
+
+
+def table_row(*cells):
+    """Join already escaped cells into a Markdown table row."""
+    return "| " + " | ".join(str(c) for c in cells) + " |"
+
+
+def table_header(headers):
+    """Return a table's header and separator lines."""
+    return table_row(*headers) + "\n|" + "|".join("-" * (len(h) + 2) for h in headers) + "|\n"
+
+
+class MarkdownReport:
+    """Write a Markdown report section by section to a text stream."""
+
+    def __init__(self, out):
+        self.out = out
+        self.size = 0
+        self._path = None
+        self._tmp_path = None
+
+    @classmethod
+    def create(cls, path):
+        """Open a report file at *path*; use as a context manager."""
+        tmp_path = f"{path}.tmp"
+        try:
+            out = open(tmp_path, "w", buffering=BUFFER_SIZE)
+        except OSError as e:
+            raise RuntimeError(f"Failed to write markdown report: {e}") from e
+        report = cls(out)
+        report._path = path
+        report._tmp_path = tmp_path
+        return report
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._tmp_path is None:
+            return False
+        try:
+            self.out.close()
+            if exc_type is None:
+                os.replace(self._tmp_path, self._path)
+        except OSError as e:
+            if exc_type is None:
+                raise RuntimeError(f"Failed to write markdown report: {e}") from e
+        finally:
+            if os.path.exists(self._tmp_path):
+                os.remove(self._tmp_path)
+        return False
+
+    def write(self, text):
+        self.out.write(text)
+        self.size += len(text.encode("utf-8"))
+
+    def title(self, title):
+        """Write the report title and generation time."""
+        self.write(f"# {title}\n\n")
+        self.write(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+    def heading(self, text, level=2):
+        self.write(f"{'#' * level} {text}\n\n")
+
+    def paragraph(self, text):
+        self.write(f"{text}\n\n")
+
+    def lines(self, lines):
+        """Write each line, then a blank line."""
+        for line in lines:
+            self.write(f"{line}\n")
+        self.write("\n")
+
+    def table(self, headers, rows):
+        """Write a table from row strings (see table_row()); return how many rows were written."""
+        self.write(table_header(headers))
+        count = 0
+        for row in rows:
+            self.write(row + "\n")
+            count += 1
+        self.write("\n")
+        return count
+
+
+def clear_pages(directory, prefix="page-"):
+    """Remove overflow pages and the index left by an earlier run."""
+    if not os.path.isdir(directory):
+        return
+    for name in os.listdir(directory):
+        if name == "index.md" or (name.startswith(prefix) and name.endswith(".md")):
+            os.remove(os.path.join(directory, name))
+
+
+class PagedTables:
+    """Write long tables across numbered pages of at most *max_bytes* each.
+
+    Pages are named ``page-0001.md`` and so on inside *directory*; close()
+    writes ``index.md`` listing which rows of which table each page holds.
+    A table that continues onto a new page repeats its heading and header.
+    """
+
+    def __init__(self, directory, title, max_bytes):
+        self.directory = directory
+        self.title = title
+        self.max_bytes = max_bytes
+        self.pages = []  # [(file name, [[heading, first row, last row], ...])]
+        self._page = None
+        os.makedirs(directory, exist_ok=True)
+        clear_pages(directory)
+
+    def _start_page(self):
+        self._close_page()
+        name = f"page-{len(self.pages) + 1:04d}.md"
+        self._page = MarkdownReport.create(os.path.join(self.directory, name))
+        self._page.write(f"# {self.title} — page {len(self.pages) + 1}\n\n[← All pages](index.md)\n\n")
+        self.pages.append((name, []))
+
+    def _close_page(self):
+        if self._page is not None:
+            self._page.__exit__(None, None, None)
+            self._page = None
+
+    def table(self, heading, headers, rows):
+        """Append a table, starting a new page whenever the next row would not fit."""
+        header = f"## {heading}\n\n" + table_header(headers)
+        header_size = len(header.encode("utf-8"))
+        open_table = False
+        for number, row in enumerate(rows, 1):
+            row = row + "\n"
+            # The row, the blank line that ends the table, and a header if none is open.
+            needed = len(row.encode("utf-8")) + 1 + (0 if open_table else header_size)
+            # A page always takes at least one row, however large.
+            if self._page is None or (self.pages[-1][1] and self._page.size + needed > self.max_bytes):
+                if open_table:
+                    self._page.write("\n")
+                    open_table = False
+                self._start_page()
+            if not open_table:
+                self._page.write(header)
+                self.pages[-1][1].append([heading, number, number])
+                open_table = True
+            self._page.write(row)
+            self.pages[-1][1][-1][2] = number
+        if open_table:
+            self._page.write("\n")
+
+    def close(self):
+        """Finish the last page and write the index; return its path."""
+        self._close_page()
+        index_path = os.path.join(self.directory, "index.md")
+        with MarkdownReport.create(index_path) as index:
+            index.write(f"# {self.title}\n\n")
+            index.table(["Page", "Section", "Rows"], (
+                table_row(f"[{name}]({name})", cell(heading), f"{first}–{last}")
+                for name, tables in self.pages
+                for heading, first, last in tables
+            ))
+        return index_path
@@ -0,0 +1,212 @@
+"""In-memory index of repository paths for the documentation checks.
+
+Link and file-reference checks used to stat the filesystem for every
+candidate path. ``PathIndex`` walks the tree once (or reads ``git
+ls-files``) and answers existence questions with set lookups, resolving
+``..`` and symlinked directories the way ``Path.resolve()`` would.
+
+Paths are stored relative to the repository root in POSIX form, without
+a trailing slash. The root itself is ``""``.
+"""
+
+import os
+
+# Directories whose contents are not indexed. Docs rarely point inside
+# them and they are large or regenerated on every run; lookups beneath
+# them fall back to the filesystem.
+PRUNED_DIRS = frozenset({".git", "node_modules", "__pycache__"})
+
+# Symlink hops followed while resolving one path before giving up.
+_MAX_LINK_HOPS = 40
+
+
+def _is_pruned(name):
+    return name in PRUNED_DIRS or (name.startswith(".") and name.endswith("-reports"))
+
+
+class PathIndex:
+    """Set of files and directories under a repository root."""
+
+    def __init__(self, root=".", files=(), dirs=(), links=None, opaque=()):
+        self.root = os.path.realpath(root)
+        self.files = set(files)
+        self.dirs = set(dirs) | {""}
+        self.links = dict(links or {})
+        self.opaque = set(opaque)
+
+    @classmethod
+    def scan(cls, root=".", corpus=None):
+        """Build the index with a single ``os.scandir`` walk of *root*.
+
+        Symlinked directories are recorded as aliases of their target
+        rather than walked, so cycles cannot occur. Dangling symlinks are
+        treated as missing, as ``Path.exists()`` does.
+
+        When a ``DocsCorpus`` for a subdirectory of *root* is given, that
+        subtree is copied from the corpus instead of being walked again.
+        """
+        index = cls(root)
+        grafted = corpus.root if corpus is not None else None
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                entries = os.scandir(os.path.join(index.root, rel_dir))
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    if rel == grafted and not entry.is_symlink():
+                        index._graft(corpus)
+                        continue
+                    index._add_entry(entry, rel, stack)
+        return index
+
+    def _graft(self, corpus):
+        """Add the files and directories already listed by *corpus*."""
+        opaque = set()
+        for rel in sorted(corpus.dirs):
+            if any(rel.startswith(f"{o}/") for o in opaque):
+                continue
+            self.dirs.add(rel)
+            if rel in corpus.symlinks:
+                self.links[rel] = self._link_target(rel)
+            elif _is_pruned(os.path.basename(rel)):
+                opaque.add(rel)
+        self.opaque |= opaque
+        self.files.update(
+            rel for rel in corpus.files
+            if not any(rel.startswith(f"{o}/") for o in opaque)
+            and not any(rel.startswith(f"{link}/") for link in corpus.symlinks)
+        )
+
+    def regraft(self, corpus):
+        """Replace the subtree under *corpus*'s root with what *corpus* lists now."""
+        root = corpus.root
+        prefix = f"{root}/"
+
+        def outside(rel):
+            return rel != root and not rel.startswith(prefix)
+
+        self.files = {p for p in self.files if outside(p)}
+        self.dirs = {p for p in self.dirs if outside(p)}
+        self.links = {k: v for k, v in self.links.items() if outside(k)}
+        self.opaque = {p for p in self.opaque if outside(p)}
+        self._graft(corpus)
+
+    @classmethod
+    def from_git(cls, root="."):
+        """Build the index from ``git ls-files`` (tracked and untracked, not ignored).
+
+        Avoids walking ignored trees entirely. Git records symlinks as
+        files, so paths beneath a symlinked directory are not resolved.
+        """
+        import subprocess  # only this constructor runs git
+
+        output = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=root,
+            capture_output=True,
+            check=True,
+        ).stdout
+        index = cls(root)
+        for raw in output.split(b"\0"):
+            if not raw:
+                continue
+            rel = os.fsdecode(raw)
+            index.files.add(rel)
+            parent = os.path.dirname(rel)
+            while parent not in index.dirs:
+                index.dirs.add(parent)
+                parent = os.path.dirname(parent)
+        return index
+
+    def _add_entry(self, entry, rel, stack):
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            return
+        if is_dir:
+            if entry.is_symlink():
+                self.links[rel] = self._link_target(rel)
+            elif _is_pruned(entry.name):
+                self.opaque.add(rel)
+                self.dirs.add(rel)
+                return
+            else:
+                stack.append(rel)
+            self.dirs.add(rel)
+        else:
+            try:
+                if entry.is_file():
+                    self.files.add(rel)
+            except OSError:
+                pass
+
+    def _link_target(self, rel):
+        target = os.readlink(os.path.join(self.root, rel))
+        if not os.path.isabs(target):
+            target = os.path.join(os.path.dirname(rel), target)
+        return target
+
+    def resolve(self, path):
+        """Return *path* normalised to a root-relative key, or None if outside the root.
+
+        Relative paths are taken from the root. ``..`` is applied after
+        following symlinked directories, matching ``Path.resolve()``.
+        """
+        if os.path.isabs(path):
+            path = os.path.relpath(path, self.root)
+        pending = [p for p in path.replace(os.sep, "/").split("/") if p not in ("", ".")]
+        pending.reverse()
+        parts = []
+        hops = 0
+        while pending:
+            part = pending.pop()
+            if part == "..":
+                if not parts:
+                    return None
+                parts.pop()
+                continue
+            parts.append(part)
+            target = self.links.get("/".join(parts))
+            if target is None:
+                continue
+            hops += 1
+            if hops > _MAX_LINK_HOPS:
+                return None
+            if os.path.isabs(target):
+                target = os.path.relpath(target, self.root)
+            parts = []
+            pending.extend(reversed([p for p in target.split("/") if p not in ("", ".")]))
+        return "/".join(parts)
+
+    def _under_opaque(self, key):
+        parent = os.path.dirname(key)
+        while parent:
+            if parent in self.opaque:
+                return True
+            parent = os.path.dirname(parent)
+        return False
+
+    def exists(self, path):
+        """Return True if *path* names an existing file or directory."""
+        key = self.resolve(path)
+        if key is None:
+            # Outside the repository: not indexed, ask the filesystem.
+            return os.path.exists(path if os.path.isabs(path) else os.path.join(self.root, path))
+        if key in self.files or key in self.dirs:
+            return True
+        if self.opaque and self._under_opaque(key):
+            return os.path.exists(os.path.join(self.root, key))
+        return False
+
+    def paths(self):
+        """Return every indexed path, directories suffixed with ``/``.
+
+        Pruned directories are left out: they come and go with builds and
+        report runs, and their contents are never indexed anyway.
+        """
+        dirs = {f"{d}/" for d in self.dirs if d and d not in self.opaque}
+        return self.files | dirs | {f"{k}/" for k in self.links}
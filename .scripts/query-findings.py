@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Query the findings of every scanner from the local findings store.
+
+    python3 .scripts/query-findings.py --path server.js
+    python3 .scripts/query-findings.py --tool sast --severity high
+    python3 .scripts/query-findings.py --ingest --counts
+
+The report generators file each scanner's report into the store (see
+findings_store.py) as they run; --ingest files whichever reports exist
+first, so the store can also be filled without rendering. Queries run
+against the latest run of each tool.
+"""
+
+import os
+import sys
+import time
+
+from findings_store import SEVERITIES, SOURCES, FindingsStore
+from markdown_report import MarkdownReport, cell, table_row
+
+
+def parse_args(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Query the findings of every scanner from the findings store")
+    parser.add_argument("--tool", choices=sorted(SOURCES), help="only this scanner's findings")
+    parser.add_argument("--severity", choices=SEVERITIES, help="only findings of this severity")
+    parser.add_argument("--path", help="only findings in this file, relative to the repository root")
+    parser.add_argument("--rule", help="only findings of this rule, CVE or alert id")
+    parser.add_argument("--ingest", action="store_true", help="file every scanner report found into the store first")
+    parser.add_argument("--counts", action="store_true", help="print finding counts per tool and severity instead")
+    return parser.parse_args(argv)
+
+
+def ingest_all(store):
+    for tool, source in SOURCES.items():
+        if os.path.exists(source):
+            store.ingest(tool, source)
+            print(f"📥 Ingested {source}")
+
+
+def print_counts(counts):
+    report = MarkdownReport(sys.stdout)
+    report.table(["Tool", *SEVERITIES], (
+        table_row(tool, *(by_severity.get(severity, 0) for severity in SEVERITIES))
+        for tool, by_severity in sorted(counts.items())
+    ))
+
+
+def print_findings(findings):
+    report = MarkdownReport(sys.stdout)
+    report.table(["Tool", "Severity", "Rule", "Location", "Title"], (
+        table_row(
+            f["tool"], f["severity"], cell(f["rule"], 60),
+            f"`{cell(f['path'])}:{f['line']}`" if f["line"] is not None else f"`{cell(f['path'])}`",
+            cell(f["title"], 80),
+        )
+        for f in findings
+    ))
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with FindingsStore() as store:
+        if args.ingest:
+            ingest_all(store)
+        start = time.perf_counter()
+        if args.counts:
+            counts = store.counts()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print_counts(counts)
+            print(f"🔎 Counted findings of {len(counts)} tool(s) in {elapsed_ms:.1f} ms")
+            return 0
+        findings = store.query(tool=args.tool, severity=args.severity, path=args.path, rule=args.rule)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    if findings:
+        print_findings(findings)
+    print(f"🔎 {len(findings)} finding(s) in {elapsed_ms:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except Exception as e:
+        print(f"❌ Error querying findings: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,51 @@
+"""Summary sidecar written next to each scanner report.
+
+Every security report generator writes ``summary.json`` beside its
+Markdown report: the scanner's counts and how many findings block a
+merge. The Taskfile and workflow gates read this small file instead of
+parsing the scanner's JSON again, so a report of hundreds of megabytes
+is parsed once, by its generator.
+
+The sidecar is removed before a generator starts, so a run that fails
+half-way never leaves the counts of an earlier run behind.
+
+    {"version": 1, "scanner": "sast", "report": "sast-report.md",
+     "blocking": 2, "counts": {"total": 5, "errors": 2, ...}}
+"""
+
+import json
+import os
+
+SUMMARY_NAME = "summary.json"
+FORMAT_VERSION = 1
+
+
+def summary_path(report_path):
+    """Return the sidecar path for the report at *report_path*."""
+    return os.path.join(os.path.dirname(report_path), SUMMARY_NAME)
+
+
+def clear_summary(report_path):
+    """Remove the sidecar of an earlier run."""
+    path = summary_path(report_path)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def write_summary(report_path, scanner, blocking, counts):
+    """Write the sidecar for *report_path* atomically; return its path."""
+    path = summary_path(report_path)
+    tmp_path = f"{path}.tmp"
+    summary = {
+        "version": FORMAT_VERSION,
+        "scanner": scanner,
+        "report": os.path.basename(report_path),
+        "blocking": blocking,
+        "counts": counts,
+    }
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, path)
+    return path
+
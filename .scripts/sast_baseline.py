@@ -0,0 +1,188 @@
+"""Fingerprint index of accepted Semgrep findings.
+
+A baseline records the findings a team has already accepted, so the
+SAST report can show only what a change introduced. Each finding is
+keyed by a fingerprint: a hash of its rule, its path and its code
+snippet with whitespace collapsed. Line numbers are left out so a
+finding keeps its fingerprint when code above it moves. Identical
+findings in one file share a fingerprint and are counted.
+
+The baseline file holds one record per fingerprint with its count and
+the rule, severity, location and a short message of the finding. Loading
+it streams the records (see json_stream.py) into a dict of fingerprint
+-> count, so matching costs one hash and one lookup per finding however
+large the baseline is, and memory holds only the fingerprints. The
+details are read again, in a second streamed pass, only to list the
+findings that were fixed.
+"""
+
+import json
+import os
+
+from json_stream import JsonStream, iter_arrays
+
+BASELINE_PATH = ".sast-reports/sast-baseline.json"
+FORMAT_VERSION = 1
+
+# Semgrep OSS withholds snippets from logged-out users with this placeholder.
+_WITHHELD_SNIPPET = "requires login"
+# Longer than the 80-character report column, so truncation still shows "...".
+_MESSAGE_LIMIT = 120
+
+
+def normalize_snippet(text):
+    """Collapse all whitespace so reindented code keeps its fingerprint."""
+    return " ".join(text.split())
+
+
+class SourceLines:
+    """Read snippets from the scanned files, caching the most recent file.
+
+    Semgrep reports findings grouped by file, so one cached file serves
+    almost every lookup without holding the whole tree in memory.
+    """
+
+    def __init__(self):
+        self._path = None
+        self._lines = []
+
+    def get(self, path, start, end):
+        if path != self._path:
+            self._path = path
+            try:
+                with open(path, encoding="utf-8", errors="replace") as f:
+                    self._lines = f.read().splitlines()
+            except OSError:
+                self._lines = []
+        return "\n".join(self._lines[start - 1:end])
+
+
+def finding_snippet(finding, sources):
+    """Return the finding's code, from Semgrep's output or else from the source file."""
+    extra = finding.get("extra", {})
+    lines = extra.get("lines", "")
+    if lines and lines.strip() != _WITHHELD_SNIPPET:
+        return lines
+    start = finding.get("start", {}).get("line")
+    end = finding.get("end", {}).get("line", start)
+    if isinstance(start, int) and isinstance(end, int):
+        snippet = sources.get(finding.get("path", ""), start, end)
+        if snippet.strip():
+            return snippet
+    # Without any code, the message is the most stable description left.
+    return extra.get("message", "")
+
+
+def fingerprint(finding, sources):
+    """Return the line-independent fingerprint of a Semgrep finding."""
+    import hashlib  # only needed with a baseline; keeps startup fast
+
+    key = "\0".join((
+        finding.get("check_id", ""),
+        finding.get("path", ""),
+        normalize_snippet(finding_snippet(finding, sources)),
+    ))
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
+def _record(fp, finding):
+    extra = finding.get("extra", {})
+    return {
+        "fingerprint": fp,
+        "count": 1,
+        "rule": finding.get("check_id", "unknown"),
+        "severity": extra.get("severity", "unknown"),
+        "path": finding.get("path", "unknown"),
+        "line": finding.get("start", {}).get("line", "?"),
+        "message": " ".join(extra.get("message", "").split())[:_MESSAGE_LIMIT],
+    }
+
+
+class SastBaseline:
+    """Accepted findings by fingerprint, with the matching state of one report run.
+
+    ``SastBaseline()`` starts an empty baseline to record findings into
+    with add() and save(); ``SastBaseline.load(path)`` reads one to match
+    findings against.
+    """
+
+    def __init__(self):
+        self.path = None
+        self.total = 0
+        self._records = {}
+        self._remaining = {}
+
+    @classmethod
+    def load(cls, path=BASELINE_PATH):
+        if not os.path.exists(path):
+            raise FileNotFoundError(
+                f"SAST baseline not found at {path} (create it with --update-baseline)"
+            )
+        baseline = cls()
+        baseline.path = path
+        version = None
+        try:
+            with open(path, encoding="utf-8") as f:
+                stream = JsonStream(f)
+                for key in stream.items():
+                    if key == "version":
+                        version = stream.value()
+                    elif key == "findings" and version == FORMAT_VERSION:
+                        for _ in stream.elements():
+                            record = stream.value()
+                            baseline._remaining[record["fingerprint"]] = record["count"]
+                    else:
+                        stream.skip()
+        except Exception as e:
+            raise RuntimeError(f"Failed to read SAST baseline: {e}") from e
+        if version != FORMAT_VERSION:
+            raise RuntimeError(
+                f"SAST baseline {path} is not format {FORMAT_VERSION}; recreate it with --update-baseline"
+            )
+        baseline.total = sum(baseline._remaining.values())
+        return baseline
+
+    def __len__(self):
+        if self.path is not None:
+            return self.total
+        return sum(record["count"] for record in self._records.values())
+
+    def add(self, fp, finding):
+        """Accept *finding* into the baseline being recorded."""
+        record = self._records.get(fp)
+        if record is None:
+            self._records[fp] = _record(fp, finding)
+        else:
+            record["count"] += 1
+
+    def match(self, fp):
+        """Claim one accepted occurrence of *fp*; return False when the finding is new."""
+        remaining = self._remaining.get(fp, 0)
+        if not remaining:
+            return False
+        self._remaining[fp] = remaining - 1
+        return True
+
+    def fixed_count(self):
+        return sum(self._remaining.values())
+
+    def fixed(self):
+        """Yield the record of every accepted occurrence that no finding matched."""
+        if not self.fixed_count():
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for _, record in iter_arrays(f, ("findings",)):
+                for _ in range(self._remaining.get(record["fingerprint"], 0)):
+                    yield record
+
+    def save(self, path=BASELINE_PATH):
+        """Write the recorded findings atomically, one record per line."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(f'{{"version": {FORMAT_VERSION}, "findings": [')
+            for i, record in enumerate(self._records.values()):
+                f.write(",\n" if i else "\n")
+                f.write(json.dumps(record, separators=(",", ":")))
+            f.write("\n]}\n")
+        os.replace(tmp_path, path)
@@ -0,0 +1,332 @@
+"""Index of the tasks declared by Taskfile.yml and everything it includes.
+
+The hygiene scripts used to grep ``Taskfile.yml`` for two-space-indented
+keys, which missed tasks pulled in through ``includes:``, task and
+namespace aliases, and tasks indented any other way. ``TaskfileIndex``
+reads the Taskfile outline the way Task does:
+
+- every key of ``tasks:`` is a task, whatever its indentation
+- ``aliases:`` on a task adds alternative names for it
+- ``includes:`` entries are followed recursively; their tasks are
+  namespaced (``docs:build``) unless ``flatten: true``, namespace
+  ``aliases:`` add alternative prefixes, and a namespace on its own
+  runs its ``default`` task
+
+Only the outline is parsed (block and flow mappings and sequences of
+scalars), so no YAML library is needed. Block scalars such as ``cmds``
+and ``summary`` bodies are skipped by indentation.
+
+``load_task_index()`` caches the result in .docs-reports/taskfile-index.json,
+keyed by the mtime, size and content hash of every Taskfile involved
+(including optional includes that do not exist yet), so repeat runs skip
+parsing entirely.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+CACHE_PATH = Path(".docs-reports/taskfile-index.json")
+CACHE_VERSION = 1
+
+# File names Task looks for when an include points at a directory.
+TASKFILE_NAMES = (
+    "Taskfile.yml", "taskfile.yml", "Taskfile.yaml", "taskfile.yaml",
+    "Taskfile.dist.yml", "taskfile.dist.yml", "Taskfile.dist.yaml", "taskfile.dist.yaml",
+)
+
+_KEY = re.compile(
+    r"""^(?:"((?:[^"\\]|\\.)*)"|'((?:[^']|'')*)'|([^\s#'"\[{][^#]*?))[ \t]*:(?:[ \t]+(.*))?$"""
+)
+_COMMENT = re.compile(r"[ \t]+#.*$")
+
+
+# ── Outline parsing ──────────────────────────────────────────────────
+
+def _outline(text):
+    """Return ``(indent, text)`` for every line that is not blank or a comment."""
+    lines = []
+    for raw in text.splitlines():
+        stripped = raw.lstrip(" ")
+        if stripped.strip() and not stripped.startswith("#"):
+            lines.append((len(raw) - len(stripped), stripped.rstrip()))
+    return lines
+
+
+def _is_item(text):
+    return text == "-" or text.startswith("- ")
+
+
+def _scalar(text):
+    text = text.strip()
+    if text[:1] == '"' and text.endswith('"') and len(text) > 1:
+        return text[1:-1].replace('\\"', '"')
+    if text[:1] == "'" and text.endswith("'") and len(text) > 1:
+        return text[1:-1].replace("''", "'")
+    return _COMMENT.sub("", text)
+
+
+def _split_flow(inner):
+    """Split the body of a flow collection on top-level commas."""
+    parts, depth, quote, start = [], 0, None, 0
+    for i, ch in enumerate(inner):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch in "[{":
+            depth += 1
+        elif ch in "]}":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append(inner[start:i])
+            start = i + 1
+    parts.append(inner[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _block_entries(lines, start, end):
+    """Yield ``(key, value, child_start, child_end)`` for the mapping in ``lines[start:end]``."""
+    if start >= end:
+        return
+    indent = lines[start][0]
+    i = start
+    while i < end:
+        line_indent, text = lines[i]
+        j = i + 1
+        while j < end and (lines[j][0] > indent or (lines[j][0] == indent and _is_item(lines[j][1]))):
+            j += 1
+        m = _KEY.match(text) if line_indent == indent and not _is_item(text) else None
+        if m:
+            key = m.group(1) if m.group(1) is not None else m.group(2) if m.group(2) is not None else m.group(3)
+            yield key.strip(), (m.group(4) or "").strip(), i + 1, j
+        i = j
+
+
+def _fields(field, lines):
+    """Return a mapping *field* as ``{key: (value, child_start, child_end)}``.
+
+    Handles both block mappings (children) and flow mappings (inline value).
+    """
+    value, start, end = field
+    value = _COMMENT.sub("", value) if not value.startswith(("'", '"')) else value
+    if value.startswith("{") and value.endswith("}"):
+        fields = {}
+        for part in _split_flow(value[1:-1]):
+            m = _KEY.match(part)
+            if m:
+                key = m.group(1) if m.group(1) is not None else m.group(2) if m.group(2) is not None else m.group(3)
+                fields[key.strip()] = ((m.group(4) or "").strip(), end, end)
+        return fields
+    if value:
+        return {}
+    return {key: (val, cs, ce) for key, val, cs, ce in _block_entries(lines, start, end)}
+
+
+def _list(field, lines):
+    """Return the scalars of a flow or block sequence *field*."""
+    value, start, end = field
+    value = _COMMENT.sub("", value)
+    if value.startswith("[") and value.endswith("]"):
+        return [_scalar(p) for p in _split_flow(value[1:-1])]
+    if value or start >= end:
+        return [_scalar(value)] if value else []
+    indent = lines[start][0]
+    return [
+        _scalar(text[1:]) for line_indent, text in lines[start:end]
+        if line_indent == indent and _is_item(text) and text[1:].strip()
+    ]
+
+
+def _flag(fields, key):
+    return key in fields and _scalar(fields[key][0]).lower() == "true"
+
+
+# ── Index ────────────────────────────────────────────────────────────
+
+def _file_fingerprint(path):
+    """Return ``{"mtime_ns", "size", "sha256"}`` for *path*, or None if it is missing."""
+    try:
+        st = os.stat(path)
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": digest}
+
+
+def _find_taskfile(path):
+    """Return the Taskfile *path* names (a file, or a directory holding one)."""
+    if os.path.isdir(path):
+        for name in TASKFILE_NAMES:
+            candidate = os.path.join(path, name)
+            if os.path.isfile(candidate):
+                return candidate
+        return os.path.join(path, TASKFILE_NAMES[0])
+    return path
+
+
+def _key(path):
+    return Path(os.path.relpath(path)).as_posix()
+
+
+class TaskfileIndex:
+    """Tasks, aliases and include namespaces of a Taskfile tree.
+
+    - ``tasks`` maps each canonical task name to the Taskfile defining it
+    - ``aliases`` maps every other accepted name to its canonical task
+    - ``namespaces`` maps each include namespace to its Taskfile
+    - ``internal`` holds the canonical names of ``internal: true`` tasks
+    - ``sources`` maps every Taskfile read (or expected) to its fingerprint
+    """
+
+    def __init__(self, tasks=None, aliases=None, namespaces=None, internal=(), sources=None):
+        self.tasks = dict(tasks or {})
+        self.aliases = dict(aliases or {})
+        self.namespaces = dict(namespaces or {})
+        self.internal = set(internal)
+        self.sources = dict(sources or {})
+
+    @classmethod
+    def build(cls, path="Taskfile.yml"):
+        """Parse *path* and every Taskfile it includes."""
+        index = cls()
+        index._add_taskfile(_find_taskfile(path), [""], internal=False, stack=())
+        return index
+
+    def names(self):
+        """Return every name ``task <name>`` accepts, aliases included."""
+        return set(self.tasks) | set(self.aliases)
+
+    def resolve(self, name):
+        """Return the canonical task for *name*, or None if there is none."""
+        return name if name in self.tasks else self.aliases.get(name)
+
+    def _add_taskfile(self, path, prefixes, internal, stack):
+        key = _key(path)
+        fingerprint = _file_fingerprint(path)
+        self.sources[key] = fingerprint
+        real = os.path.realpath(path)
+        if fingerprint is None or real in stack:
+            return
+        with open(path, encoding="utf-8") as f:
+            lines = _outline(f.read())
+        top = {k: (v, cs, ce) for k, v, cs, ce in _block_entries(lines, 0, len(lines))}
+        if "includes" in top:
+            for name, field in _fields(top["includes"], lines).items():
+                self._add_include(path, name, field, lines, prefixes, internal, stack + (real,))
+        if "tasks" in top:
+            for name, field in _fields(top["tasks"], lines).items():
+                self._add_task(key, name, field, lines, prefixes, internal)
+
+    def _add_include(self, parent, name, field, lines, prefixes, internal, stack):
+        value, _, end = field
+        if value and not value.startswith("{"):
+            options = {"taskfile": (value, end, end)}
+        else:
+            options = _fields(field, lines)
+        if "taskfile" not in options:
+            return
+        target = _scalar(options["taskfile"][0])
+        if "{{" in target or "://" in target:
+            return  # templated or remote: cannot be resolved offline
+        target = os.path.join(os.path.dirname(parent), os.path.expanduser(target))
+
+        if _flag(options, "flatten"):
+            child = prefixes
+        else:
+            names = [name] + (_list(options["aliases"], lines) if "aliases" in options else [])
+            child = [p + n + ":" for n in names for p in prefixes]
+            self.namespaces[child[0][:-1]] = _key(_find_taskfile(target))
+        self._add_taskfile(_find_taskfile(target), child, internal or _flag(options, "internal"), stack)
+
+    def _add_task(self, source, name, field, lines, prefixes, internal):
+        fields = _fields(field, lines)
+        canonical = prefixes[0] + name
+        self.tasks[canonical] = source
+        if internal or _flag(fields, "internal"):
+            self.internal.add(canonical)
+        names = [name] + (_list(fields["aliases"], lines) if "aliases" in fields else [])
+        for prefix in prefixes:
+            for alias in names:
+                if prefix + alias != canonical:
+                    self.aliases.setdefault(prefix + alias, canonical)
+            if name == "default" and prefix:
+                self.aliases.setdefault(prefix[:-1], canonical)
+
+    # ── Cache ────────────────────────────────────────────────────────
+
+    def to_dict(self):
+        return {
+            "tasks": self.tasks,
+            "aliases": self.aliases,
+            "namespaces": self.namespaces,
+            "internal": sorted(self.internal),
+            "sources": self.sources,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["tasks"], data["aliases"], data["namespaces"], data["internal"], data["sources"])
+
+    def refresh_sources(self):
+        """Check every source against disk.
+
+        Returns ``(unchanged, touched)``: whether every source still has
+        its recorded content, and whether any mtime had to be refreshed
+        because a file was rewritten with identical content.
+        """
+        touched = False
+        for path, recorded in self.sources.items():
+            try:
+                st = os.stat(path)
+            except OSError:
+                if recorded is not None:
+                    return False, touched
+                continue
+            if recorded is None:
+                return False, touched
+            if st.st_mtime_ns == recorded["mtime_ns"] and st.st_size == recorded["size"]:
+                continue
+            current = _file_fingerprint(path)
+            if current is None or current["sha256"] != recorded["sha256"]:
+                return False, touched
+            self.sources[path] = current
+            touched = True
+        return True, touched
+
+
+def _save(index, root, cache_path):
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps({"version": CACHE_VERSION, "root": root, **index.to_dict()}))
+    os.replace(tmp_path, cache_path)
+
+
+def load_task_index(path="Taskfile.yml", cache_path=CACHE_PATH, use_cache=True):
+    """Return the ``TaskfileIndex`` for *path*, reusing the on-disk cache when valid.
+
+    The cache is valid while every recorded Taskfile has the same mtime
+    and size, or failing that the same content hash, and every optional
+    include that was missing is still missing.
+    """
+    root = _key(path)
+    if use_cache:
+        try:
+            data = json.loads(Path(cache_path).read_text())
+            if data.get("version") == CACHE_VERSION and data.get("root") == root:
+                index = TaskfileIndex.from_dict(data)
+                unchanged, touched = index.refresh_sources()
+                if unchanged:
+                    if touched:
+                        _save(index, root, Path(cache_path))
+                    return index
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    index = TaskfileIndex.build(path)
+    if use_cache:
+        _save(index, root, Path(cache_path))
+    return index
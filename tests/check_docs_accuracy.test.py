@@ -0,0 +1,683 @@
+"""Tests for the documentation accuracy checker."""
+
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+def setup_test_env():
+    """Create a temporary project with a minimal docs tree."""
+    tmpdir = tempfile.mkdtemp()
+    os.chdir(tmpdir)
+    os.makedirs("docs/guide", exist_ok=True)
+    os.makedirs(".github/workflows", exist_ok=True)
+    with open("Taskfile.yml", "w") as f:
+        f.write("version: '3'\n\ntasks:\n  hygiene:size:\n    cmds:\n      - echo ok\n")
+    with open(".github/workflows/ci.yml", "w") as f:
+        f.write("name: CI\n")
+    return tmpdir
+
+
+def teardown_test_env(tmpdir):
+    """Clean up temporary test directory."""
+    os.chdir("/")
+    shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".scripts")
+SCRIPT_PATH = os.path.join(SCRIPTS_DIR, "check-docs-accuracy.py")
+sys.path.insert(0, SCRIPTS_DIR)
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("check_docs_accuracy", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_script(cwd, *args):
+    return subprocess.run(
+        ["python3", SCRIPT_PATH, *args],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+    )
+
+
+def write_doc(tmpdir, rel_path, content):
+    path = os.path.join(tmpdir, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def read_report(tmpdir):
+    with open(os.path.join(tmpdir, ".docs-reports", "docs-accuracy-report.json")) as f:
+        return json.load(f)
+
+
+def test_clean_docs_pass():
+    """Test that docs with only valid references pass."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc(tmpdir, "docs/index.md", "See [guide](guide/README.md).\n")
+        write_doc(tmpdir, "docs/guide/README.md", "Run `task hygiene:size` or `.github/workflows/ci.yml`.\n")
+
+        result = run_script(tmpdir)
+
+        assert result.returncode == 0, f"Script should succeed. stdout: {result.stdout}"
+        report = read_report(tmpdir)
+        assert report["clean"], "Report should be clean"
+        assert report["issue_count"] == 0, "Should have no issues"
+
+        print("✅ test_clean_docs_pass passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_reports_every_issue_type():
+    """Test that one run reports links, tasks, workflows and file refs together."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc(tmpdir, "docs/index.md", "\n".join([
+            "# Index",
+            "[missing](nope.md)",
+            "Run task hygiene:gone",
+            "See .github/workflows/missing.yml",
+            "Edit `server.js` now.",
+            "",
+        ]))
+
+        result = run_script(tmpdir)
+
+        assert result.returncode != 0, "Script should fail when issues exist"
+        report = read_report(tmpdir)
+        types = [(i["type"], i["line"]) for i in report["issues"]]
+        assert types == [
+            ("broken_link", 2),
+            ("stale_task_ref", 3),
+            ("stale_workflow_ref", 4),
+            ("stale_file_ref", 5),
+        ], f"Unexpected issues: {types}"
+
+        print("✅ test_reports_every_issue_type passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_analyze_file_reads_once_and_runs_registered_checks():
+    """Test that the engine reads each file once and runs custom checks."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc(tmpdir, "docs/index.md", "TODO: write docs\n")
+        module = load_module()
+
+        reads = []
+        original_read_text = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            reads.append(str(self))
+            return original_read_text(self, *args, **kwargs)
+
+        def check_todo(md_path, content, lines, context):
+            if "TODO" in content:
+                return [{"type": "todo", "file": str(md_path), "line": 1, "message": "TODO"}]
+            return []
+
+        context = module.build_context()
+        Path.read_text = counting_read_text
+        try:
+            issues = module.analyze_file(Path("docs/index.md"), context, module.CHECKS + [check_todo])
+        finally:
+            Path.read_text = original_read_text
+
+        assert reads == ["docs/index.md"], f"Should read the file once, got {reads}"
+        assert [i["type"] for i in issues] == ["todo"], f"Unexpected issues: {issues}"
+
+        print("✅ test_analyze_file_reads_once_and_runs_registered_checks passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_warm_run_reuses_cache():
+    """Test that unchanged files are served from the cache on a rerun."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc(tmpdir, "docs/index.md", "[missing](nope.md)\n")
+        write_doc(tmpdir, "docs/guide/README.md", "Nothing to see.\n")
+
+        cold = run_script(tmpdir)
+        warm = run_script(tmpdir)
+
+        assert "Reused cached results" not in cold.stdout, "Cold run should not hit the cache"
+        assert "Reused cached results for 2 of 2" in warm.stdout, f"Warm run should hit cache: {warm.stdout}"
+        assert read_report(tmpdir)["issue_count"] == 1, "Cached issues should be reported"
+
+        write_doc(tmpdir, "docs/index.md", "Fixed.\n")
+        edited = run_script(tmpdir)
+        assert "Reused cached results for 1 of 2" in edited.stdout, "Only the edited file should rescan"
+        assert read_report(tmpdir)["clean"], "Edited file should be rechecked"
+
+        print("✅ test_warm_run_reuses_cache passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_cache_invalidated_by_project_inputs():
+    """Test that Taskfile and path changes invalidate cached results."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc(tmpdir, "docs/index.md", "Run task hygiene:new and see [n](notes.md).\n")
+
+        run_script(tmpdir)
+        assert read_report(tmpdir)["issue_count"] == 2, "Should flag task and link"
+
+        with open("Taskfile.yml", "a") as f:
+            f.write("  hygiene:new:\n    cmds:\n      - echo new\n")
+        write_doc(tmpdir, "docs/notes.md", "Notes.\n")
+
+        result = run_script(tmpdir)
+        assert "Reused cached results" not in result.stdout, "Changed inputs should invalidate the cache"
+        assert read_report(tmpdir)["clean"], "Stale cached issues should not be reported"
+
+        print("✅ test_cache_invalidated_by_project_inputs passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_cache_invalidated_by_checker_modules():
+    """Test that a change to a module the checks import invalidates cached results."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc(tmpdir, "docs/index.md", "# Index\n")
+        module = load_module()
+        context = module.build_context()
+        before = module.context_fingerprint(context)
+
+        docs_anchors = sys.modules["docs_anchors"]
+        original = docs_anchors.__file__
+        edited = os.path.join(tmpdir, "docs_anchors.py")
+        with open(original) as src, open(edited, "w") as dst:
+            dst.write(src.read() + "\n# changed\n")
+        docs_anchors.__file__ = edited
+        try:
+            after = module.context_fingerprint(context)
+        finally:
+            docs_anchors.__file__ = original
+
+        assert before != after, "Editing docs_anchors.py should change the fingerprint"
+        assert module.context_fingerprint(context) == before, "The fingerprint should be stable otherwise"
+
+        print("✅ test_cache_invalidated_by_checker_modules passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_no_cache_bypasses_cache():
+    """Test that --no-cache neither reads nor writes the cache."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc(tmpdir, "docs/index.md", "Hello.\n")
+
+        result = run_script(tmpdir, "--no-cache")
+
+        assert result.returncode == 0, f"Script should succeed. stdout: {result.stdout}"
+        assert not os.path.exists(
+            os.path.join(tmpdir, ".docs-reports", "docs-accuracy-cache.json")
+        ), "Should not write the cache"
+
+        run_script(tmpdir)
+        result = run_script(tmpdir, "--no-cache")
+        assert "Reused cached results" not in result.stdout, "Should not read the cache"
+
+        print("✅ test_no_cache_bypasses_cache passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_parallel_report_matches_serial():
+    """Test that --jobs produces a byte-identical report to a serial run."""
+    tmpdir = setup_test_env()
+    try:
+        for i in range(12):
+            write_doc(tmpdir, f"docs/guide/page{i:02d}.md", f"[p](page{i + 1:02d}.md)\nRun task hygiene:x{i}\n")
+
+        report_path = os.path.join(tmpdir, ".docs-reports", "docs-accuracy-report.json")
+        run_script(tmpdir, "--no-cache")
+        with open(report_path, "rb") as f:
+            serial = f.read()
+        result = run_script(tmpdir, "--no-cache", "--jobs", "4")
+        with open(report_path, "rb") as f:
+            parallel = f.read()
+
+        assert result.returncode != 0, "Script should fail when issues exist"
+        assert parallel == serial, "Parallel report should match serial report"
+        assert read_report(tmpdir)["issue_count"] == 13, "Should find every issue"
+
+        print("✅ test_parallel_report_matches_serial passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_path_index_matches_filesystem_resolution():
+    """Test that PathIndex lookups agree with Path.resolve().exists()."""
+    from path_index import PathIndex
+
+    tmpdir = setup_test_env()
+    try:
+        write_doc(tmpdir, "real/sub/page.md", "x")
+        write_doc(tmpdir, "node_modules/pkg/index.js", "")
+        os.symlink("../real/sub", "docs/link")
+        os.symlink("missing", "docs/dangling")
+        os.symlink("link", "docs/link2")
+
+        index = PathIndex.scan()
+        cases = [
+            "docs/guide", "docs/guide/../guide", "docs/link/page.md",
+            "docs/link/../sub/page.md", "docs/link2/page.md", "docs/link/..",
+            "docs/dangling", "docs/nope.md", "node_modules/pkg/index.js",
+            "node_modules/pkg/nope.js", "Taskfile.yml", "../" + os.path.basename(tmpdir),
+        ]
+        for case in cases:
+            expected = Path(case).resolve().exists()
+            assert index.exists(case) == expected, f"Mismatch for {case}: expected {expected}"
+
+        print("✅ test_path_index_matches_filesystem_resolution passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_validates_heading_anchors():
+    """Test that cross-file and same-file #anchors are checked against headings and HTML ids."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc(tmpdir, "docs/guide/README.md", "\n".join([
+            "# Guide",
+            "## SAST — Static `Analysis`",
+            "## Setup",
+            "## Setup",
+            "Other Title",
+            "-----------",
+            "```",
+            "# not a heading",
+            "```",
+            '<a id="Custom-Id"></a>',
+            "",
+        ]))
+        write_doc(tmpdir, "docs/index.md", "\n".join([
+            "[ok](guide/README.md#sast--static-analysis)",
+            "[dup](guide/README.md#setup-1)",
+            "[setext](guide/README.md#other-title)",
+            "[bad](guide/README.md#missing-section)",
+            "[code](guide/README.md#not-a-heading)",
+            "[self](#intro) [self-bad](#nowhere)",
+            "[case](guide/README.md#Setup) [html](guide/README.md#Custom-Id)",
+            "[html-case](guide/README.md#custom-id)",
+            "",
+            "## Intro",
+            "",
+        ]))
+
+        run_script(tmpdir)
+
+        issues = read_report(tmpdir)["issues"]
+        found = [(i["type"], i["line"]) for i in issues]
+        assert found == [
+            ("broken_anchor", 4),
+            ("broken_anchor", 5),
+            ("broken_anchor", 6),
+            ("broken_anchor", 8),
+        ], f"Unexpected issues: {found}"
+        assert "#nowhere" in issues[2]["message"], "Should name the missing anchor"
+        assert "#custom-id" in issues[3]["message"], "HTML anchors should match case-sensitively"
+
+        print("✅ test_validates_heading_anchors passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_heading_change_invalidates_cached_linkers():
+    """Test that renaming a heading rechecks cached documents that link to it."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc(tmpdir, "docs/guide/README.md", "# Guide\n\n## Setup\n")
+        write_doc(tmpdir, "docs/index.md", "[setup](guide/README.md#setup)\n")
+
+        run_script(tmpdir)
+        assert read_report(tmpdir)["clean"], "Valid anchor should pass"
+
+        write_doc(tmpdir, "docs/guide/README.md", "# Guide\n\n## Installation\n")
+        result = run_script(tmpdir)
+
+        assert "Reused cached results" not in result.stdout, "Linking doc should be rescanned"
+        assert read_report(tmpdir)["issue_count"] == 1, "Renamed heading should break the anchor"
+
+        print("✅ test_heading_change_invalidates_cached_linkers passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_anchor_index_parses_each_target_once():
+    """Test that a heavily linked page is parsed once, not once per link."""
+    import docs_anchors
+
+    calls = []
+    original = docs_anchors.heading_slugs
+
+    def counting_heading_slugs(content):
+        calls.append(content)
+        return original(content)
+
+    tmpdir = setup_test_env()
+    docs_anchors.heading_slugs = counting_heading_slugs
+    try:
+        write_doc(tmpdir, "docs/guide/README.md", "# Guide\n")
+        for i in range(5):
+            write_doc(tmpdir, f"docs/page{i}.md", "[g](guide/README.md#guide)\n")
+        module = load_module()
+        context = module.build_context()
+        for i in range(5):
+            module.analyze_file(Path(f"docs/page{i}.md"), context)
+
+        assert len(calls) == 1, f"Target should be parsed once, got {len(calls)}"
+
+        print("✅ test_anchor_index_parses_each_target_once passed")
+    finally:
+        docs_anchors.heading_slugs = original
+        teardown_test_env(tmpdir)
+
+
+def git(tmpdir, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=tmpdir, check=True, capture_output=True,
+    )
+
+
+def test_changed_since_checks_changed_docs_and_linkers():
+    """Test that --changed-since checks only changed docs and linkers of removed files."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc(tmpdir, "docs/index.md", "[page](guide/page.md)\n")
+        write_doc(tmpdir, "docs/guide/page.md", "# Page\n")
+        write_doc(tmpdir, "docs/guide/other.md", "Other.\n")
+        write_doc(tmpdir, "docs/untouched.md", "[gone](missing.md)\n")
+        git(tmpdir, "init", "-q")
+        git(tmpdir, "add", "-A")
+        git(tmpdir, "commit", "-qm", "base")
+        git(tmpdir, "tag", "base")
+
+        run_script(tmpdir)
+        assert os.path.exists(
+            os.path.join(tmpdir, ".docs-reports", "docs-link-graph.json")
+        ), "Full run should persist the link graph"
+
+        os.remove("docs/guide/page.md")
+        write_doc(tmpdir, "docs/guide/other.md", "Run task hygiene:gone\n")
+        result = run_script(tmpdir, "--changed-since", "base")
+
+        assert "Checking 2 of 3" in result.stdout, f"Should check 2 docs: {result.stdout}"
+        files = sorted(i["file"] for i in read_report(tmpdir)["issues"])
+        assert files == ["docs/guide/other.md", "docs/index.md"], f"Unexpected files: {files}"
+
+        print("✅ test_changed_since_checks_changed_docs_and_linkers passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_changed_since_without_graph_scans_everything():
+    """Test that --changed-since falls back to a full scan when no graph exists."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc(tmpdir, "docs/index.md", "[gone](missing.md)\n")
+        git(tmpdir, "init", "-q")
+        git(tmpdir, "add", "-A")
+        git(tmpdir, "commit", "-qm", "base")
+
+        result = run_script(tmpdir, "--changed-since", "HEAD")
+
+        assert "No link graph yet" in result.stdout, "Should explain the full scan"
+        assert read_report(tmpdir)["issue_count"] == 1, "Should check every document"
+
+        print("✅ test_changed_since_without_graph_scans_everything passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+LEGACY_PATTERNS = {
+    "link": r'\[([^\]]*)\]\(([^)]+)\)',
+    "task": r'(?:^|\s)task\s+([a-z][a-z0-9_-]*:[a-z0-9:_-]+)',
+    "workflow": r'\.github/workflows/([a-z0-9_-]+\.yml)',
+    "file": r'`([a-zA-Z0-9_./-]+\.[a-z]{1,4})`',
+}
+
+
+def test_single_scan_finds_same_references_as_separate_passes():
+    """Test that the combined scanner matches one finditer pass per pattern."""
+    import re
+
+    module = load_module()
+    content = "\n".join([
+        "task hygiene:a at the start",
+        "[`server.js`](../server.js) and `.github/workflows/ci.yml`",
+        "[see .github/workflows/x.yml](.github/workflows/x.yml) task a:b task c:d",
+        "`a.md``b.md` [x [y](z)](w) `[q](r.md)`",
+        "",
+    ])
+
+    scanned = sorted((name, m.group(1)) for name, m in module.scan_references(content))
+    legacy = sorted(
+        (name, m.group(1))
+        for name, pattern in LEGACY_PATTERNS.items()
+        for m in re.finditer(pattern, content)
+    )
+    assert scanned == legacy, f"Scanner mismatch:\n{scanned}\n{legacy}"
+
+    print("✅ test_single_scan_finds_same_references_as_separate_passes passed")
+
+
+def test_task_reference_at_line_start_reports_its_own_line():
+    """Test that a task reference opening a line is reported on that line."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc(tmpdir, "docs/index.md", "# Index\ntask hygiene:gone\n")
+
+        run_script(tmpdir)
+
+        issues = read_report(tmpdir)["issues"]
+        assert [(i["type"], i["line"]) for i in issues] == [("stale_task_ref", 2)], issues
+
+        print("✅ test_task_reference_at_line_start_reports_its_own_line passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_line_index_matches_prefix_count():
+    """Test that LineIndex agrees with counting newlines in the prefix."""
+    from docs_lines import LineIndex
+
+    content = "first\n\nthird line\n[x](y.md)\nlast"
+    lines = LineIndex(content)
+    for offset in range(len(content) + 1):
+        expected = content[:offset].count("\n") + 1
+        assert lines.line_of(offset) == expected, f"Wrong line for offset {offset}"
+    assert len(lines) == 5, "Should count every line"
+
+    print("✅ test_line_index_matches_prefix_count passed")
+
+
+def test_included_and_aliased_tasks_are_not_stale():
+    """Test that task references resolve through Taskfile includes and aliases."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc(tmpdir, "Taskfile.yml",
+                  "version: '3'\nincludes:\n  docs: ./docs/Taskfile.yml\n"
+                  "tasks:\n  hygiene:size:\n    aliases: [hygiene:sz]\n")
+        write_doc(tmpdir, "docs/Taskfile.yml", "version: '3'\ntasks:\n  build:\n    cmds: [echo]\n")
+        write_doc(tmpdir, "docs/index.md", "Run task docs:build then task hygiene:sz, not task docs:gone.\n")
+
+        result = run_script(tmpdir)
+
+        issues = read_report(tmpdir)["issues"]
+        assert [i["message"] for i in issues] == ["Task reference `task docs:gone` not found in Taskfile.yml"], \
+            f"Only the unknown task should be reported. stdout: {result.stdout}"
+
+        print("✅ test_included_and_aliased_tasks_are_not_stale passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+GENERATOR_PATH = os.path.join(SCRIPTS_DIR, "generate-docs-accuracy-md.py")
+
+
+def render_markdown(tmpdir):
+    subprocess.run(["python3", GENERATOR_PATH], capture_output=True, text=True, cwd=tmpdir, check=True)
+    with open(os.path.join(tmpdir, ".docs-reports", "docs-accuracy-report.md")) as f:
+        return [line for line in f if not line.startswith("**Generated:**")]
+
+
+def test_jsonl_report_streams_issues_with_summary():
+    """Test that --format jsonl writes one issue per line plus a summary, matching JSON."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc(tmpdir, "docs/index.md", "See [gone](gone.md) and `task hygiene:nope`.\n")
+        write_doc(tmpdir, "docs/guide/README.md", "Edit `missing.py`.\n[Top](#nowhere)\n")
+
+        run_script(tmpdir, "--no-cache")
+        expected = read_report(tmpdir)
+        json_markdown = render_markdown(tmpdir)
+
+        result = run_script(tmpdir, "--no-cache", "--format", "jsonl")
+        assert result.returncode == 1, "Issues should still fail the run"
+        reports = os.path.join(tmpdir, ".docs-reports")
+        assert not os.path.exists(os.path.join(reports, "docs-accuracy-report.json")), \
+            "Stale JSON report should be removed"
+        with open(os.path.join(reports, "docs-accuracy-report.jsonl")) as f:
+            records = [json.loads(line) for line in f]
+        assert records[:-1] == expected["issues"], "JSONL issues should match the JSON report"
+        assert records[-1] == {"summary": {"issue_count": expected["issue_count"], "clean": False}}, \
+            f"Last line should be the summary, got {records[-1]}"
+
+        assert render_markdown(tmpdir) == json_markdown, "Markdown should not depend on the report format"
+
+        print("✅ test_jsonl_report_streams_issues_with_summary passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_markdown_flags_jsonl_report_without_summary():
+    """Test that a JSONL report cut short renders as incomplete."""
+    tmpdir = setup_test_env()
+    try:
+        os.makedirs(os.path.join(tmpdir, ".docs-reports"))
+        issue = {"type": "broken_link", "file": "docs/a.md", "line": 3, "message": "Broken link: [a](b.md)"}
+        with open(os.path.join(tmpdir, ".docs-reports", "docs-accuracy-report.jsonl"), "w") as f:
+            f.write(json.dumps(issue) + "\n")
+
+        markdown = "".join(render_markdown(tmpdir))
+        assert "did not finish" in markdown, "Missing summary should be reported"
+        assert "- **docs/a.md** (line 3): Broken link: [a](b.md)" in markdown, "Issues read so far should be listed"
+
+        print("✅ test_markdown_flags_jsonl_report_without_summary passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_watch_rechecks_touched_docs_and_their_linkers():
+    """Test that --watch updates re-validate only changed docs and docs linking to them."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc(tmpdir, "docs/index.md", "See [setup](guide/README.md#setup).\n")
+        write_doc(tmpdir, "docs/guide/README.md", "# Guide\n\n## Setup\n")
+        write_doc(tmpdir, "docs/other.md", "See [notes](notes.md).\n")
+        write_doc(tmpdir, "docs/plain.md", "Run task hygiene:lint:all now.\n")
+
+        from docs_corpus import DocsCorpus
+        from docs_watch import PollingWatcher
+        DocsCorpus.reset_shared()
+        module = load_module()
+        context = module.build_context()
+        session = module.AccuracyWatch(context)
+        session.check([Path(d.path) for d in context["docs"].markdown()], use_cache=False)
+        watcher = PollingWatcher(session.watched())
+        types = lambda path: [i["type"] for i in session.issues[path]]  # noqa: E731
+        assert types("docs/other.md") == ["broken_link"] and types("docs/plain.md") == ["stale_task_ref"], \
+            f"Initial scan should find both issues: {session.issues}"
+
+        def save_and_update(rel_path, content=None):
+            if content is None:
+                os.remove(rel_path)
+            else:
+                write_doc(tmpdir, rel_path, content)
+            start = time.perf_counter()
+            selected = session.update(*watcher.poll())
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            assert elapsed_ms < 100, f"Update should take under 100 ms, took {elapsed_ms:.1f} ms"
+            return sorted(str(f) for f in selected)
+
+        selected = save_and_update("docs/guide/README.md", "# Guide\n\n## Install\n")
+        assert selected == ["docs/guide/README.md", "docs/index.md"], f"Linker should be rechecked: {selected}"
+        assert types("docs/index.md") == ["broken_anchor"], f"Removed heading should break the anchor: {session.issues}"
+
+        selected = save_and_update("docs/notes.md", "# Notes\n")
+        assert selected == ["docs/notes.md", "docs/other.md"], f"Docs linking to a new file should be rechecked: {selected}"
+        assert types("docs/other.md") == [], "The link should resolve once the target exists"
+
+        selected = save_and_update("docs/notes.md")
+        assert selected == ["docs/other.md"], f"Docs linking to a deleted file should be rechecked: {selected}"
+        assert "docs/notes.md" not in session.issues, "Deleted docs should drop out of the results"
+        assert types("docs/other.md") == ["broken_link"], "The link should break again"
+
+        with open("Taskfile.yml", "a") as f:
+            f.write("  hygiene:lint:all:\n    cmds:\n      - echo ok\n")
+        selected = session.update(*watcher.poll())
+        assert len(selected) == 4 and types("docs/plain.md") == [], "A Taskfile change should recheck every doc"
+
+        print("✅ test_watch_rechecks_touched_docs_and_their_linkers passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+if __name__ == "__main__":
+    print("\n🧪 Running docs accuracy checker tests...\n")
+
+    try:
+        test_clean_docs_pass()
+        test_reports_every_issue_type()
+        test_analyze_file_reads_once_and_runs_registered_checks()
+        test_warm_run_reuses_cache()
+        test_cache_invalidated_by_project_inputs()
+        test_cache_invalidated_by_checker_modules()
+        test_no_cache_bypasses_cache()
+        test_parallel_report_matches_serial()
+        test_path_index_matches_filesystem_resolution()
+        test_validates_heading_anchors()
+        test_heading_change_invalidates_cached_linkers()
+        test_anchor_index_parses_each_target_once()
+        test_changed_since_checks_changed_docs_and_linkers()
+        test_changed_since_without_graph_scans_everything()
+        test_single_scan_finds_same_references_as_separate_passes()
+        test_task_reference_at_line_start_reports_its_own_line()
+        test_line_index_matches_prefix_count()
+        test_included_and_aliased_tasks_are_not_stale()
+        test_jsonl_report_streams_issues_with_summary()
+        test_markdown_flags_jsonl_report_without_summary()
+        test_watch_rechecks_touched_docs_and_their_linkers()
+
+        print("\n✅ All tests passed!\n")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}\n")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Unexpected error: {e}\n")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
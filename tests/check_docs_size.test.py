@@ -0,0 +1,264 @@
+"""Tests for the documentation size monitor."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".scripts")
+CHECK_PATH = os.path.join(SCRIPTS_DIR, "check-docs-size.py")
+sys.path.insert(0, SCRIPTS_DIR)
+
+from docs_size_history import SECONDS_PER_DAY, SizeHistory  # noqa: E402
+from token_estimate import estimate_tokens  # noqa: E402
+GENERATOR_PATH = os.path.join(SCRIPTS_DIR, "generate-docs-size-report.py")
+
+
+def setup_test_env():
+    """Create a temporary project with an empty docs tree."""
+    tmpdir = tempfile.mkdtemp()
+    os.chdir(tmpdir)
+    os.makedirs("docs")
+    return tmpdir
+
+
+def teardown_test_env(tmpdir):
+    """Clean up temporary test directory."""
+    os.chdir("/")
+    shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def write_doc(rel_path, size=None, text=None):
+    os.makedirs(os.path.dirname(rel_path), exist_ok=True)
+    with open(rel_path, "w") as f:
+        f.write("x" * size if text is None else text)
+
+
+def run(script):
+    return subprocess.run(["python3", script], capture_output=True, text=True)
+
+
+def run_words_only():
+    return subprocess.run(["python3", CHECK_PATH, "--words-only"], capture_output=True, text=True)
+
+
+def read_report():
+    with open(os.path.join(".docs-reports", "docs-size-report.json")) as f:
+        return json.load(f)
+
+
+def test_reports_sizes_within_limits():
+    """Test count, total, average and top-N ordering for docs within limits."""
+    tmpdir = setup_test_env()
+    try:
+        sizes = {"docs/a.md": 3000, "docs/b.md": 9000, "docs/guide/c.md": 5000,
+                 "docs/guide/d.md": 5000, "docs/e.md": 100, "docs/f.md": 7000}
+        for path, size in sizes.items():
+            write_doc(path, size)
+        write_doc("docs/archive/huge.md", 500 * 1024)
+        write_doc("docs/notes.txt", 1000)
+
+        result = run(CHECK_PATH)
+
+        assert result.returncode == 0, f"Monitor should succeed. stderr: {result.stderr}"
+        report = read_report()
+        assert report["file_count"] == 6, "Archive and non-markdown files should be excluded"
+        assert report["total_size_bytes"] == sum(sizes.values()), "Total should sum every doc"
+        assert report["average_size_kb"] == sum(sizes.values()) // 6 // 1024, "Average should match"
+        assert [f["path"] for f in report["largest_files"]] == [
+            "docs/b.md", "docs/f.md", "docs/guide/c.md", "docs/guide/d.md", "docs/a.md",
+        ], f"Largest files should be the top five by size, ties in walk order: {report['largest_files']}"
+        assert report["within_limits"] and report["alerts"] == [], "Docs should be within limits"
+
+        print("✅ test_reports_sizes_within_limits passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_flags_every_threshold_in_json_and_markdown():
+    """Test that oversized files, file count and total size all raise alerts."""
+    tmpdir = setup_test_env()
+    try:
+        for i in range(16):
+            write_doc(f"docs/doc{i:02}.md", 10 * 1024)
+        write_doc("docs/big.md", 20 * 1024 + 1)
+        write_doc("docs/edge.md", 20 * 1024)
+
+        run(CHECK_PATH)
+        report = read_report()
+        assert not report["within_limits"], "Thresholds should be exceeded"
+        assert [f["path"] for f in report["oversized_files"]] == ["docs/big.md"], \
+            "Only files above 20 KB should be oversized"
+        assert len(report["alerts"]) == 3, f"Expected size, count and oversize alerts: {report['alerts']}"
+
+        result = run(GENERATOR_PATH)
+        assert result.returncode == 0, f"Generator should succeed. stdout: {result.stdout}"
+        with open(os.path.join(".docs-reports", "docs-size-report.md")) as f:
+            markdown = f.read()
+        assert "❌ Documentation size exceeds thresholds!" in markdown, "Status should show failure"
+        assert "`docs/big.md` (20 KB)" in markdown, "Oversized files should be listed"
+        assert "\\n" not in markdown, "Alerts should not contain escaped newlines"
+
+        print("✅ test_flags_every_threshold_in_json_and_markdown passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_token_estimates_follow_markdown_structure():
+    """Test that tables, rules and emoji weigh more than plain prose of the same size."""
+    prose = "The quick brown fox jumps over the lazy dog and keeps running. " * 20
+    table = "| ✅ | `a` | **b** |\n|---|---|---|\n" * 20
+    rule = "━" * 400
+
+    assert abs(estimate_tokens(prose) - len(prose) / 4) < len(prose) / 10, \
+        "Plain English should stay close to 4 bytes per token"
+    assert estimate_tokens(table) > len(table.encode()) / 4, "Markdown tables should cost more than bytes/4"
+    assert estimate_tokens(rule) >= 400, "Box-drawing characters should cost about a token each"
+    assert estimate_tokens("") == 0, "Empty text has no tokens"
+
+    print("✅ test_token_estimates_follow_markdown_structure passed")
+
+
+def test_token_counts_cached_per_category_and_file():
+    """Test per-category totals and that unchanged files reuse cached counts."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc("docs/index.md", text="# Index\n\nSee the guides.\n")
+        write_doc("docs/guide/README.md", text="# Guide\n\n| A | B |\n|---|---|\n| ✅ | 🔍 |\n")
+        write_doc("docs/guide/setup.md", text="Install the tools, then run the checks.\n")
+
+        first = run(CHECK_PATH)
+        report = read_report()
+        by_category = {c["category"]: c for c in report["tokens_by_category"]}
+        assert set(by_category) == {"(root)", "guide"}, f"Unexpected categories: {by_category}"
+        assert by_category["guide"]["files"] == 2, "guide/ holds two files"
+        assert report["estimated_tokens"] == sum(f["tokens"] for f in report["files"]), \
+            "Total should sum the per-file estimates"
+        assert "Reused cached token counts" not in first.stdout, "Cold run has nothing cached"
+
+        with open("docs/guide/setup.md", "a") as f:
+            f.write("More words here.\n")
+        second = run(CHECK_PATH)
+        assert "Reused cached token counts for 2 of 3 file(s)" in second.stdout, \
+            f"Only the edited file should be re-estimated. stdout: {second.stdout}"
+
+        run(GENERATOR_PATH)
+        with open(os.path.join(".docs-reports", "docs-size-report.md")) as f:
+            markdown = f.read()
+        assert "## Estimated Tokens by Category" in markdown, "Category table should be rendered"
+        assert "| `docs/guide/README.md` |" in markdown, "Per-file table should list every doc"
+
+        print("✅ test_token_counts_cached_per_category_and_file passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_words_only_gate_checks_words_alone():
+    """Test that --words-only fails on wordy docs, archive included, without touching the report."""
+    tmpdir = setup_test_env()
+    try:
+        write_doc("docs/short.md", text="Just a few words.\n")
+        write_doc("docs/long.md", text="word " * 2501)
+        write_doc("docs/archive/old.md", text="word " * 2600)
+
+        assert run(CHECK_PATH).returncode == 0
+        with open(os.path.join(".docs-reports", "docs-size-report.json")) as f:
+            full_report = f.read()
+
+        result = run_words_only()
+
+        assert result.returncode == 1, "A doc over 2500 words should fail the gate"
+        assert "docs/long.md: 2501 words" in result.stdout, f"Should name the wordy doc. stdout: {result.stdout}"
+        assert "docs/archive/old.md: 2600 words" in result.stdout, "The gate should cover docs/archive/ too"
+        with open(os.path.join(".docs-reports", "docs-size-report.json")) as f:
+            assert f.read() == full_report, "The gate should not rewrite the full report"
+
+        os.remove("docs/long.md")
+        os.remove("docs/archive/old.md")
+        assert run_words_only().returncode == 0, "Gate should pass once the docs are gone"
+
+        print("✅ test_words_only_gate_checks_words_alone passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_size_history_reports_growth_from_indexed_snapshots():
+    """Test the trend store: dedup, growth rate, fastest-growing files and indexed lookups."""
+    tmpdir = setup_test_env()
+    try:
+        now = 1_700_000_000
+        with SizeHistory(".docs-reports/docs-size-history.sqlite") as history:
+            # Two years of daily snapshots: docs/a.md grows 100 bytes a day.
+            for day in range(730):
+                files = {"docs/a.md": 1000 + 100 * day, "docs/b.md": 5000}
+                if day >= 720:
+                    files["docs/new.md"] = 2000
+                history.record(f"c{day}", files, 10 * day, recorded_at=now - (729 - day) * SECONDS_PER_DAY)
+            latest = history.record("c729", {"docs/a.md": 73900, "docs/b.md": 5000, "docs/new.md": 2000}, 7290)
+            assert latest == 730, "Repeating the latest snapshot should not append a new one"
+            assert len(history.commits("c100")) == 1, "Snapshots should be found by commit"
+
+            growth = history.growth(30, max_total_bytes=150 * 1024)
+            assert growth["baseline_commit"] == "c699", f"Baseline should be 30 days back: {growth}"
+            assert growth["bytes_per_day"] == round((3000 + 2000) / 30, 1), f"Unexpected rate: {growth}"
+            assert growth["tokens_per_day"] == 10.0, f"Unexpected token rate: {growth}"
+            assert growth["days_until_limit"] > 0, "Growing docs should project when the limit is hit"
+
+            fastest = history.fastest_growing(30, limit=5)
+            assert [(f["path"], f["delta_bytes"], f["new"]) for f in fastest] == [
+                ("docs/a.md", 3000, False), ("docs/new.md", 2000, True)], f"Unexpected fastest: {fastest}"
+
+            for query, args in (
+                ("SELECT id FROM snapshots ORDER BY recorded_at DESC, id DESC LIMIT 1", ()),
+                ("SELECT id FROM snapshots WHERE recorded_at <= ? ORDER BY recorded_at DESC, id DESC LIMIT 1", (now,)),
+                ("SELECT id FROM snapshots WHERE commit_sha = ?", ("c1",)),
+            ):
+                plan = " ".join(row[-1] for row in history.db.execute(f"EXPLAIN QUERY PLAN {query}", args))
+                assert "INDEX" in plan and "TEMP B-TREE" not in plan, \
+                    f"Trend lookups should use an index: {plan}"
+
+        write_doc("docs/a.md", 80000)
+        result = run(CHECK_PATH)
+        assert result.returncode == 0, f"Check failed: {result.stderr}"
+        trend = read_report()["trend"]
+        assert trend["fastest_growing"][0]["path"] == "docs/a.md", f"Report should carry the trend: {trend}"
+        assert "Growth Trend" in result.stdout, "Console summary should show the trend"
+
+        result = run(GENERATOR_PATH)
+        with open(os.path.join(".docs-reports", "docs-size-report.md")) as f:
+            markdown = f.read()
+        assert "## Growth Trend" in markdown and "KB/day" in markdown, "Markdown should show the growth rate"
+        assert "## Fastest-Growing Files" in markdown and "| `docs/a.md` |" in markdown, \
+            "Markdown should list the fastest-growing files"
+
+        subprocess.run(["python3", CHECK_PATH, "--no-history"], capture_output=True, text=True)
+        assert "trend" not in read_report(), "--no-history should leave the trend out"
+
+        print("✅ test_size_history_reports_growth_from_indexed_snapshots passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+if __name__ == "__main__":
+    print("\n🧪 Running docs size monitor tests...\n")
+
+    try:
+        test_reports_sizes_within_limits()
+        test_flags_every_threshold_in_json_and_markdown()
+        test_token_estimates_follow_markdown_structure()
+        test_token_counts_cached_per_category_and_file()
+        test_words_only_gate_checks_words_alone()
+        test_size_history_reports_growth_from_indexed_snapshots()
+
+        print("\n✅ All tests passed!\n")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}\n")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Unexpected error: {e}\n")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
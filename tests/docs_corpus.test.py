@@ -0,0 +1,215 @@
+"""Tests for the shared docs corpus."""
+
+import builtins
+import importlib.util
+import io
+import os
+import re
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".scripts")
+sys.path.insert(0, SCRIPTS_DIR)
+
+from docs_anchors import parse_headings  # noqa: E402
+from docs_corpus import DocsCorpus, count_words  # noqa: E402
+from docs_watch import PollingWatcher, watch  # noqa: E402
+from path_index import PathIndex  # noqa: E402
+
+
+def setup_test_env():
+    """Create a temporary project with a small governed docs tree."""
+    tmpdir = tempfile.mkdtemp()
+    os.chdir(tmpdir)
+    write("Taskfile.yml", "version: '3'\ntasks:\n  hygiene:size:\n    cmds: [echo]\n")
+    write("docs/index.md", "# Index\n\n| [guide/](guide/) | Guides |\n| [a-b/](a-b/) | More |\n")
+    write("docs/README.md", "# Docs\n\nSee [the guide](guide/README.md#setup).\n")
+    write("docs/guide/README.md", "# Guide\r\n\r\n## Setup\r\n\r\nRun task hygiene:size.\r\n")
+    write("docs/a-b/README.md", "# A-B\n\nSee [top](../README.md).\n")
+    write("docs/archive/old.md", "old " * 100)
+    return tmpdir
+
+
+def teardown_test_env(tmpdir):
+    """Clean up temporary test directory."""
+    DocsCorpus.reset_shared()
+    os.chdir("/")
+    shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def write(rel_path, content):
+    if os.path.dirname(rel_path):
+        os.makedirs(os.path.dirname(rel_path), exist_ok=True)
+    with open(rel_path, "w", newline="") as f:
+        f.write(content)
+
+
+def load_script(name):
+    spec = importlib.util.spec_from_file_location(name.replace("-", "_"), os.path.join(SCRIPTS_DIR, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_corpus_matches_filesystem_views():
+    """Test that the corpus answers what rglob, iterdir and read_text used to."""
+    tmpdir = setup_test_env()
+    try:
+        corpus = DocsCorpus.scan()
+
+        expected = [str(p) for p in sorted(Path("docs").rglob("*.md"))]
+        assert [d.path for d in corpus.markdown()] == expected, "Markdown files should be in rglob order"
+        assert "docs/archive/old.md" not in [d.path for d in corpus.markdown(exclude=("archive",))], \
+            "Excluded directories should be skipped"
+
+        files, dirs = corpus.children("docs")
+        assert files == sorted(p.name for p in Path("docs").iterdir() if p.is_file()), "Should list root files"
+        assert dirs == sorted(p.name for p in Path("docs").iterdir() if p.is_dir()), "Should list root dirs"
+
+        guide = corpus.get("./docs/guide/../guide/README.md")
+        assert guide.text == Path("docs/guide/README.md").read_text(), "Text should use universal newlines"
+        assert guide.size == os.path.getsize("docs/guide/README.md"), "Size should come from the walk"
+        assert guide.word_count == len(re.findall(r"\b\w+\b", guide.text)), "Word count should match"
+        assert guide.headings == parse_headings(guide.text), "Headings should match the parser"
+
+        indexed = PathIndex.scan(corpus=corpus)
+        walked = PathIndex.scan()
+        assert (indexed.files, indexed.dirs) == (walked.files, walked.dirs), "Grafted index should match a full walk"
+
+        print("✅ test_corpus_matches_filesystem_views passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_docs_checks_share_one_walk_and_one_read():
+    """Test that structure, accuracy and size checks in one process list and read docs once."""
+    tmpdir = setup_test_env()
+    structure = load_script("check-docs-structure")
+    accuracy = load_script("check-docs-accuracy")
+
+    scanned, opened = [], []
+    original_scandir, original_open = os.scandir, builtins.open
+
+    def counting_scandir(path="."):
+        scanned.append(os.path.normpath(os.fspath(path)))
+        return original_scandir(path)
+
+    def counting_open(file, *args, **kwargs):
+        if isinstance(file, (str, os.PathLike)):
+            opened.append(os.path.normpath(os.fspath(file)))
+        return original_open(file, *args, **kwargs)
+
+    os.scandir, builtins.open, io.open = counting_scandir, counting_open, counting_open
+    try:
+        structure.check_docs_structure()
+        context = accuracy.build_context()
+        md_files = [Path(d.path) for d in context["docs"].markdown()]
+        issues = list(accuracy.iter_scan(md_files, context, use_cache=False))
+        sizes = [d.size for d in DocsCorpus.shared().markdown(exclude=("archive",))]
+        words = [d.word_count for d in DocsCorpus.shared().markdown()]
+    finally:
+        os.scandir, builtins.open, io.open = original_scandir, original_open, original_open
+        teardown_test_env(tmpdir)
+
+    docs_scans = [p for p in scanned if p == "docs" or p.startswith("docs/")]
+    assert "docs" in docs_scans, "The docs tree should have been walked"
+    assert sorted(docs_scans) == sorted(set(docs_scans)), f"Each docs directory should be listed once: {docs_scans}"
+    docs_reads = [p for p in opened if p.startswith("docs/")]
+    assert "docs/guide/README.md" in docs_reads, "Docs should have been read"
+    assert sorted(docs_reads) == sorted(set(docs_reads)), f"Each docs file should be read once: {docs_reads}"
+    assert issues == [], f"Fixture docs should be clean: {issues}"
+    assert len(sizes) == 4 and len(words) == 5, "Size checks should see the same corpus"
+
+    print("✅ test_docs_checks_share_one_walk_and_one_read passed")
+
+
+def test_streaming_word_count_matches_findall_at_any_chunk_size():
+    """Test that words split across chunk boundaries are counted once."""
+    text = "Héllo wörld_1 foo-bar 42 ✅ naïve\n\n| a | b |\nend_word" * 7
+    expected = len(re.findall(r"\b\w+\b", text))
+    for size in (1, 2, 3, 5, 7, 64, len(text)):
+        chunks = (text[i:i + size] for i in range(0, len(text), size))
+        assert count_words(chunks) == expected, f"Chunk size {size} miscounted"
+    assert count_words([]) == 0, "No chunks means no words"
+
+    tmpdir = setup_test_env()
+    try:
+        doc = DocsCorpus.scan().get("docs/guide/README.md")
+        words = doc.word_count
+        assert words == len(re.findall(r"\b\w+\b", Path("docs/guide/README.md").read_text())), "Should match"
+        assert doc._text is None and doc._bytes is None, "Counting words should not keep the contents"
+    finally:
+        teardown_test_env(tmpdir)
+
+    print("✅ test_streaming_word_count_matches_findall_at_any_chunk_size passed")
+
+
+def test_watch_refreshes_corpus_and_structure_in_place():
+    """Test polling, in-place corpus refresh, path regrafting and structure revalidation."""
+    tmpdir = setup_test_env()
+    structure = load_script("check-docs-structure")
+    try:
+        corpus = DocsCorpus.shared()
+        index = PathIndex.scan(corpus=corpus)
+        readme = corpus.get("docs/README.md")
+        assert readme.text, "Load the contents before refreshing"
+        watcher = PollingWatcher(["docs"])
+        assert watcher.poll() == (set(), set()), "Nothing changed yet"
+
+        write("docs/guide/setup.md", "# Setup\n")
+        write("docs/a-b/README.md", "# A-B\n\nEdited.\n")
+        changed, removed = watcher.poll()
+        assert changed == {"docs/guide/setup.md", "docs/a-b/README.md"} and removed == set(), changed
+        assert structure.structure_affected(corpus, changed, removed), "An added file can change the structure"
+        corpus.refresh(changed)
+        index.regraft(corpus)
+        assert corpus.get("docs/README.md") is readme, "Unchanged files should keep their loaded contents"
+        assert "Edited" in corpus.get("docs/a-b/README.md").text, "Changed files should be read again"
+        assert index.exists("docs/guide/setup.md"), "New files should be grafted into the path index"
+
+        write("docs/guide/setup.md", "# Setup\n\nMore.\n")
+        changed, removed = watcher.poll()
+        assert not structure.structure_affected(corpus, changed, removed), "A content edit cannot"
+
+        corpus.refresh(changed)
+        shutil.rmtree("docs/guide")
+        changed, removed = watcher.poll()
+        assert removed == {"docs/guide", "docs/guide/README.md", "docs/guide/setup.md"}, \
+            f"Removed directories should be reported: {removed}"
+        corpus.refresh(changed)
+        index.regraft(corpus)
+        assert not index.exists("docs/guide/README.md"), "Removed files should leave the path index"
+        violations = structure.check_docs_structure()
+        assert {v["type"] for v in violations} == {"missing_directory", "unexpected_directory"}, violations
+
+        calls = []
+        write("docs/a-b/extra.md", "x\n")
+        watch(watcher, lambda c, r: calls.append((c, r)), sleep=lambda _: None, cycles=2)
+        assert calls == [({"docs/a-b/extra.md"}, set())], f"watch() should report one batch: {calls}"
+
+        print("✅ test_watch_refreshes_corpus_and_structure_in_place passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+if __name__ == "__main__":
+    print("\n🧪 Running docs corpus tests...\n")
+
+    try:
+        test_corpus_matches_filesystem_views()
+        test_docs_checks_share_one_walk_and_one_read()
+        test_streaming_word_count_matches_findall_at_any_chunk_size()
+        test_watch_refreshes_corpus_and_structure_in_place()
+
+        print("\n✅ All tests passed!\n")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}\n")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Unexpected error: {e}\n")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,126 @@
+"""Benchmark line-number lookup in the documentation accuracy checker.
+
+Builds markdown documents of 1.25, 2.5 and 5 MB dense with broken links,
+runs the full per-file analysis on each and checks that wall time grows
+linearly with document size. The legacy ``content[:offset].count("\\n")``
+lookup is timed on much smaller inputs for comparison, since it is
+quadratic and would take minutes at 5 MB.
+
+Usage:
+    python3 tests/docs_line_index.bench.py
+"""
+
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".scripts")
+sys.path.insert(0, SCRIPTS_DIR)
+
+from docs_anchors import AnchorIndex  # noqa: E402
+from docs_lines import LineIndex  # noqa: E402
+from path_index import PathIndex  # noqa: E402
+
+SIZES_MB = (1.25, 2.5, 5)
+LEGACY_SIZES_KB = (64, 128, 256)
+# Doubling the input may at most multiply the time by this factor.
+MAX_DOUBLING_RATIO = 3.0
+
+LINE = "See [the missing guide](missing/guide.md) and run task hygiene:gone here.\n"
+
+
+def load_checker():
+    spec = importlib.util.spec_from_file_location(
+        "check_docs_accuracy", os.path.join(SCRIPTS_DIR, "check-docs-accuracy.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_document(size_bytes):
+    return LINE * (size_bytes // len(LINE))
+
+
+def best_of(func, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench_checker(checker):
+    """Time analyze_file() on generated documents of increasing size."""
+    context = {"tasks": set(), "workflows": set(), "paths": PathIndex.scan(), "anchors": AnchorIndex()}
+    rows = []
+    for size_mb in SIZES_MB:
+        md_path = Path("docs/big.md")
+        md_path.write_text(build_document(int(size_mb * 1024 * 1024)))
+        issues = []
+        elapsed = best_of(lambda: issues.append(len(checker.analyze_file(md_path, context))))
+        rows.append((size_mb, issues[-1], elapsed))
+    return rows
+
+
+def bench_legacy():
+    """Time the old prefix-count lookup against LineIndex on small documents."""
+    rows = []
+    for size_kb in LEGACY_SIZES_KB:
+        content = build_document(size_kb * 1024)
+        offsets = [i for i in range(0, len(content), len(LINE))]
+
+        def legacy():
+            for offset in offsets:
+                content[:offset].count("\n")
+
+        def indexed():
+            lines = LineIndex(content)
+            for offset in offsets:
+                lines.line_of(offset)
+
+        rows.append((size_kb, best_of(legacy), best_of(indexed)))
+    return rows
+
+
+def main():
+    tmpdir = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    try:
+        os.chdir(tmpdir)
+        os.makedirs("docs")
+        checker = load_checker()
+
+        print("\n📏 Line-index benchmark (analyze_file)\n")
+        print("| Size (MB) | Issues | Time (s) |")
+        print("|-----------|--------|----------|")
+        rows = bench_checker(checker)
+        for size_mb, issue_count, elapsed in rows:
+            print(f"| {size_mb:>9} | {issue_count:>6} | {elapsed:>8.3f} |")
+
+        print("\n🐢 Legacy prefix-count vs LineIndex\n")
+        print("| Size (KB) | Legacy (s) | LineIndex (s) |")
+        print("|-----------|------------|---------------|")
+        for size_kb, legacy, indexed in bench_legacy():
+            print(f"| {size_kb:>9} | {legacy:>10.3f} | {indexed:>13.4f} |")
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    for (_, _, smaller), (_, _, larger) in zip(rows, rows[1:]):
+        ratio = larger / smaller
+        if ratio > MAX_DOUBLING_RATIO:
+            print(f"\n❌ Non-linear scaling: doubling input took {ratio:.1f}x longer\n")
+            return 1
+
+    print("\n✅ analyze_file scales linearly with document size\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Microbenchmark the combined docs reference scanner against four passes.
+
+Generates a prose-heavy markdown document sprinkled with links, task
+references, workflow paths and backticked filenames, then times:
+
+- the legacy approach: one ``re.finditer`` pass per reference pattern
+- the combined scanner: one pass of ``reference_scanner()`` plus the
+  anchored per-type match that ``scan_references()`` hands to validators
+
+Both must find the same number of references.
+
+Usage:
+    python3 tests/docs_reference_scan.bench.py
+"""
+
+import importlib.util
+import os
+import random
+import re
+import sys
+import time
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".scripts")
+sys.path.insert(0, SCRIPTS_DIR)
+
+LEGACY_PATTERNS = (
+    r'\[([^\]]*)\]\(([^)]+)\)',
+    r'(?:^|\s)task\s+([a-z][a-z0-9_-]*:[a-z0-9:_-]+)',
+    r'\.github/workflows/([a-z0-9_-]+\.yml)',
+    r'`([a-zA-Z0-9_./-]+\.[a-z]{1,4})`',
+)
+
+WORDS = "the docs guide page section explains how to run build deploy test and review".split()
+SUFFIXES = (
+    (0.05, " See [the guide](guide/README.md)."),
+    (0.08, " Then run task hygiene:docs-size locally."),
+    (0.10, " Edit `server.js` if needed."),
+    (0.11, " Configured in .github/workflows/netlify-deploy.yml."),
+)
+LINE_COUNTS = (10_000, 50_000, 100_000)
+
+
+def load_checker():
+    spec = importlib.util.spec_from_file_location(
+        "check_docs_accuracy", os.path.join(SCRIPTS_DIR, "check-docs-accuracy.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_document(line_count):
+    rng = random.Random(42)
+    lines = []
+    for _ in range(line_count):
+        line = " ".join(rng.choice(WORDS) for _ in range(12))
+        roll = rng.random()
+        for threshold, suffix in SUFFIXES:
+            if roll < threshold:
+                line += suffix
+                break
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def best_of(func, repeat=5):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    checker = load_checker()
+    legacy = [re.compile(p) for p in LEGACY_PATTERNS]
+
+    print("\n🔬 Reference scan microbenchmark\n")
+    print("| Lines | Size (KB) | Refs | Four passes (s) | Single scan (s) | Speedup |")
+    print("|-------|-----------|------|-----------------|-----------------|---------|")
+    for line_count in LINE_COUNTS:
+        content = build_document(line_count)
+        four_time, four_count = best_of(
+            lambda: sum(1 for p in legacy for _ in p.finditer(content))
+        )
+        one_time, one_count = best_of(
+            lambda: sum(1 for _ in checker.scan_references(content))
+        )
+        if four_count != one_count:
+            print(f"\n❌ Reference counts differ: {four_count} vs {one_count}\n")
+            return 1
+        print(
+            f"| {line_count:>5} | {len(content) // 1024:>9} | {one_count:>4} "
+            f"| {four_time:>15.4f} | {one_time:>15.4f} | {four_time / one_time:>6.2f}x |"
+        )
+
+    print("\n✅ Single scan finds the same references as four passes\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""Benchmark how the docs hygiene checks scale with the size of docs/.
+
+For each corpus size this generates a synthetic project with
+tests/synthetic_docs.py (same spec and seed every time, so every commit
+is measured on identical input), then runs each check in a fresh
+interpreter inside it and records:
+
+- wall time, best of RUNS runs
+- peak RSS of the check's process, from ``os.wait4``
+
+Results are written as JSON to .docs-reports/docs-scale/<commit>.json.
+Pass --compare with an earlier commit (or a results file) to print the
+change for every size and check; the run fails when a check got slower
+or bigger than TOLERANCE times the earlier result.
+
+Usage:
+    python3 tests/docs_scale.bench.py
+    python3 tests/docs_scale.bench.py --sizes 100,1000 --compare a898428
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = ROOT / ".scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from docs_size_history import current_commit  # noqa: E402
+from synthetic_docs import CorpusSpec, generate  # noqa: E402
+
+SIZES = (100, 1_000, 10_000, 50_000)
+RUNS = 3
+TOLERANCE = 1.5
+RESULTS_DIR = ROOT / ".docs-reports" / "docs-scale"
+
+CHECKS = {
+    "accuracy": ["check-docs-accuracy.py", "--no-cache"],
+    "structure": ["check-docs-structure.py"],
+    "size": ["check-docs-size.py", "--no-history"],
+}
+
+
+def run_check(argv, cwd):
+    """Run *argv* to completion; return ``(wall_s, peak_rss_mb, exit_code)``."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(argv, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    _, status, usage = os.wait4(proc.pid, 0)
+    wall = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    rss_bytes = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+    return wall, rss_bytes / (1024 * 1024), proc.returncode
+
+
+def measure(files, spec_overrides, runs):
+    spec = CorpusSpec(files=files, **spec_overrides)
+    workdir = tempfile.mkdtemp(prefix=f"docs-scale-{files}-")
+    try:
+        start = time.perf_counter()
+        summary = generate(workdir, spec)
+        generate_s = time.perf_counter() - start
+        rows = []
+        for name, (script, *args) in CHECKS.items():
+            argv = [sys.executable, str(SCRIPTS_DIR / script), *args]
+            samples = [run_check(argv, workdir) for _ in range(runs)]
+            rows.append({
+                "files": files,
+                "check": name,
+                "wall_s": round(min(s[0] for s in samples), 3),
+                "peak_rss_mb": round(max(s[1] for s in samples), 1),
+                "exit_code": samples[-1][2],
+            })
+        return {"files": files, "bytes": summary["bytes"], "generate_s": round(generate_s, 2)}, rows
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def load_results(ref):
+    path = Path(ref)
+    if not path.is_file():
+        matches = sorted(RESULTS_DIR.glob(f"{ref}*.json"))
+        if len(matches) != 1:
+            sys.exit(f"❌ No single results file for {ref!r} in {os.path.relpath(RESULTS_DIR, ROOT)}")
+        path = matches[0]
+    return json.loads(path.read_text())
+
+
+def compare(results, previous):
+    """Print the change against *previous*; return the regressions found."""
+    before = {(r["files"], r["check"]): r for r in previous["results"]}
+    found = []
+    print(f"\n📊 Compared with {previous['commit'][:12]}\n")
+    print(f"  {'files':>7}  {'check':<10}{'wall':>10}{'rss':>10}")
+    for row in results:
+        old = before.get((row["files"], row["check"]))
+        if old is None:
+            continue
+        wall = row["wall_s"] / old["wall_s"] if old["wall_s"] else 1.0
+        rss = row["peak_rss_mb"] / old["peak_rss_mb"] if old["peak_rss_mb"] else 1.0
+        print(f"  {row['files']:>7}  {row['check']:<10}{wall:>9.2f}x{rss:>9.2f}x")
+        for label, ratio in (("wall time", wall), ("peak RSS", rss)):
+            if ratio > TOLERANCE:
+                found.append(f"{row['check']} at {row['files']} files: {label} {ratio:.2f}x")
+    return found
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark docs hygiene checks on synthetic corpora")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="comma-separated file counts")
+    parser.add_argument("--runs", type=int, default=RUNS, help="runs per check; the best wall time is kept")
+    parser.add_argument("--output", help="results file (default: .docs-reports/docs-scale/<commit>.json)")
+    parser.add_argument("--compare", metavar="COMMIT_OR_FILE", help="earlier results to compare against")
+    parser.add_argument("--file-size", type=int, default=CorpusSpec.FIELDS["file_size"][0])
+    parser.add_argument("--links", type=int, default=CorpusSpec.FIELDS["links"][0])
+    parser.add_argument("--depth", type=int, default=CorpusSpec.FIELDS["depth"][0])
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    overrides = {"file_size": args.file_size, "links": args.links, "depth": args.depth}
+    previous = load_results(args.compare) if args.compare else None
+
+    print("\n📈 Docs hygiene scaling (synthetic corpus)\n")
+    print(f"  {'files':>7}  {'check':<10}{'wall (s)':>10}{'peak RSS (MB)':>15}{'exit':>6}")
+    corpora, results = [], []
+    for files in sizes:
+        corpus, rows = measure(files, overrides, args.runs)
+        corpora.append(corpus)
+        results += rows
+        for row in rows:
+            print(f"  {files:>7}  {row['check']:<10}{row['wall_s']:>10.3f}{row['peak_rss_mb']:>15.1f}"
+                  f"{row['exit_code']:>6}")
+
+    commit = current_commit(ROOT)
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "commit": commit,
+        "recorded_at": int(time.time()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "spec": CorpusSpec(**overrides).to_dict(),
+        "corpora": corpora,
+        "results": results,
+    }, indent=2) + "\n")
+    print(f"\n📝 Results written to {os.path.relpath(output, ROOT)}")
+
+    # Findings exit 1; anything else means the check itself broke.
+    errors = [f"{r['check']} at {r['files']} files exited {r['exit_code']}"
+              for r in results if r["exit_code"] not in (0, 1)]
+    if previous:
+        errors += compare(results, previous)
+    if errors:
+        print("\n❌ Scaling regressions:")
+        for error in errors:
+            print(f"  - {error}")
+        sys.exit(1)
+    print("✅ Docs checks scaled within tolerance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Tests for the SQLite findings store shared by the scanner report generators."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".scripts")
+sys.path.insert(0, SCRIPTS_DIR)
+
+from findings_store import KEEP_RUNS, SOURCES, FindingsStore  # noqa: E402
+
+
+def setup_test_env():
+    """Create a temporary directory for test files."""
+    tmpdir = tempfile.mkdtemp()
+    os.chdir(tmpdir)
+    return tmpdir
+
+
+def teardown_test_env(tmpdir):
+    """Clean up temporary test directory."""
+    os.chdir("/")
+    shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def write_source(tool, content):
+    path = SOURCES[tool]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content if isinstance(content, str) else json.dumps(content))
+
+
+def write_all_sources():
+    write_source("sast", {"results": [
+        {"check_id": "js.eval", "path": "server.js", "start": {"line": 7}, "extra": {"severity": "ERROR", "message": "eval"}},
+        {"check_id": "js.log", "path": "app.js", "start": {"line": 2}, "extra": {"severity": "WARNING", "message": "log"}},
+    ], "errors": [{"message": "timeout\ndetails"}]})
+    write_source("dependencies", {"Results": [{"Target": "package-lock.json", "Vulnerabilities": [
+        {"VulnerabilityID": "CVE-1", "PkgName": "express", "Severity": "CRITICAL", "Title": "RCE"},
+    ]}]})
+    write_source("dast", {"site": [{"@name": "http://localhost", "alerts": [
+        {"pluginid": "10038", "name": "CSP missing", "riskcode": "2"},
+    ]}]})
+    write_source("secrets", [{"RuleID": "aws", "File": "server.js", "StartLine": 3, "Description": "AWS key"}])
+    write_source("complexity", (
+        "NLOC,CCN,token,PARAM,length,location,file,function,long_name,start,end\n"
+        '40,12,300,2,45,"g@20-65@./server.js",./server.js,g,g(a),20,65\n'
+        '10,3,50,1,12,"f@1-12@./a.js",./a.js,f,f(),1,12\n'
+    ))
+
+
+def test_ingests_every_scanner_into_one_queryable_table():
+    """Test that every scanner's findings are normalized and found by one cross-tool query."""
+    tmpdir = setup_test_env()
+    try:
+        write_all_sources()
+        with FindingsStore() as store:
+            runs = {tool: store.ingest(tool) for tool in SOURCES}
+            in_server = store.query(path="server.js")
+            counts = store.counts()
+            sast = list(store.documents(runs["sast"]))
+
+        assert [(f["tool"], f["severity"], f["line"]) for f in in_server] == [
+            ("sast", "high", 7), ("secrets", "high", 3), ("complexity", "medium", 20),
+        ], in_server
+        assert counts == {
+            "sast": {"high": 1, "medium": 1}, "dependencies": {"critical": 1}, "dast": {"medium": 1},
+            "secrets": {"high": 1}, "complexity": {"medium": 1},
+        }, counts
+        assert [kind for kind, _ in sast] == ["finding", "finding", "error"], "Scan errors should be kept apart"
+        assert sast[0][1]["extra"]["message"] == "eval", "The scanner's own record should be returned"
+
+        print("✅ test_ingests_every_scanner_into_one_queryable_table passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_ingestion_is_incremental_per_run():
+    """Test that unchanged reports are not read again, old runs are pruned and bad reports roll back."""
+    tmpdir = setup_test_env()
+    try:
+        with FindingsStore() as store:
+            write_source("secrets", "null")
+            first = store.ingest("secrets")
+            assert store.ingest("secrets") == first, "An unchanged report should reuse its run"
+            assert store.query() == [], "Gitleaks' null report has no findings"
+
+            for i in range(KEEP_RUNS + 2):
+                write_source("secrets", [{"RuleID": f"rule-{i}", "File": "a.env"}] * (i + 1))
+                os.utime(SOURCES["secrets"], ns=(i * 10**9, i * 10**9))
+                latest = store.ingest("secrets")
+            assert latest != first
+            assert [f["rule"] for f in store.query()] == [f"rule-{KEEP_RUNS + 1}"] * (KEEP_RUNS + 2), \
+                "Queries should read the latest run only"
+            runs = store.db.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+            assert runs == KEEP_RUNS, f"Only {KEEP_RUNS} runs should be kept, found {runs}"
+
+            write_source("secrets", '[{"RuleID": "x"}, ')
+            try:
+                store.ingest("secrets")
+            except RuntimeError as e:
+                assert "Failed to read Secrets JSON report" in str(e), e
+            else:
+                raise AssertionError("A truncated report should fail")
+            assert store.latest_run("secrets") == latest, "A failed ingestion should leave no run behind"
+    finally:
+        teardown_test_env(tmpdir)
+
+    print("✅ test_ingestion_is_incremental_per_run passed")
+
+
+def test_query_script_lists_findings_across_scanners():
+    """Test that query-findings.py ingests the reports it finds and filters by path."""
+    tmpdir = setup_test_env()
+    try:
+        write_all_sources()
+        result = subprocess.run(
+            [sys.executable, os.path.join(SCRIPTS_DIR, "query-findings.py"), "--ingest", "--path", "server.js"],
+            capture_output=True, text=True,
+        )
+        assert result.returncode == 0, result.stderr
+        assert "| sast | high | js.eval | `server.js:7` | eval |" in result.stdout, result.stdout
+        assert "🔎 3 finding(s)" in result.stdout, result.stdout
+    finally:
+        teardown_test_env(tmpdir)
+
+    print("✅ test_query_script_lists_findings_across_scanners passed")
+
+
+if __name__ == "__main__":
+    print("\n🧪 Running findings store tests...\n")
+
+    try:
+        test_ingests_every_scanner_into_one_queryable_table()
+        test_ingestion_is_incremental_per_run()
+        test_query_script_lists_findings_across_scanners()
+
+        print("\n✅ All tests passed!\n")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}\n")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Unexpected error: {e}\n")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
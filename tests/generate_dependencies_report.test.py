@@ -30,9 +30,9 @@ SCRIPT_PATH = os.path.join(
 )
 
 
-def run_script(cwd):
+def run_script(cwd, *args):
     return subprocess.run(
-        ["python3", SCRIPT_PATH],
+        ["python3", SCRIPT_PATH, *args],
         capture_output=True,
         text=True,
         cwd=cwd,
@@ -219,6 +219,30 @@ def test_severity_counts_in_summary():
         teardown_test_env(tmpdir)
 
 
+def test_summary_sidecar():
+    """Test that the counts are written to summary.json and a failed run removes it."""
+    tmpdir = setup_test_env()
+    try:
+        write_json(tmpdir, {"Results": [{"Target": "package-lock.json", "Vulnerabilities": [{"Severity": "HIGH"}, {"Severity": "LOW"}]}]})
+        summary_path = os.path.join(tmpdir, ".dependencies-reports", "summary.json")
+
+        result = run_script(tmpdir)
+        assert result.returncode == 0, f"Blocking findings should not fail the run. stderr: {result.stderr}"
+        with open(summary_path) as f:
+            summary = json.load(f)
+        assert summary["scanner"] == "dependencies" and summary["report"] == "dependencies-report.md", summary
+        assert summary["blocking"] == 1, summary
+        assert summary["counts"] == {"critical": 0, "high": 1, "medium": 0, "low": 1, "total": 2}, summary
+
+        os.remove(os.path.join(tmpdir, ".dependencies-reports", "dependencies-report.json"))
+        assert run_script(tmpdir).returncode == 1, "A missing report should still fail"
+        assert not os.path.exists(summary_path), "A failed run should not leave the previous summary"
+
+        print("✅ test_summary_sidecar passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
 if __name__ == "__main__":
     print("\n🧪 Running dependency vulnerability script tests...\n")
 
@@ -228,6 +252,7 @@ if __name__ == "__main__":
         test_identifies_critical_and_high_vulns()
         test_report_includes_guidelines()
         test_severity_counts_in_summary()
+        test_summary_sidecar()
 
         print("\n✅ All tests passed!\n")
         sys.exit(0)
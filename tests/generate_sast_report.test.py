@@ -1,5 +1,7 @@
 """Tests for the SAST report generation script."""
 
+import importlib.util
+import io
 import json
 import os
 import shutil
@@ -22,17 +24,23 @@ def teardown_test_env(tmpdir):
     shutil.rmtree(tmpdir, ignore_errors=True)
 
 
-SCRIPT_PATH = os.path.join(
-    os.path.dirname(os.path.abspath(__file__)),
-    "..",
-    ".scripts",
-    "generate-sast-md.py",
-)
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".scripts")
+SCRIPT_PATH = os.path.join(SCRIPTS_DIR, "generate-sast-md.py")
+sys.path.insert(0, SCRIPTS_DIR)
 
+from json_stream import iter_arrays  # noqa: E402
 
-def run_script(cwd):
+
+def load_generator():
+    spec = importlib.util.spec_from_file_location("generate_sast_md", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_script(cwd, *args):
     return subprocess.run(
-        ["python3", SCRIPT_PATH],
+        ["python3", SCRIPT_PATH, *args],
         capture_output=True,
         text=True,
         cwd=cwd,
@@ -177,6 +185,209 @@ def test_scan_errors_shown_in_report():
         teardown_test_env(tmpdir)
 
 
+def test_stream_reader_handles_chunk_boundaries():
+    """Test that findings split across read chunks are parsed exactly as json.load does."""
+    data = {
+        "version": "1.2.3",
+        "results": [{"check_id": f"r{i}", "extra": {"n": 12.5e3 * i, "m": "é \\ \""}} for i in range(5)],
+        "paths": {"scanned": ["a.py", {"nested": [1, 2]}]},
+        "errors": [-1, 1e-7, None, "x"],
+    }
+    text = json.dumps(data)
+    for chunk_size in (1, 2, 3, 7, 64):
+        items = list(iter_arrays(io.StringIO(text), ("results", "errors"), chunk_size=chunk_size))
+        expected = [("results", r) for r in data["results"]] + [("errors", e) for e in data["errors"]]
+        assert items == expected, f"Chunk size {chunk_size} changed the parse"
+
+    for bad in ('{"results": [1,]}', '{"results": [{"a": 1}', '{"results": []} extra'):
+        try:
+            list(iter_arrays(io.StringIO(bad), ("results",), chunk_size=4))
+        except ValueError:
+            continue
+        raise AssertionError(f"Malformed JSON should be rejected: {bad}")
+
+    print("✅ test_stream_reader_handles_chunk_boundaries passed")
+
+
+def test_streamed_report_matches_in_memory_report():
+    """Test that the streamed report is identical to one built from the loaded JSON."""
+    tmpdir = setup_test_env()
+    try:
+        findings = [
+            {
+                "check_id": f"rule.{i}",
+                "path": f"src/f{i}.py",
+                "start": {"line": i},
+                "extra": {"severity": "ERROR" if i % 3 == 0 else "WARNING", "message": "msg\nline " * (i + 1)},
+            }
+            for i in range(30)
+        ]
+        for errors in (
+            [{"type": "ParseError", "message": "bad\nthing"}, {"message": "worse"}],
+            [{"type": ["PartialParsing"], "path": "w.yml", "spans": [{"start": {"line": 4}}]},
+             {"type": "ParseError", "message": "other"}],
+        ):
+            data = {"results": findings, "errors": errors, "paths": {"scanned": ["src"]}}
+            write_json(tmpdir, data)
+            generator = load_generator()
+            expected, expected_errors = generator.build_markdown_report(data)
+            error_count = generator.stream_markdown_report(
+                ".sast-reports/sast-report.json", ".sast-reports/sast-report.md"
+            )
+            with open(".sast-reports/sast-report.md") as f:
+                streamed = f.read()
+
+            def strip_time(text):
+                return "\n".join(line for line in text.splitlines() if not line.startswith("**Generated**"))
+
+            assert strip_time(streamed) == strip_time(expected), "Streamed report should match"
+            assert error_count == expected_errors == 10, f"Expected 10 error findings, got {error_count}"
+
+        print("✅ test_streamed_report_matches_in_memory_report passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def semgrep_finding(rule, path, line, code, severity="ERROR"):
+    return {
+        "check_id": rule,
+        "path": path,
+        "start": {"line": line},
+        "end": {"line": line},
+        "extra": {"severity": severity, "message": f"{rule} found", "lines": code},
+    }
+
+
+def test_baseline_splits_new_existing_and_fixed_findings():
+    """Test that --baseline matches accepted findings by fingerprint, not line number."""
+    tmpdir = setup_test_env()
+    try:
+        write_json(tmpdir, {"results": [
+            semgrep_finding("exec", "app.py", 10, "exec(cmd)"),
+            semgrep_finding("exec", "app.py", 20, "exec(cmd)"),
+            semgrep_finding("eval", "app.py", 30, "eval(x)", "WARNING"),
+            semgrep_finding("pickle", "lib.py", 5, "requires login"),
+        ], "errors": []})
+        with open("lib.py", "w") as f:
+            f.write("\n" * 4 + "pickle.loads(data)\n")
+        result = run_script(tmpdir, "--update-baseline")
+        assert result.returncode == 0, f"Baseline should be written. stderr: {result.stderr}"
+        assert os.path.exists(".sast-reports/sast-baseline.json"), "Baseline should be stored in .sast-reports/"
+
+        # Code moved down three lines, one exec call and the eval were fixed,
+        # the pickle call was reindented and a new finding appeared.
+        with open("lib.py", "w") as f:
+            f.write("\n" * 7 + "    pickle.loads(data)\n")
+        write_json(tmpdir, {"results": [
+            semgrep_finding("exec", "app.py", 13, "exec(cmd)"),
+            semgrep_finding("pickle", "lib.py", 8, "requires login"),
+            semgrep_finding("sqli", "db.py", 3, "cursor.execute(q % x)"),
+        ], "errors": []})
+        result = run_script(tmpdir, "--baseline")
+        assert result.returncode == 0, f"Script should succeed. stderr: {result.stderr}"
+        with open(".sast-reports/sast-report.md") as f:
+            content = f.read()
+
+        new = content[content.index("New Error Findings"):content.index("Existing Findings")]
+        existing = content[content.index("Existing Findings"):content.index("Fixed Findings")]
+        fixed = content[content.index("Fixed Findings"):content.index("## Guidelines")]
+        assert "sqli" in new and "exec" not in new, f"Only the new finding should be new: {new}"
+        assert "`app.py:13`" in existing and "`lib.py:8`" in existing, f"Moved findings should match: {existing}"
+        assert "| exec |" in fixed and "`app.py:30`" in fixed, f"Missing findings should be fixed: {fixed}"
+        assert "| New | 1 |" in content and "| Existing | 2 |" in content and "| Fixed | 2 |" in content
+
+        os.remove(".sast-reports/sast-baseline.json")
+        result = run_script(tmpdir, "--baseline")
+        assert result.returncode != 0 and "--update-baseline" in result.stderr, "A missing baseline should fail"
+
+        print("✅ test_baseline_splits_new_existing_and_fixed_findings passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_oversized_report_is_aggregated_with_overflow_pages():
+    """Test that a report over --max-bytes keeps top-N tables and moves every finding to pages."""
+    tmpdir = setup_test_env()
+    try:
+        findings = [
+            semgrep_finding(f"rule.{i % 7}", f"src/f{i % 13}.py", i, "x", "ERROR" if i % 4 == 0 else "WARNING")
+            for i in range(400)
+        ]
+        findings += [semgrep_finding("rule.hot", "src/hot.py", i, "x") for i in range(100)]
+        write_json(tmpdir, {"results": findings, "errors": []})
+
+        result = run_script(tmpdir, "--max-bytes", "8000", "--top", "3")
+        assert result.returncode == 0, f"Script should succeed. stderr: {result.stderr}"
+        with open(".sast-reports/sast-report.md", encoding="utf-8") as f:
+            content = f.read()
+        assert len(content.encode("utf-8")) <= 8000, "Report should stay within the budget"
+        assert "Findings by Rule (top 3 of 8)" in content and "| rule.hot | 100 | 100 |" in content
+        assert "Findings by Path (top 3 of 14)" in content and "| `src/hot.py` | 100 | 100 |" in content
+        assert "`src/f1.py:1`" not in content, "Detail rows should move to the overflow pages"
+        assert "(sast-findings/index.md)" in content, "Report should link the overflow index"
+
+        pages_dir = os.path.join(".sast-reports", "sast-findings")
+        pages = sorted(name for name in os.listdir(pages_dir) if name.startswith("page-"))
+        assert len(pages) > 1, f"Findings should span several pages: {pages}"
+        rows = 0
+        for name in pages:
+            with open(os.path.join(pages_dir, name), encoding="utf-8") as f:
+                page = f.read()
+            assert len(page.encode("utf-8")) <= 8000, f"{name} should stay within the budget"
+            rows += page.count("\n| rule.")
+        assert rows == 500, f"Every finding should be on a page, got {rows}"
+        with open(os.path.join(pages_dir, "index.md"), encoding="utf-8") as f:
+            assert f"[{pages[-1]}]({pages[-1]})" in f.read(), "Index should list every page"
+
+        # A report that fits is written in full and stale pages are removed.
+        write_json(tmpdir, {"results": findings[:3], "errors": []})
+        result = run_script(tmpdir, "--max-bytes", "8000")
+        assert result.returncode == 0, f"Script should succeed. stderr: {result.stderr}"
+        with open(".sast-reports/sast-report.md", encoding="utf-8") as f:
+            content = f.read()
+        assert "Hotspots" not in content and "`src/f1.py:1`" in content, "Small reports should be unchanged"
+        assert os.listdir(pages_dir) == [], f"Stale pages should be removed: {os.listdir(pages_dir)}"
+
+        print("✅ test_oversized_report_is_aggregated_with_overflow_pages passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_summary_sidecar():
+    """Test that the counts are written to summary.json and a failed run removes it."""
+    tmpdir = setup_test_env()
+    try:
+        write_json(tmpdir, {"results": [
+            semgrep_finding("exec", "app.py", 1, "exec(cmd)"),
+            semgrep_finding("eval", "app.py", 2, "eval(x)", "WARNING"),
+        ], "errors": [{"message": "timeout"}]})
+        summary_path = os.path.join(".sast-reports", "summary.json")
+
+        result = run_script(tmpdir)
+        assert result.returncode == 0, f"Blocking findings should not fail the run. stderr: {result.stderr}"
+        with open(summary_path) as f:
+            summary = json.load(f)
+        assert summary["scanner"] == "sast" and summary["report"] == "sast-report.md", summary
+        assert summary["blocking"] == 1, summary
+        assert summary["counts"] == {"total": 2, "errors": 1, "warnings": 1, "scan_errors": 1}, summary
+
+        # Once the error finding is accepted into the baseline, nothing blocks.
+        assert run_script(tmpdir, "--update-baseline").returncode == 0
+        result = run_script(tmpdir, "--baseline")
+        assert result.returncode == 0, result.stderr
+        with open(summary_path) as f:
+            summary = json.load(f)
+        assert summary["blocking"] == 0 and summary["counts"]["existing"] == 2, summary
+
+        os.remove(".sast-reports/sast-report.json")
+        assert run_script(tmpdir).returncode == 1, "A missing report should still fail"
+        assert not os.path.exists(summary_path), "A failed run should not leave the previous summary"
+
+        print("✅ test_summary_sidecar passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
 if __name__ == "__main__":
     print("\n🧪 Running SAST script tests...\n")
 
@@ -186,6 +397,11 @@ if __name__ == "__main__":
         test_identifies_error_findings()
         test_report_includes_guidelines()
         test_scan_errors_shown_in_report()
+        test_stream_reader_handles_chunk_boundaries()
+        test_streamed_report_matches_in_memory_report()
+        test_baseline_splits_new_existing_and_fixed_findings()
+        test_oversized_report_is_aggregated_with_overflow_pages()
+        test_summary_sidecar()
 
         print("\n✅ All tests passed!\n")
         sys.exit(0)
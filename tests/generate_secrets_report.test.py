@@ -30,9 +30,9 @@ SCRIPT_PATH = os.path.join(
 )
 
 
-def run_script(cwd):
+def run_script(cwd, *args):
     return subprocess.run(
-        ["python3", SCRIPT_PATH],
+        ["python3", SCRIPT_PATH, *args],
         capture_output=True,
         text=True,
         cwd=cwd,
@@ -170,6 +170,30 @@ def test_report_includes_guidelines():
         teardown_test_env(tmpdir)
 
 
+def test_summary_sidecar():
+    """Test that the counts are written to summary.json and a failed run removes it."""
+    tmpdir = setup_test_env()
+    try:
+        write_json(tmpdir, [{"RuleID": "aws-access-key", "File": "config.js", "StartLine": 1}])
+        summary_path = os.path.join(tmpdir, ".secrets-reports", "summary.json")
+
+        result = run_script(tmpdir)
+        assert result.returncode == 0, f"Blocking findings should not fail the run. stderr: {result.stderr}"
+        with open(summary_path) as f:
+            summary = json.load(f)
+        assert summary["scanner"] == "secrets" and summary["report"] == "secrets-report.md", summary
+        assert summary["blocking"] == 1, summary
+        assert summary["counts"] == {"total": 1}, summary
+
+        os.remove(os.path.join(tmpdir, ".secrets-reports", "secrets-report.json"))
+        assert run_script(tmpdir).returncode == 1, "A missing report should still fail"
+        assert not os.path.exists(summary_path), "A failed run should not leave the previous summary"
+
+        print("✅ test_summary_sidecar passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
 if __name__ == "__main__":
     print("\n🧪 Running secrets detection script tests...\n")
 
@@ -179,6 +203,7 @@ if __name__ == "__main__":
         test_generates_report_with_empty_list()
         test_identifies_secrets()
         test_report_includes_guidelines()
+        test_summary_sidecar()
 
         print("\n✅ All tests passed!\n")
         sys.exit(0)
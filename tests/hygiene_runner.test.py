@@ -0,0 +1,210 @@
+"""Tests for the single-process hygiene runner."""
+
+import importlib.util
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".scripts")
+sys.path.insert(0, SCRIPTS_DIR)
+
+from docs_corpus import DocsCorpus  # noqa: E402
+
+
+def load_runner():
+    spec = importlib.util.spec_from_file_location("hygiene", os.path.join(SCRIPTS_DIR, "hygiene.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def setup_test_env():
+    """Create a temporary project with a small, valid docs tree."""
+    tmpdir = tempfile.mkdtemp()
+    os.chdir(tmpdir)
+    write("Taskfile.yml", "version: '3'\ntasks:\n  hygiene:size:\n    cmds: [echo]\n")
+    write("docs/index.md", "# Index\n\n| [guide/](guide/) | Guides |\n")
+    write("docs/README.md", "# Docs\n\nSee [the guide](guide/README.md).\n")
+    write("docs/guide/README.md", "# Guide\n\nRun task hygiene:size.\n")
+    return tmpdir
+
+
+def teardown_test_env(tmpdir):
+    """Clean up temporary test directory."""
+    DocsCorpus.reset_shared()
+    os.chdir("/")
+    shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def write(rel_path, content):
+    if os.path.dirname(rel_path):
+        os.makedirs(os.path.dirname(rel_path), exist_ok=True)
+    with open(rel_path, "w") as f:
+        f.write(content)
+
+
+def run_quietly(runner, argv):
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        status = runner.main(argv)
+    return status, out.getvalue(), err.getvalue()
+
+
+def test_every_script_is_registered():
+    """Test that each check and generator script has a plugin."""
+    runner = load_runner()
+    scripts = {p.name for p in Path(SCRIPTS_DIR).glob("*.py") if p.name.startswith(("check-", "generate-"))}
+    registered = {plugin.script for plugin in runner.PLUGINS.values()}
+    assert scripts == registered, f"Unregistered scripts: {scripts - registered}"
+    assert all(member in runner.PLUGINS for members in runner.GROUPS.values() for member in members), \
+        "Groups should only name registered plugins"
+
+    print("✅ test_every_script_is_registered passed")
+
+
+def test_docs_group_runs_in_one_process_and_writes_every_report():
+    """Test that the docs group writes every report from one shared docs walk."""
+    tmpdir = setup_test_env()
+    runner = load_runner()
+    scanned = []
+    original_scandir = os.scandir
+
+    def counting_scandir(path="."):
+        scanned.append(os.path.normpath(os.fspath(path)))
+        return original_scandir(path)
+
+    os.scandir = counting_scandir
+    try:
+        status, out, _ = run_quietly(runner, ["docs", "--with", "docs-accuracy=--no-cache"])
+        reports = sorted(p.name for p in Path(".docs-reports").glob("docs-*-report.*"))
+    finally:
+        os.scandir = original_scandir
+        teardown_test_env(tmpdir)
+
+    assert status == 0, f"Clean docs should pass: {out}"
+    for name in ("size", "structure", "accuracy"):
+        assert f"docs-{name}-report.json" in reports and f"docs-{name}-report.md" in reports, \
+            f"Missing {name} reports: {reports}"
+    docs_scans = [p for p in scanned if p == "docs"]
+    assert docs_scans == ["docs"], f"docs/ should be walked once for every plugin: {docs_scans}"
+    assert out.index("▶️  docs-words") < out.index("▶️  docs-accuracy-report"), "Plugins should run in order"
+
+    print("✅ test_docs_group_runs_in_one_process_and_writes_every_report passed")
+
+
+def test_only_gates_fail_the_run():
+    """Test that advisory check failures are reported while gate failures fail the run."""
+    tmpdir = setup_test_env()
+    runner = load_runner()
+    try:
+        write("docs/stray.md", "See [gone](gone.md).\n")
+        status, out, _ = run_quietly(runner, ["docs-structure", "docs-accuracy", "--with", "docs-accuracy=--no-cache"])
+        assert status == 0, "Structure and accuracy findings are advisory"
+        assert "⚠️  docs-structure" in out and "⚠️  docs-accuracy" in out, f"Findings should be flagged: {out}"
+
+        DocsCorpus.reset_shared()
+        write("docs/guide/README.md", "word " * 2600)
+        status, out, _ = run_quietly(runner, ["docs-words"])
+        assert status == 1 and "❌ docs-words" in out, f"The word limit is a gate: {out}"
+
+        status, out, err = run_quietly(runner, ["sast-report"])
+        assert status == 1 and "SAST JSON report not found" in err, "A failing generator should fail the run"
+    finally:
+        teardown_test_env(tmpdir)
+
+    print("✅ test_only_gates_fail_the_run passed")
+
+
+def test_plugins_import_only_their_own_modules():
+    """Test that a plugin loads its own script lazily and nothing from unrelated plugins."""
+    probe = (
+        "import json, sys; sys.path.insert(0, sys.argv[1]); import hygiene; "
+        "hygiene.main(['--import-only', sys.argv[2]]); print(json.dumps(sorted(sys.modules)))"
+    )
+
+    def modules_for(name):
+        result = subprocess.run([sys.executable, "-c", probe, SCRIPTS_DIR, name], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        return set(json.loads(result.stdout.splitlines()[-1]))
+
+    sast = modules_for("sast-report")
+    assert "generate_sast_md" in sast, "The plugin's own script should be loaded"
+    assert not {m for m in sast if m.startswith(("docs_", "check_docs_", "token_estimate"))}, \
+        f"sast-report should not import the docs code: {sorted(sast)}"
+    structure = modules_for("docs-structure")
+    assert not {m for m in structure if m.startswith("generate_")}, "Docs checks should not import generators"
+    assert not {"concurrent.futures", "subprocess", "sqlite3"} & structure, \
+        "Slow imports should wait until a code path needs them"
+
+    print("✅ test_plugins_import_only_their_own_modules passed")
+
+
+def test_parallel_docs_accuracy_runs_under_spawn():
+    """Test that --jobs workers started with the spawn method can import what they run."""
+    probe = (
+        "import multiprocessing, sys; multiprocessing.set_start_method('spawn'); "
+        "sys.path.insert(0, sys.argv[1]); import hygiene; sys.exit(hygiene.main(sys.argv[2:]))"
+    )
+    tmpdir = setup_test_env()
+    try:
+        write("docs/guide/more.md", "See [missing](nowhere.md) and [the guide](README.md#guide).\n")
+
+        def accuracy_issues(args):
+            result = subprocess.run(
+                [sys.executable, "-c", probe, SCRIPTS_DIR, "docs-accuracy", "--with", f"docs-accuracy={args}"],
+                capture_output=True, text=True,
+            )
+            assert "Error in docs-accuracy" not in result.stderr, result.stderr
+            with open(".docs-reports/docs-accuracy-report.json") as f:
+                return json.load(f)["issues"]
+
+        parallel = accuracy_issues("--jobs 2 --no-cache")
+        assert parallel == accuracy_issues("--no-cache"), "Parallel and serial runs should report the same"
+        assert [i["type"] for i in parallel] == ["broken_link"], parallel
+    finally:
+        teardown_test_env(tmpdir)
+
+    print("✅ test_parallel_docs_accuracy_runs_under_spawn passed")
+
+
+def test_rejects_unknown_plugins():
+    """Test that unknown plugins and malformed --with values are usage errors."""
+    runner = load_runner()
+    for argv in (["nope"], ["docs", "--with", "docs-accuracy"], ["docs", "--with", "nope=--x"]):
+        try:
+            run_quietly(runner, argv)
+        except SystemExit as e:
+            assert e.code == 2, f"{argv} should be a usage error"
+        else:
+            raise AssertionError(f"{argv} should have been rejected")
+
+    print("✅ test_rejects_unknown_plugins passed")
+
+
+if __name__ == "__main__":
+    print("\n🧪 Running hygiene runner tests...\n")
+
+    try:
+        test_every_script_is_registered()
+        test_docs_group_runs_in_one_process_and_writes_every_report()
+        test_only_gates_fail_the_run()
+        test_plugins_import_only_their_own_modules()
+        test_parallel_docs_accuracy_runs_under_spawn()
+        test_rejects_unknown_plugins()
+
+        print("\n✅ All tests passed!\n")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}\n")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Unexpected error: {e}\n")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
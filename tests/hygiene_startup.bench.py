@@ -0,0 +1,161 @@
+"""Benchmark the startup cost of every hygiene runner plugin.
+
+These scripts run in pre-commit hooks, where interpreter startup and
+imports are most of the cost. For each plugin registered in
+.scripts/hygiene.py this starts a fresh interpreter that only imports
+what the plugin needs (``hygiene.py --import-only NAME``) and measures:
+
+- wall time, best of several runs
+- import time reported by ``python3 -X importtime``
+
+both as a ratio to a bare ``python3 -c pass`` measured in the same run,
+so results carry over between machines and a slow or loaded one scales
+the plugin and the bare interpreter alike. It also checks that plugins
+stay isolated: a docs plugin never imports the security and complexity
+generators and they never import the docs modules.
+
+Ratios are compared with tests/hygiene_startup.baseline.json; the run
+fails when a plugin's ratio exceeds its baseline by more than TOLERANCE.
+Pass --update to record a new baseline after an intentional change.
+
+Usage:
+    python3 tests/hygiene_startup.bench.py
+    python3 tests/hygiene_startup.bench.py --update
+"""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = ROOT / ".scripts"
+RUNNER = SCRIPTS_DIR / "hygiene.py"
+BASELINE_PATH = Path(__file__).resolve().parent / "hygiene_startup.baseline.json"
+
+RUNS = 7
+TOLERANCE = 1.5
+
+DOCS_MODULES = ("docs_", "check_docs_", "generate_docs_", "taskfile_index", "path_index", "token_estimate")
+OTHER_MODULES = ("generate_sast_", "generate_secrets_", "generate_dast_", "generate_dependencies_",
+                 "generate_complexity_")
+
+_PROBE = """
+import importlib.util, json, os, sys
+sys.path.insert(0, os.path.dirname(sys.argv[1]))
+spec = importlib.util.spec_from_file_location("hygiene", sys.argv[1])
+runner = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(runner)
+runner.main(["--import-only", sys.argv[2]])
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def load_runner():
+    spec = importlib.util.spec_from_file_location("hygiene", RUNNER)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def best_wall_ms(argv):
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(argv, check=True, capture_output=True, cwd=ROOT)
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def import_ms(argv):
+    """Total top-level cumulative import time, in ms, from ``-X importtime``."""
+    totals = []
+    for _ in range(RUNS):
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", *argv], check=True, capture_output=True, text=True, cwd=ROOT,
+        ).stderr
+        total = 0
+        for line in stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line.split("|")
+            if not name.startswith("  "):
+                total += int(cumulative)
+        totals.append(total / 1000)
+    return min(totals)
+
+
+def imported_modules(name):
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE, str(RUNNER), name], check=True, capture_output=True, text=True, cwd=ROOT,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def isolation_errors(name, modules):
+    forbidden = OTHER_MODULES if name.startswith("docs-") else DOCS_MODULES
+    leaked = [m for m in modules if m.startswith(forbidden)]
+    return [f"{name} imports {', '.join(leaked)}"] if leaked else []
+
+
+def measure(names):
+    bare = {"wall": best_wall_ms([sys.executable, "-c", "pass"]), "imports": import_ms(["-c", "pass"])}
+    results = {}
+    for name in names:
+        argv = [str(RUNNER), "--import-only", name]
+        results[name] = {
+            "wall": round(best_wall_ms([sys.executable, *argv]) / bare["wall"], 2),
+            "imports": round(import_ms(argv) / bare["imports"], 2),
+        }
+    return bare, results
+
+
+def regressions(results, baseline):
+    found = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        for key in ("wall", "imports"):
+            limit = expected[key] * TOLERANCE
+            if result[key] > limit:
+                found.append(f"{name}: {key} {result[key]:.2f}x exceeds {limit:.2f}x "
+                             f"(baseline {expected[key]:.2f}x)")
+    return found
+
+
+def main():
+    update = "--update" in sys.argv[1:]
+    names = list(load_runner().PLUGINS)
+
+    print("\n⏱️  Hygiene plugin startup (times a bare interpreter)\n")
+    bare, results = measure(names)
+    print(f"  bare python3 -c pass: {bare['wall']:.1f} ms wall, {bare['imports']:.1f} ms imports\n")
+    print(f"  {'plugin':<24}{'wall':>10}{'imports':>10}")
+    for name, result in results.items():
+        print(f"  {name:<24}{result['wall']:>9.2f}x{result['imports']:>9.2f}x")
+    print()
+
+    errors = [e for name in names for e in isolation_errors(name, imported_modules(name))]
+
+    if update:
+        BASELINE_PATH.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"📝 Baseline written to {os.path.relpath(BASELINE_PATH, ROOT)}")
+    elif BASELINE_PATH.exists():
+        errors += regressions(results, json.loads(BASELINE_PATH.read_text()))
+    else:
+        print("ℹ️  No baseline yet — run with --update to record one")
+
+    if errors:
+        print("❌ Startup regressions:")
+        for error in errors:
+            print(f"  - {error}")
+        sys.exit(1)
+    print("✅ Plugin startup within baseline and isolated")
+
+
+if __name__ == "__main__":
+    main()
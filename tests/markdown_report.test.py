@@ -0,0 +1,129 @@
+"""Tests for the streaming Markdown writer shared by the report generators."""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".scripts")
+sys.path.insert(0, SCRIPTS_DIR)
+
+from markdown_report import MarkdownReport, PagedTables, cell, table_row  # noqa: E402
+
+
+def setup_test_env():
+    """Create a temporary directory for test files."""
+    tmpdir = tempfile.mkdtemp()
+    os.chdir(tmpdir)
+    return tmpdir
+
+
+def teardown_test_env(tmpdir):
+    """Clean up temporary test directory."""
+    os.chdir("/")
+    shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def test_cells_are_escaped_and_truncated():
+    """Test that cells stay on one line, cannot split the row and respect the limit."""
+    assert cell("a | b\nc\r\nd ") == "a \\| b c d", "Pipes should be escaped and line breaks flattened"
+    assert cell("x" * 81, 80) == "x" * 77 + "...", "Long text should be cut to the limit"
+    assert cell("x" * 80, 80) == "x" * 80, "Text at the limit should be kept"
+    assert cell(12) == "12", "Non-text values should be converted"
+    assert table_row("a", 1, "`b`") == "| a | 1 | `b` |"
+
+    print("✅ test_cells_are_escaped_and_truncated passed")
+
+
+def test_tables_stream_rows_from_any_iterable():
+    """Test that tables write header, separator and rows as they are produced."""
+    out = io.StringIO()
+    report = MarkdownReport(out)
+    report.heading("Findings")
+    count = report.table(["Rule", "Count"], (table_row(f"r{i}", i) for i in range(3)))
+
+    assert count == 3, f"Expected 3 rows, got {count}"
+    assert out.getvalue() == (
+        "## Findings\n\n"
+        "| Rule | Count |\n"
+        "|------|-------|\n"
+        "| r0 | 0 |\n| r1 | 1 |\n| r2 | 2 |\n\n"
+    ), out.getvalue()
+
+    print("✅ test_tables_stream_rows_from_any_iterable passed")
+
+
+def test_failed_report_leaves_no_file():
+    """Test that a report is only published once it was written completely."""
+    tmpdir = setup_test_env()
+    try:
+        with MarkdownReport.create("report.md") as report:
+            report.title("Report")
+        with open("report.md") as f:
+            assert f.read().startswith("# Report\n\n**Generated**: "), "Report should be written"
+
+        try:
+            with MarkdownReport.create("report.md") as report:
+                report.title("Broken")
+                raise ValueError("boom")
+        except ValueError:
+            pass
+        with open("report.md") as f:
+            assert "Broken" not in f.read(), "A failed run should not replace the previous report"
+        assert os.listdir(".") == ["report.md"], f"Temporary files should be removed: {os.listdir('.')}"
+    finally:
+        teardown_test_env(tmpdir)
+
+    print("✅ test_failed_report_leaves_no_file passed")
+
+
+def test_paged_tables_split_rows_across_pages():
+    """Test that long tables continue on new pages under the size limit and are indexed."""
+    tmpdir = setup_test_env()
+    try:
+        pages = PagedTables("pages", "Findings", 200)
+        pages.table("Errors", ["Rule"], (table_row(f"error-{i:02d}") for i in range(12)))
+        pages.table("Warnings", ["Rule"], [table_row("warning")])
+        index = pages.close()
+
+        names = sorted(os.listdir("pages"))
+        assert names[0] == "index.md" and len(names) > 2, f"Rows should span several pages: {names}"
+        text = ""
+        for name in names[1:]:
+            with open(os.path.join("pages", name)) as f:
+                page = f.read()
+            assert len(page.encode("utf-8")) <= 200, f"{name} is over the limit"
+            assert page.count("| Rule |") == page.count("## "), "Each table part should repeat its header"
+            text += page
+        assert all(f"| error-{i:02d} |" in text for i in range(12)) and "| warning |" in text
+        with open(index) as f:
+            assert "| [page-0001.md](page-0001.md) | Errors | 1–" in f.read(), "Index should list row ranges"
+
+        PagedTables("pages", "Findings", 200).close()
+        assert os.listdir("pages") == ["index.md"], "Pages from an earlier run should be removed"
+    finally:
+        teardown_test_env(tmpdir)
+
+    print("✅ test_paged_tables_split_rows_across_pages passed")
+
+
+if __name__ == "__main__":
+    print("\n🧪 Running Markdown report writer tests...\n")
+
+    try:
+        test_cells_are_escaped_and_truncated()
+        test_tables_stream_rows_from_any_iterable()
+        test_failed_report_leaves_no_file()
+        test_paged_tables_split_rows_across_pages()
+
+        print("\n✅ All tests passed!\n")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}\n")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Unexpected error: {e}\n")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
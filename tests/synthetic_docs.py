@@ -0,0 +1,174 @@
+"""Deterministic synthetic docs corpus for scaling the docs hygiene checks.
+
+Builds a fake project: a ``docs/`` tree governed by ``docs/index.md``,
+a ``Taskfile.yml`` and ``.github/workflows/``, with knobs for the
+number of files, their size, links per file, the share of broken links
+and task references, task references per file and directory nesting
+depth. The same spec and seed always produce byte-identical output, so
+benchmark runs on different commits measure the same input.
+
+Every reference is planned up front, so the returned summary says
+exactly how many broken links and task references the accuracy checker
+should report.
+
+Usage:
+    python3 tests/synthetic_docs.py OUT_DIR --files 1000 [--file-size 2048] ...
+"""
+
+import argparse
+import json
+import os
+import random
+
+WORDS = (
+    "the docs guide page section explains how to run build deploy test review "
+    "configure release monitor update check report owner team service local"
+).split()
+FILES_PER_DIR = 50
+
+
+class CorpusSpec:
+    """Shape of a synthetic corpus; every field has a command-line flag."""
+
+    FIELDS = {
+        "files": (100, "number of markdown files under the categories"),
+        "file_size": (2048, "approximate size of each file in bytes"),
+        "links": (4, "markdown links per file"),
+        "broken_ratio": (0.05, "share of links and task references that are broken"),
+        "task_refs": (2, "task references per file"),
+        "depth": (2, "directory nesting depth below each category"),
+        "categories": (8, "top-level categories listed in docs/index.md"),
+        "tasks": (50, "tasks defined in Taskfile.yml"),
+        "workflows": (5, "workflow files under .github/workflows/"),
+        "seed": (0, "random seed"),
+    }
+
+    def __init__(self, **values):
+        for name, (default, _) in self.FIELDS.items():
+            setattr(self, name, type(default)(values.pop(name, default)))
+        if values:
+            raise TypeError(f"unknown corpus settings: {', '.join(values)}")
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+
+def category_name(index):
+    """Return ``area_a``, ``area_b``, … ``area_ba``: names the structure check accepts."""
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord("a") + rem) + letters
+    return f"area_{letters}"
+
+
+def file_path(spec, index):
+    category = category_name(index % spec.categories)
+    position = index // spec.categories
+    parts = [f"s{(position // FILES_PER_DIR // 10 ** level) % 10}" for level in range(spec.depth)]
+    return "/".join(["docs", category, *parts, f"page_{index}.md"])
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(content)
+
+
+def _sentence(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 16))).capitalize() + "."
+
+
+def _references(spec, rng, index, paths, summary):
+    """Plan this file's links, task references and workflow reference."""
+    source_dir = os.path.dirname(paths[index])
+    refs = []
+    for n in range(spec.links):
+        if rng.random() < spec.broken_ratio:
+            refs.append(f"See [missing {n}](missing/page_{index}_{n}.md).")
+            summary["broken_links"] += 1
+            continue
+        target = rng.randrange(len(paths))
+        anchor = "#section-1" if rng.random() < 0.3 else ""
+        rel = os.path.relpath(paths[target], source_dir)
+        refs.append(f"See [page {target}]({rel}{anchor}).")
+        summary["links"] += 1
+    for _ in range(spec.task_refs):
+        if rng.random() < spec.broken_ratio:
+            refs.append(f"Then run task bench:gone-{rng.randrange(spec.tasks)} locally.")
+            summary["stale_tasks"] += 1
+        else:
+            refs.append(f"Then run task bench:task-{rng.randrange(spec.tasks)} locally.")
+            summary["task_refs"] += 1
+    if spec.workflows:
+        refs.append(f"Configured in .github/workflows/bench-{rng.randrange(spec.workflows)}.yml.")
+    rng.shuffle(refs)
+    return refs
+
+
+def _page(spec, rng, index, paths, summary):
+    refs = _references(spec, rng, index, paths, summary)
+    sections = max(1, spec.file_size // 1024)
+    lines = [f"# Page {index}", ""]
+    size = sum(len(line) + 1 for line in lines)
+    section = 0
+    while section < sections or refs or size < spec.file_size:
+        if section < sections and (size >= spec.file_size * section / sections):
+            section += 1
+            lines += [f"## Section {section}", ""]
+        paragraph = _sentence(rng)
+        if refs:
+            paragraph += " " + refs.pop()
+        lines += [paragraph, ""]
+        size += sum(len(line) + 1 for line in lines[-2:])
+    return "\n".join(lines)
+
+
+def generate(root, spec):
+    """Write the corpus described by *spec* under *root*; return what was planned."""
+    rng = random.Random(spec.seed)
+    summary = {"files": 0, "bytes": 0, "links": 0, "broken_links": 0, "task_refs": 0, "stale_tasks": 0}
+    paths = [file_path(spec, i) for i in range(spec.files)]
+
+    tasks = "".join(f"  bench:task-{i}:\n    cmds:\n      - echo {i}\n" for i in range(spec.tasks))
+    _write(os.path.join(root, "Taskfile.yml"), f"version: '3'\n\ntasks:\n{tasks}")
+    for i in range(spec.workflows):
+        _write(os.path.join(root, ".github", "workflows", f"bench-{i}.yml"), f"name: Bench {i}\n")
+
+    rows = "".join(
+        f"| [{name}/]({name}/) | Synthetic area {i} |\n"
+        for i, name in enumerate(category_name(c) for c in range(spec.categories))
+    )
+    _write(os.path.join(root, "docs", "index.md"), f"# Index\n\n| Category | Purpose |\n|---|---|\n{rows}")
+    _write(os.path.join(root, "docs", "README.md"), "# Docs\n\nSee [the index](index.md).\n")
+    for c in range(spec.categories):
+        name = category_name(c)
+        _write(os.path.join(root, "docs", name, "README.md"), f"# {name}\n\nBack to [the index](../index.md).\n")
+
+    for index, path in enumerate(paths):
+        content = _page(spec, rng, index, paths, summary)
+        _write(os.path.join(root, path), content)
+        summary["files"] += 1
+        summary["bytes"] += len(content.encode("utf-8"))
+    return summary
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic docs corpus")
+    parser.add_argument("out_dir", help="directory to create the fake project in")
+    for name, (default, help_text) in CorpusSpec.FIELDS.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(default), default=default,
+                            help=f"{help_text} (default: {default})")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    spec = CorpusSpec(**{name: getattr(args, name) for name in CorpusSpec.FIELDS})
+    summary = generate(args.out_dir, spec)
+    print(json.dumps({"spec": spec.to_dict(), "summary": summary}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Tests for the synthetic docs corpus used by the scaling benchmark."""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(TESTS_DIR, "..", ".scripts")
+sys.path.insert(0, TESTS_DIR)
+
+from synthetic_docs import CorpusSpec, generate  # noqa: E402
+
+
+def tree_digest(root):
+    digest = hashlib.sha256()
+    for path in sorted(Path(root).rglob("*")):
+        if path.is_file():
+            digest.update(str(path.relative_to(root)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def run_script(script, cwd, *args):
+    return subprocess.run(
+        [sys.executable, os.path.join(SCRIPTS_DIR, script), *args], cwd=cwd, capture_output=True, text=True,
+    )
+
+
+def test_same_spec_generates_identical_trees():
+    """Test that a spec and seed always produce the same bytes, and a new seed does not."""
+    dirs = [tempfile.mkdtemp() for _ in range(3)]
+    try:
+        spec = CorpusSpec(files=60, depth=3, categories=3)
+        first = generate(dirs[0], spec)
+        second = generate(dirs[1], spec)
+        generate(dirs[2], CorpusSpec(files=60, depth=3, categories=3, seed=1))
+        assert first == second, "Summaries should match"
+        assert tree_digest(dirs[0]) == tree_digest(dirs[1]), "Trees should be byte-identical"
+        assert tree_digest(dirs[0]) != tree_digest(dirs[2]), "Another seed should give another tree"
+        pages = list(Path(dirs[0], "docs").rglob("page_*.md"))
+        assert len(pages) == 60, f"Expected 60 pages, got {len(pages)}"
+        assert all(len(p.relative_to(dirs[0]).parts) == 6 for p in pages), "Pages should nest 3 levels deep"
+    finally:
+        for d in dirs:
+            shutil.rmtree(d, ignore_errors=True)
+
+    print("✅ test_same_spec_generates_identical_trees passed")
+
+
+def test_checkers_find_exactly_the_planned_problems():
+    """Test that the accuracy check reports the planned broken links and the structure is valid."""
+    tmpdir = tempfile.mkdtemp()
+    try:
+        summary = generate(tmpdir, CorpusSpec(files=120, broken_ratio=0.2))
+        accuracy = run_script("check-docs-accuracy.py", tmpdir, "--no-cache")
+        structure = run_script("check-docs-structure.py", tmpdir)
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    assert summary["broken_links"] > 0 and summary["stale_tasks"] > 0, f"Ratio should plant problems: {summary}"
+    assert accuracy.stdout.count("Broken link") == summary["broken_links"], accuracy.stdout[-500:]
+    assert accuracy.stdout.count("Task reference") == summary["stale_tasks"], accuracy.stdout[-500:]
+    expected = summary["broken_links"] + summary["stale_tasks"]
+    assert f"Found {expected} accuracy issue(s)" in accuracy.stdout, "Valid links and anchors should pass"
+    assert structure.returncode == 0, f"Generated structure should be valid: {structure.stdout}"
+
+    print("✅ test_checkers_find_exactly_the_planned_problems passed")
+
+
+if __name__ == "__main__":
+    print("\n🧪 Running synthetic docs corpus tests...\n")
+
+    try:
+        test_same_spec_generates_identical_trees()
+        test_checkers_find_exactly_the_planned_problems()
+
+        print("\n✅ All tests passed!\n")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}\n")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Unexpected error: {e}\n")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,164 @@
+"""Tests for the shared Taskfile task index."""
+
+import os
+import re
+import shutil
+import sys
+import tempfile
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".scripts")
+REPO_TASKFILE = os.path.join(SCRIPTS_DIR, "..", "Taskfile.yml")
+sys.path.insert(0, SCRIPTS_DIR)
+
+import taskfile_index  # noqa: E402
+from taskfile_index import TaskfileIndex, load_task_index  # noqa: E402
+
+
+def setup_test_env():
+    """Create a temporary project with a Taskfile tree using includes and aliases."""
+    tmpdir = tempfile.mkdtemp()
+    os.chdir(tmpdir)
+    write(
+        "Taskfile.yml",
+        "version: '3'\n"
+        "\n"
+        "includes:\n"
+        "  docs: ./docs          # directory include\n"
+        "  lib:\n"
+        "    taskfile: ./lib/Tasks.yml\n"
+        "    aliases: [l]\n"
+        "    internal: true\n"
+        "  flat: {taskfile: ./flat.yml, flatten: true}\n"
+        "  opt:\n"
+        "    taskfile: ./optional.yml\n"
+        "    optional: true\n"
+        "\n"
+        "tasks:\n"
+        "    build:\n"
+        "      aliases:\n"
+        "        - b\n"
+        "      cmds:\n"
+        "        - |\n"
+        "          tasks:\n"
+        "            fake: nope\n"
+        "    'quoted:name':\n"
+        "      cmds: [echo hi]\n"
+        "    short: echo shorthand\n",
+    )
+    write("docs/Taskfile.yml", "version: '3'\ntasks:\n  default:\n    cmds: [echo]\n  serve:\n    aliases: [s]\n")
+    write("lib/Tasks.yml", "version: '3'\ntasks:\n  deep: {aliases: [d], cmds: [echo]}\n")
+    write("flat.yml", "version: '3'\ntasks:\n  flattened:\n    cmds: [echo]\n")
+    return tmpdir
+
+
+def teardown_test_env(tmpdir):
+    """Clean up temporary test directory."""
+    os.chdir("/")
+    shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def write(rel_path, content):
+    if os.path.dirname(rel_path):
+        os.makedirs(os.path.dirname(rel_path), exist_ok=True)
+    with open(rel_path, "w") as f:
+        f.write(content)
+
+
+def count_builds():
+    """Wrap TaskfileIndex.build to count how often the Taskfiles are parsed."""
+    calls = []
+    original = TaskfileIndex.build.__func__
+
+    def counting(cls, *args, **kwargs):
+        calls.append(args)
+        return original(cls, *args, **kwargs)
+
+    TaskfileIndex.build = classmethod(counting)
+    return calls, lambda: setattr(TaskfileIndex, "build", classmethod(original))
+
+
+def test_follows_includes_aliases_and_namespaces():
+    """Test that included, aliased, flattened and quoted tasks are all indexed."""
+    tmpdir = setup_test_env()
+    try:
+        index = TaskfileIndex.build()
+
+        assert set(index.tasks) == {
+            "build", "quoted:name", "short", "docs:default", "docs:serve", "lib:deep", "flattened",
+        }, f"Unexpected tasks: {sorted(index.tasks)}"
+        assert "fake" not in index.names(), "Block scalar contents must not be parsed as tasks"
+        assert index.resolve("b") == "build", "Task aliases should resolve"
+        assert index.resolve("docs:s") == "docs:serve", "Aliases inside includes are namespaced"
+        assert index.resolve("l:d") == "lib:deep", "Namespace and task aliases should combine"
+        assert index.resolve("docs") == "docs:default", "A namespace alone runs its default task"
+        assert index.namespaces["docs"] == "docs/Taskfile.yml", "Directory includes find their Taskfile"
+        assert index.internal == {"lib:deep"}, "internal: true on an include applies to its tasks"
+        assert index.sources["optional.yml"] is None, "Missing optional includes are still recorded"
+
+        print("✅ test_follows_includes_aliases_and_namespaces passed")
+    finally:
+        teardown_test_env(tmpdir)
+
+
+def test_matches_legacy_scan_on_repo_taskfile():
+    """Test that the index finds every task the old two-space regex found."""
+    with open(REPO_TASKFILE) as f:
+        legacy = {m.group(1) for m in re.finditer(r"^  ([a-z][a-z0-9:_-]+):", f.read(), re.MULTILINE)}
+
+    index = TaskfileIndex.build(REPO_TASKFILE)
+
+    assert legacy <= index.names(), f"Missing tasks: {sorted(legacy - index.names())}"
+
+    print("✅ test_matches_legacy_scan_on_repo_taskfile passed")
+
+
+def test_cache_reused_until_a_taskfile_changes():
+    """Test that the disk cache skips parsing until any Taskfile in the tree changes."""
+    tmpdir = setup_test_env()
+    calls, restore = count_builds()
+    try:
+        first = load_task_index()
+        assert os.path.exists(taskfile_index.CACHE_PATH), "Index should be cached on disk"
+        second = load_task_index()
+        assert len(calls) == 1, f"Warm load should not reparse, parsed {len(calls)} time(s)"
+        assert second.to_dict() == first.to_dict(), "Cached index should round-trip"
+
+        # Same content, new mtime: the hash still matches.
+        os.utime("lib/Tasks.yml", ns=(0, 0))
+        load_task_index()
+        assert len(calls) == 1, "Touching a Taskfile without changing it should not reparse"
+
+        write("lib/Tasks.yml", "version: '3'\ntasks:\n  deeper: {}\n")
+        changed = load_task_index()
+        assert len(calls) == 2, "Editing an included Taskfile should reparse"
+        assert "lib:deeper" in changed.tasks and "lib:deep" not in changed.tasks, "New tasks should be indexed"
+
+        write("optional.yml", "version: '3'\ntasks:\n  extra: {}\n")
+        appeared = load_task_index()
+        assert len(calls) == 3, "A missing optional include appearing should reparse"
+        assert "opt:extra" in appeared.tasks, "Newly present include should be indexed"
+
+        print("✅ test_cache_reused_until_a_taskfile_changes passed")
+    finally:
+        restore()
+        teardown_test_env(tmpdir)
+
+
+if __name__ == "__main__":
+    print("\n🧪 Running Taskfile index tests...\n")
+
+    try:
+        test_follows_includes_aliases_and_namespaces()
+        test_matches_legacy_scan_on_repo_taskfile()
+        test_cache_reused_until_a_taskfile_changes()
+
+        print("\n✅ All tests passed!\n")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}\n")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Unexpected error: {e}\n")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)